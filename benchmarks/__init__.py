@@ -0,0 +1,5 @@
+"""
+    Benchmarks for the logic and database layers. Run them from the project root, e.g.:
+
+        python -m benchmarks.bench_login_hydration
+"""
@@ -0,0 +1,91 @@
+"""
+Benchmark: JSON import of a large document.
+
+Writes a document with 50 projects x 100 tasks x 1 subtask by default and imports it
+into an empty account of an SQLite file database, once item by item (one INSERT per
+project, task and subtask, through the ItemFactory) and once in bulk (one batched
+INSERT per level). Both imports run in a single transaction.
+
+For each mode the script reports the wall-clock time and the statements sent to the
+database.
+
+Usage:
+    python -m benchmarks.bench_bulk_import [projects] [tasks_per_project]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import QueryCounter
+from src.db.unit_of_work import UnitOfWork
+from src.logic.load import Load
+from src.logic.orms.orm import Base, UserORM
+from src.logic.users.user import User
+
+
+def write_document(path: str, projects: int, tasks_per_project: int) -> None:
+    """ Write the JSON document to import. """
+    data = [{'project': f'Projeto {project}',
+             'end_date': '2024-01-01',
+             'description': None,
+             'tasks': [{'task': f'Tarefa {task}',
+                        'priority': 'Normal',
+                        'end_date': '2024-01-01',
+                        'notification_date': None,
+                        'description': None,
+                        'subtasks': [{'subtask': 'Subtarefa'}]}
+                       for task in range(tasks_per_project)]}
+            for project in range(projects)]
+    with open(path, 'w', encoding='utf8') as json_file:
+        json.dump(data, json_file)
+
+
+def run(mode: str, document: str) -> None:
+    """ Import the document into a new database and print time and statement count. """
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    engine = create_engine(f'sqlite:///{path}')
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        db_user = UserORM(name='Benchmark', email='bench@example.com', password='bench')
+        session.add(db_user)
+        session.commit()
+        id_user = db_user.id_user
+
+    unit_of_work = UnitOfWork(session_factory=session_factory)
+    user = User('Benchmark', id_user=id_user, unit_of_work=unit_of_work)
+    with QueryCounter(engine) as counter:
+        start = time.perf_counter()
+        Load.json_reader(user, document, bulk=(mode == 'bulk'))
+        elapsed = time.perf_counter() - start
+
+    unit_of_work.close()
+    engine.dispose()
+    os.remove(path)
+    tasks = sum(len(project.tasks) for project in user.projects)
+    print(f'{mode:>12}: {elapsed:7.3f} s  {counter.count:6d} statements  '
+          f'{len(user.projects)} projects / {tasks} tasks')
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    handle, document = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    write_document(document, projects, tasks_per_project)
+    try:
+        for mode in ('item-by-item', 'bulk'):
+            run(mode, document)
+    finally:
+        os.remove(document)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: memory kept by the domain objects.
+
+Builds a user with many projects, tasks and subtasks (10 x 1000 tasks, one subtask
+each, by default) and measures with tracemalloc the memory allocated for the tasks,
+then for the subtasks. The field values (names, dates, ...) are created before the
+measurement, so only what the items themselves keep is counted: the object, its
+attributes storage, its memento storage and its place in the parent's collection.
+
+The items are built with ids, as the hydration does, so no row is written; the
+database is an in-memory SQLite one.
+
+The numbers are printed next to BASELINE, measured with CPython 3.11 (64 bits) on the
+items as they were before they were slotted, and checked against BUDGET: the script
+exits with status 1 when an item costs more, so that a new field or container that
+undoes the savings is seen. Raise the budget only along with a change that is worth
+the memory.
+
+Usage:
+    python -m benchmarks.bench_item_memory [projects] [tasks_per_project]
+"""
+
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.unit_of_work import UnitOfWork
+from src.logic.items.project import Project
+from src.logic.items.subtask import Subtask
+from src.logic.items.task import Task
+from src.logic.users.user import User
+
+# Bytes per item, before __slots__ and the lazy memento stacks.
+BASELINE = {'task': 313.5, 'subtask': 264.0}
+# Bytes per item allowed now: the slotted items, plus their entries in the ordered
+# collections and in the identity map.
+BUDGET = {'task': 250.0, 'subtask': 220.0}
+
+
+def task_values(count: int) -> list:
+    """ Field values of the synthetic tasks, created ahead of the measurement. """
+    start = date(2023, 1, 1)
+    priorities = ['Baixa', 'Média', 'Alta']
+    return [{'name': f'Task {index}', 'id_task': index + 1, 'status': index % 3 == 0,
+             'priority': priorities[index % 3],
+             'creation_date': start + timedelta(days=index % 365),
+             'end_date': start + timedelta(days=index % 365 + 30),
+             'notification_date': start + timedelta(days=index % 365 + 20),
+             'description': f'Synthetic task {index}'}
+            for index in range(count)]
+
+
+def measure(build: callable) -> int:
+    """ Return the bytes still allocated after running `build`. """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del kept
+    return sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    count = projects * tasks_per_project
+
+    unit_of_work = UnitOfWork(session_factory=sessionmaker(bind=create_engine('sqlite://')))
+    user = User('Synthetic User', id_user=1, unit_of_work=unit_of_work)
+    parents = [Project(user=user, name=f'Project {index}', id_project=index + 1,
+                       creation_date=date(2023, 1, 1))
+               for index in range(projects)]
+    values = task_values(count)
+    subtask_names = [f'Subtask {index}' for index in range(count)]
+    tasks = []
+
+    def build_tasks() -> list:
+        for index, fields in enumerate(values):
+            tasks.append(Task(project=parents[index % projects], **fields))
+        return tasks
+
+    def build_subtasks() -> list:
+        return [Subtask(task=task, name=name, id_subtask=index + 1)
+                for index, (task, name) in enumerate(zip(tasks, subtask_names))]
+
+    per_item = {'task': measure(build_tasks) / count,
+                'subtask': measure(build_subtasks) / count}
+    over = []
+    for kind, size in per_item.items():
+        change = size / BASELINE[kind] - 1
+        print(f'{count} {kind + "s:":9} {size:7.1f} bytes per {kind} '
+              f'(baseline {BASELINE[kind]:.1f}, {change:+.0%}; budget {BUDGET[kind]:.1f})')
+        if size > BUDGET[kind]:
+            over.append(kind)
+    if over:
+        print(f'over budget: {", ".join(over)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
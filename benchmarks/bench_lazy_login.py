@@ -0,0 +1,64 @@
+"""
+Benchmark: eager and deferred loading of the tasks at login.
+
+Builds a synthetic user with 10k tasks (100 projects x 100 tasks, one subtask each) in
+an in-memory SQLite database and logs it in three ways:
+
+- eager: `hydrate_user` builds every task and subtask;
+- deferred: `hydrate_user(lazy=True)` only builds the labels and projects;
+- deferred + home: the same, then the tasks of the projects shown first by the home
+  page (`VISIBLE_PROJECTS`) are prefetched, as the project list does.
+
+For each mode the script reports the wall-clock time, the number of statements and the
+memory still allocated afterwards (tracemalloc).
+
+Usage:
+    python -m benchmarks.bench_lazy_login [projects] [tasks_per_project]
+"""
+
+import sys
+import time
+import tracemalloc
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row, QueryCounter
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user, prefetch_tasks
+
+# Same value as src.gui.homepage.VISIBLE_PROJECTS, without importing tkinter.
+VISIBLE_PROJECTS = 30
+
+
+def run(mode: str, engine: object) -> None:
+    """ Log the synthetic user in once and print time, query count and memory. """
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        db_user = synthetic_user_row(session)
+        with QueryCounter(engine) as counter:
+            tracemalloc.start()
+            start = time.perf_counter()
+            user = hydrate_user(db_user, session, UnitOfWork(session_factory=factory),
+                                lazy=mode != 'eager')
+            if mode == 'deferred + home':
+                prefetch_tasks(user.projects[:VISIBLE_PROJECTS])
+            elapsed = time.perf_counter() - start
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    loaded = sum(len(project.tasks) for project in user.projects
+                 if project.deferred_tasks is None)
+    print(f'{mode:>15}: {elapsed:8.3f} s  {counter.count:4d} queries  '
+          f'{memory / 1024 / 1024:7.2f} MiB  {loaded} tasks loaded')
+    user.unit_of_work.close()
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = create_synthetic_database(projects, tasks_per_project)
+    for mode in ('eager', 'deferred', 'deferred + home'):
+        run(mode, engine)
+
+
+if __name__ == '__main__':
+    main()
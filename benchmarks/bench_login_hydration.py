@@ -0,0 +1,52 @@
+"""
+Benchmark: login hydration of a large account.
+
+Builds a synthetic user with 10k tasks (100 projects x 100 tasks, one subtask each) in
+an in-memory SQLite database and compares the two ways `instance_user` can rebuild it:
+
+- lazy: walks `db_user.projects`, `db_project.tasks` and `db_task.subtasks`, i.e. one
+  query per project and one per task;
+- eager: `hydrate_user`, which loads the whole graph with four batched queries.
+
+For each mode the script reports the wall-clock time and the number of statements sent
+to the database.
+
+Usage:
+    python -m benchmarks.bench_login_hydration [projects] [tasks_per_project]
+"""
+
+import sys
+import time
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row, QueryCounter
+from src.logic.authentication.authentication import instance_user
+
+
+def run(mode: str, engine: object) -> None:
+    """ Hydrate the synthetic user once and print time and query count. """
+    with sessionmaker(bind=engine)() as session:
+        db_user = synthetic_user_row(session)
+        with QueryCounter(engine) as counter:
+            start = time.perf_counter()
+            if mode == 'eager':
+                user = instance_user(db_user, session)
+            else:
+                user = instance_user(db_user)
+            elapsed = time.perf_counter() - start
+    tasks = sum(len(project.tasks) for project in user.projects)
+    print(f'{mode:>5}: {elapsed:8.3f} s  {counter.count:6d} queries  '
+          f'{len(user.projects)} projects / {tasks} tasks')
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = create_synthetic_database(projects, tasks_per_project)
+    for mode in ('lazy', 'eager'):
+        run(mode, engine)
+
+
+if __name__ == '__main__':
+    main()
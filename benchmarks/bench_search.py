@@ -0,0 +1,80 @@
+"""
+Benchmark: trigram search against a scan of the names.
+
+Builds a synthetic user with 100k items by default (100 projects x 500 tasks, one
+subtask each) in an in-memory SQLite database and searches it in two ways:
+
+- scan: the former `filter_projects_by_similar_name`, extended to tasks and subtasks:
+  `text in name` on every item, case-sensitive and without descriptions;
+- index: `user.views.search_index.search`, case- and accent-insensitive, over names and
+  descriptions, ranked, with fuzzy matches.
+
+The script reports the time to build the index, then for each query the number of
+results and the median time of several runs.
+
+Usage:
+    python -m benchmarks.bench_search [projects] [tasks_per_project]
+"""
+
+import statistics
+import sys
+import time
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+
+QUERIES = ['Task 42.17', 'subtask 4217', 'project 7', 'synthetc task 9999', 'ta']
+RUNS = 5
+
+
+def scan(projects: list, text: str) -> list:
+    """ The former search: a substring test on the name of every item. """
+    found = []
+    for project in projects:
+        if text in project.name:
+            found.append(project)
+        for task in project.tasks:
+            if text in task.name:
+                found.append(task)
+            found.extend(subtask for subtask in task.subtasks if text in subtask.name)
+    return found
+
+
+def median_time(function: callable) -> tuple:
+    """ Run a function RUNS times and return its last result and median time. """
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    engine = create_synthetic_database(projects, tasks_per_project)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        user = hydrate_user(synthetic_user_row(session), session,
+                            UnitOfWork(session_factory=factory), lazy=False)
+
+    start = time.perf_counter()
+    user.views.search_index.search('x')
+    print(f'index of {len(user.views.search_index)} items built in '
+          f'{time.perf_counter() - start:.2f} s')
+
+    for query in QUERIES:
+        found, scan_time = median_time(lambda query=query: scan(user.projects, query))
+        results, index_time = median_time(
+            lambda query=query: user.views.search_index.search(query))
+        print(f'{query!r:>22}: scan {len(found):6d} found {scan_time * 1000:8.2f} ms | '
+              f'index {len(results):3d} ranked {index_time * 1000:8.2f} ms')
+    user.unit_of_work.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: dashboard numbers from Python loops against the columnar task snapshot.
+
+Builds a synthetic user with 100k tasks by default (100 projects x 1000 tasks) in an
+in-memory SQLite database and computes the dashboard numbers in two ways:
+
+- loops: the former DashboardData, a loop over every task per number (counters,
+  timespan, next deadlines and tasks finished by weekday);
+- snapshot: the DashboardData getters, vectorized over user.views.task_snapshot, called
+  without the result cache.
+
+The script reports the time to build the snapshot, then the median time of several
+runs of each way, for every project and for one project.
+
+Usage:
+    python -m benchmarks.bench_task_snapshot [projects] [tasks_per_project]
+"""
+
+import datetime
+import statistics
+import sys
+import time
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.dashboard.dashboard_data import DashboardData
+
+GETTERS = ['get_number_of_tasks', 'get_number_of_done_tasks', 'get_number_of_on_time_tasks',
+           'get_number_of_for_today_tasks', 'get_number_of_late_tasks',
+           'get_timespan_of_tasks', 'get_next_deadlines', 'get_finished_by_weekday']
+RUNS = 5
+
+
+def weeks(days: int) -> str:
+    """ The bucket of weeks of a number of days """
+    if days <= 7:
+        return 'até 1'
+    if days <= 14:
+        return '1 a 2'
+    if days <= 21:
+        return '2 a 3'
+    return '3+'
+
+
+def loops(projects: list) -> list:
+    """ The former dashboard numbers: a loop over every task for each """
+    today = datetime.date.today()
+    yesterday = today - datetime.timedelta(days=1)
+    tasks = [task for project in projects for task in project.tasks]
+    timespan = {'até 1': 0, '1 a 2': 0, '2 a 3': 0, '3+': 0}
+    deadlines = dict.fromkeys(timespan, 0)
+    weekdays = [0] * 7
+    for task in tasks:
+        if task.creation_date is not None and task.end_date is not None:
+            timespan[weeks((task.end_date - task.creation_date).days)] += 1
+        if task.end_date is not None and task.end_date >= today:
+            deadlines[weeks((task.end_date - today).days)] += 1
+        if task.status and task.conclusion_date is not None:
+            weekdays[task.conclusion_date.weekday()] += 1
+    return [len(tasks),
+            len([task for task in tasks if task.status]),
+            len([task for task in tasks if task.end_date and task.end_date <= today
+                 and not task.status]),
+            len([task for task in tasks if task.end_date == today and not task.status]),
+            len([task for task in tasks if task.end_date and task.end_date <= yesterday
+                 and not task.status]),
+            timespan, deadlines, weekdays]
+
+
+def snapshot(dashboard: DashboardData) -> list:
+    """ The dashboard numbers from the snapshot, without the result cache """
+    return [getattr(DashboardData, getter).__wrapped__(dashboard) for getter in GETTERS]
+
+
+def median_time(function: callable) -> float:
+    """ Run a function RUNS times and return its median time. """
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    engine = create_synthetic_database(projects, tasks_per_project, subtasks_per_task=0)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        user = hydrate_user(synthetic_user_row(session), session,
+                            UnitOfWork(session_factory=factory), lazy=False)
+
+    start = time.perf_counter()
+    rows = len(user.views.task_snapshot)
+    print(f'snapshot of {rows} tasks built in {time.perf_counter() - start:.2f} s')
+
+    dashboard = DashboardData(user)
+    for selection in ['Todos', user.projects[0].name]:
+        dashboard.update_data(selection)
+        loop_time = median_time(lambda: loops(dashboard.projects))
+        snapshot_time = median_time(lambda: snapshot(dashboard))
+        print(f'{selection!r:>14}: loops {loop_time * 1000:8.2f} ms | '
+              f'snapshot {snapshot_time * 1000:8.2f} ms')
+    user.unit_of_work.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: rebuilding and diffing the project tree of the home page.
+
+Hydrates a synthetic user (100 projects x 100 tasks by default) and shows its projects
+and open tasks in two ttk.Treeview widgets:
+
+- rebuild: the former `ProjectList.update_project_list`, which deletes every row and
+  inserts every project and open task again;
+- diff: `TreeSync` with the rows of `ProjectList.project_row` and `task_rows`, as the
+  home page now does.
+
+Each tree goes through the same steps: first fill, refresh without change (what every
+edit used to trigger), refresh after a task is concluded, a filter keeping half of the
+projects, and the removal of the filter. The time of each step includes the idle
+redraw of the tree.
+
+The tasks are concluded in memory only. Tk needs a display: run it under `xvfb-run` on
+a headless machine.
+
+Usage:
+    python -m benchmarks.bench_tree_refresh [projects] [tasks_per_project]
+"""
+
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row
+from src.db.unit_of_work import UnitOfWork
+from src.gui.homepage import ProjectList
+from src.gui.tree_sync import TreeSync
+from src.logic.authentication.hydration import hydrate_user
+
+
+def rebuild(tree: ttk.Treeview, projects: list) -> None:
+    """ The former refresh: delete every row, then insert every row again. """
+    tree.delete(*tree.get_children())
+    for project in projects:
+        tags = (project.name, 'projectname', 'concluded') if project.status \
+            else (project.name, 'projectname')
+        text = f'{project.name} - Concluído' if project.status else project.name
+        project_id = tree.insert('', tk.END, text=text, open=True, tags=tags)
+        for task in project.tasks:
+            if not task.status:
+                tree.insert(project_id, tk.END, text=task.name)
+
+
+def diff(sync: TreeSync, projects: list) -> None:
+    """ The current refresh: apply the differences with the rows shown. """
+    sync.sync('', [ProjectList.project_row(project) for project in projects])
+    for project in projects:
+        sync.sync(ProjectList.project_iid(project), ProjectList.task_rows(project))
+
+
+def conclude_one(projects: list) -> None:
+    """ Conclude the first open task of the first project, in memory only. """
+    task = next(task for task in projects[0].tasks if not task.status)
+    task._status = True # pylint: disable=protected-access
+
+
+def run(name: str, root: tk.Tk, refresh: callable, projects: list) -> None:
+    """ Run the steps with one refresh strategy and print the time of each. """
+    half = projects[::2]
+    steps = [('first fill', projects), ('no change', projects), ('one concluded', projects),
+             ('filter half', half), ('remove filter', projects)]
+    timings = []
+    for step, shown in steps:
+        if step == 'one concluded':
+            conclude_one(projects)
+        start = time.perf_counter()
+        refresh(shown)
+        root.update_idletasks()
+        timings.append(f'{step} {time.perf_counter() - start:7.3f} s')
+    print(f'{name:>8}: ' + ' | '.join(timings))
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = create_synthetic_database(projects, tasks_per_project)
+    factory = sessionmaker(bind=engine)
+
+    root = tk.Tk()
+    for name in ('rebuild', 'diff'):
+        with factory() as session:
+            user = hydrate_user(synthetic_user_row(session), session,
+                                UnitOfWork(session_factory=factory), lazy=False)
+        shown = list(user.projects)
+        tree = ttk.Treeview(root, show='tree')
+        tree.pack()
+        if name == 'rebuild':
+            run(name, root, lambda projects, tree=tree: rebuild(tree, projects), shown)
+        else:
+            sync = TreeSync(tree)
+            run(name, root, lambda projects, sync=sync: diff(sync, projects), shown)
+        tree.destroy()
+        user.unit_of_work.close()
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
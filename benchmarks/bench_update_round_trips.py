@@ -0,0 +1,84 @@
+"""
+Benchmark: round trips of the item mutators.
+
+Builds a synthetic account (10 projects x 100 tasks by default) in an in-memory SQLite
+database, hydrates it and toggles the conclusion of every task three ways:
+
+- read-before-write: the former mutator body, a SELECT of the row followed by an
+  UPDATE of the loaded object;
+- update-by-id: `Task.conclusion()` / `Task.unconclusion()`, a single UPDATE by
+  primary key through `Repository.update_by_id`;
+- write-behind: the same calls with write-behind enabled, flushed once at the end
+  with `Repository.update_many` (one executemany per set of columns).
+
+For each mode the script reports the wall-clock time and the statements sent to the
+database, in total and per operation.
+
+Usage:
+    python -m benchmarks.bench_update_round_trips [projects] [tasks_per_project]
+"""
+
+import sys
+import time
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.synthetic import create_synthetic_database, synthetic_user_row, QueryCounter
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.orms.orm import TaskORM
+
+
+def read_before_write(unit_of_work: UnitOfWork, task: object, status: bool) -> None:
+    """ The mutator body used before the primary-key UPDATE path. """
+    with unit_of_work.begin() as session:
+        task_to_update = session.query(TaskORM).filter(TaskORM.id_task == task.id_task).first()
+        if task_to_update:
+            task_to_update.status = status
+            task_to_update.conclusion_date = None
+
+
+def toggle(mode: str, unit_of_work: UnitOfWork, tasks: list) -> None:
+    """ Conclude and unconclude every task once with the given mode. """
+    for task in tasks:
+        if mode == 'read-before-write':
+            read_before_write(unit_of_work, task, True)
+            read_before_write(unit_of_work, task, False)
+        else:
+            task.conclusion()
+            task.unconclusion()
+    unit_of_work.flush()
+
+
+def run(mode: str, engine: object) -> None:
+    """ Toggle every task of the synthetic user and print time and statement count. """
+    session_factory = sessionmaker(bind=engine)
+    unit_of_work = UnitOfWork(session_factory=session_factory)
+    with session_factory() as session:
+        user = hydrate_user(synthetic_user_row(session), session, unit_of_work)
+    tasks = [task for project in user.projects for task in project.tasks]
+    if mode == 'write-behind':
+        unit_of_work.enable_write_behind(interval=None)
+
+    with QueryCounter(engine) as counter:
+        start = time.perf_counter()
+        toggle(mode, unit_of_work, tasks)
+        elapsed = time.perf_counter() - start
+
+    unit_of_work.disable_write_behind()
+    unit_of_work.close()
+    operations = 2 * len(tasks)
+    print(f'{mode:>17}: {elapsed:7.3f} s  {counter.count:6d} statements  '
+          f'{counter.count / operations:5.2f} per operation ({operations} operations)')
+
+
+def main() -> None:
+    """ Entry point of the benchmark. """
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    tasks_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    engine = create_synthetic_database(projects, tasks_per_project, subtasks_per_task=0)
+    for mode in ('read-before-write', 'update-by-id', 'write-behind'):
+        run(mode, engine)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Module Name: Synthetic Accounts
+
+Description:
+Helpers shared by the benchmarks to build a database holding one synthetic user with
+many projects, tasks and subtasks. Rows are written with Core executemany inserts so
+that building a 10k-task account takes a fraction of a second.
+
+Functions:
+- create_synthetic_database(projects, tasks_per_project, subtasks_per_task, url):
+  Creates the schema and fills it with a synthetic account.
+- QueryCounter: Context manager counting the statements sent through an engine.
+"""
+
+from datetime import date, timedelta
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.engine import Engine
+
+from src.logic.orms.orm import Base, UserORM, LabelORM, ProjectORM, TaskORM, SubtaskORM
+
+USER_NAME = 'Synthetic User'
+
+
+def create_synthetic_database(projects: int = 100, tasks_per_project: int = 100,
+                              subtasks_per_task: int = 1,
+                              url: str = 'sqlite://') -> Engine:
+    """ Create the schema and fill it with one synthetic account.
+
+    Args:
+        projects (int, optional): Number of projects. Defaults to 100.
+        tasks_per_project (int, optional): Tasks in each project. Defaults to 100.
+        subtasks_per_task (int, optional): Subtasks in each task. Defaults to 1.
+        url (str, optional): Database URL. Defaults to an in-memory SQLite database.
+
+    Returns:
+        Engine: Engine bound to the populated database.
+    """
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    start = date(2023, 1, 1)
+    priorities = ['Baixa', 'Média', 'Alta']
+
+    with engine.begin() as connection:
+        connection.execute(insert(UserORM), [{'id_user': 1, 'name': USER_NAME,
+                                              'email': 'synthetic@example.com',
+                                              'password': 'synthetic'}])
+        connection.execute(insert(LabelORM), [
+            {'id_label': index + 1, 'id_user': 1, 'name': f'Label {index}', 'color': 'azul'}
+            for index in range(5)])
+        connection.execute(insert(ProjectORM), [
+            {'id_project': index + 1, 'id_user': 1, 'id_label': index % 5 + 1,
+             'name': f'Project {index}', 'status': index % 7 == 0,
+             'creation_date': start + timedelta(days=index % 300),
+             'end_date': start + timedelta(days=index % 300 + 30),
+             'description': f'Synthetic project {index}'}
+            for index in range(projects)])
+
+        task_rows = []
+        subtask_rows = []
+        for project_index in range(projects):
+            for task_index in range(tasks_per_project):
+                id_task = project_index * tasks_per_project + task_index + 1
+                creation_date = start + timedelta(days=id_task % 365)
+                done = id_task % 3 == 0
+                task_rows.append({
+                    'id_task': id_task, 'id_project': project_index + 1,
+                    'name': f'Task {project_index}.{task_index}', 'status': done,
+                    'creation_date': creation_date,
+                    'end_date': creation_date + timedelta(days=id_task % 40),
+                    'conclusion_date': creation_date + timedelta(days=id_task % 20) if done
+                                       else None,
+                    'notification_date': creation_date + timedelta(days=id_task % 10),
+                    'priority': priorities[id_task % 3],
+                    'description': f'Synthetic task {id_task}'})
+                for subtask_index in range(subtasks_per_task):
+                    subtask_rows.append({'id_task': id_task, 'status': False,
+                                         'name': f'Subtask {id_task}.{subtask_index}'})
+        connection.execute(insert(TaskORM), task_rows)
+        if subtask_rows:
+            connection.execute(insert(SubtaskORM), subtask_rows)
+
+    return engine
+
+
+def synthetic_user_row(session: object) -> UserORM:
+    """ Return the UserORM row of the synthetic account. """
+    return session.scalars(select(UserORM).where(UserORM.name == USER_NAME)).one()
+
+
+class QueryCounter:
+    """ Context manager counting the statements executed through an engine.
+
+    Attributes:
+        count (int): Number of statements executed inside the block.
+    """
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.count = 0
+
+    # pylint: disable=unused-argument,too-many-arguments
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self) -> 'QueryCounter':
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
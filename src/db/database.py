@@ -6,10 +6,18 @@ This module contains a class, `Database`, used to create and manage a
 database connection. It provides methods for executing raw SQL queries
 and committing sessions.
 
+The database URL and the connection pool are configured from the environment.
+Besides the shared MySQL server, a local SQLite file can be used for offline,
+single-user installs; it is opened in WAL mode so that reads do not block on writes.
+
 Classes:
 - Database: Manages the database connection and provides methods for
 SQL query execution and session commits.
 
+Functions:
+- database_url(): Builds the database URL from the environment.
+- create_configured_engine(): Creates an engine with the pool settings of the environment.
+
 Dependencies:
 - os: Operating system interfaces.
 - sqlalchemy: SQL toolkit and Object-Relational Mapping (ORM) library.
@@ -17,10 +25,19 @@ Dependencies:
 - dotenv: Loads environment variables from a .env file.
 
 Environment Variables:
+- DATABASE_URL: Full SQLAlchemy URL, e.g. 'sqlite:///gerenciador.db'. When set, the
+  DB_HOST/DB_USER/DB_PASS/DB_NAME/DB_PORT variables are ignored.
 - DB_HOST: Hostname of the database server.
+- DB_PORT: Port of the database server (default 3306).
 - DB_USER: Username for the database connection.
 - DB_PASS: Password for the database connection.
 - DB_NAME: Name of the database.
+- DB_POOL_SIZE: Connections kept open by the pool (default 5).
+- DB_MAX_OVERFLOW: Extra connections allowed above the pool size (default 10).
+- DB_POOL_TIMEOUT: Seconds to wait for a free connection (default 30).
+- DB_POOL_RECYCLE: Seconds after which a connection is reopened (default 1800).
+- DB_POOL_PRE_PING: Test connections before using them (default true).
+- DB_SQLITE_WAL: Use WAL journaling for SQLite files (default true).
 
 Attributes:
 - _instance: Private class attribute to manage the singleton instance of the Database class.
@@ -28,19 +45,94 @@ Attributes:
 Methods:
 - __new__(): Creates a new instance of the Database class with a singleton pattern.
 - get_session(): Retrieves a session from the session factory.
+- create_schema(): Applies the pending migrations (used by local SQLite installs).
 - execute_raw_sql(): Executes raw SQL queries and returns results.
 - commit(): Commits the current session to the database.
 """
 
 
 import os
-from sqlalchemy import create_engine, text
+from typing import Mapping
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 
 from dotenv import load_dotenv
 
+from src.db.pool import PoolStatistics, TimedQueuePool
+
 load_dotenv()
 
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def database_url(environ: Mapping[str, str] = os.environ) -> str:
+    """ Build the database URL from the environment.
+
+    Args:
+        environ (Mapping[str, str], optional): Environment variables. Defaults to os.environ.
+
+    Returns:
+        str: DATABASE_URL if set, the MySQL URL of the DB_* variables otherwise.
+    """
+    url = environ.get('DATABASE_URL')
+    if url:
+        return url
+
+    db_host = environ.get('DB_HOST')
+    db_port = environ.get('DB_PORT', '3306')
+    db_user = environ.get('DB_USER')
+    db_pass = environ.get('DB_PASS')
+    db_name = environ.get('DB_NAME')
+    return f'mysql+pymysql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}'
+
+
+def _enable_sqlite_wal(dbapi_connection: object, connection_record: object) -> None: # pylint: disable=unused-argument
+    """ Switch a new SQLite connection to WAL journaling. """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
+def create_configured_engine(url: str = None, environ: Mapping[str, str] = os.environ) -> Engine:
+    """ Create an engine with the pool settings of the environment.
+
+    Server databases get a `TimedQueuePool` sized by DB_POOL_SIZE and DB_MAX_OVERFLOW.
+    SQLite files keep the default pool of their dialect and, unless DB_SQLITE_WAL is
+    false, are opened in WAL mode. The returned engine has a `pool_statistics`
+    attribute holding its `PoolStatistics`.
+
+    Args:
+        url (str, optional): Database URL. Defaults to `database_url(environ)`.
+        environ (Mapping[str, str], optional): Environment variables. Defaults to os.environ.
+
+    Returns:
+        Engine: The configured engine.
+    """
+    url = make_url(url or database_url(environ))
+    options = {
+        'pool_pre_ping': environ.get('DB_POOL_PRE_PING', 'true').lower() in TRUE_VALUES,
+        'pool_recycle': int(environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    is_sqlite = url.get_backend_name() == 'sqlite'
+    if not is_sqlite:
+        options.update(poolclass=TimedQueuePool,
+                       pool_size=int(environ.get('DB_POOL_SIZE', 5)),
+                       max_overflow=int(environ.get('DB_MAX_OVERFLOW', 10)),
+                       pool_timeout=float(environ.get('DB_POOL_TIMEOUT', 30)))
+
+    engine = create_engine(url, **options)
+
+    in_memory = url.database in (None, '', ':memory:')
+    if is_sqlite and not in_memory and \
+            environ.get('DB_SQLITE_WAL', 'true').lower() in TRUE_VALUES:
+        event.listen(engine, 'connect', _enable_sqlite_wal)
+
+    engine.pool_statistics = PoolStatistics().attach(engine)
+    return engine
+
+
 class Database:
     """ This class will be used to create the database connection.
     """
@@ -55,17 +147,8 @@ class Database:
         if cls._instance is None:
             cls._instance = super(Database, cls).__new__(cls)
 
-            # Read environment variables
-            db_host = os.getenv('DB_HOST')
-            db_user = os.getenv('DB_USER')
-            db_pass = os.getenv('DB_PASS')
-            db_name = os.getenv('DB_NAME')
-
-            # Create the database connection string
-            connection_string = f'mysql+pymysql://{db_user}:{db_pass}@{db_host}:3306/{db_name}'
-
-            # Store the engine as an attribute of the instance
-            cls._instance.engine = create_engine(connection_string)
+            # Store the engine, configured from the environment, as an attribute of the instance
+            cls._instance.engine = create_configured_engine()
 
             # Create and store the session factory
             cls._instance.session_factory = sessionmaker(bind=cls._instance.engine)
@@ -83,6 +166,31 @@ class Database:
         """
         return cls._instance.session_factory()
 
+    @property
+    def pool_statistics(self) -> PoolStatistics:
+        """ Usage statistics of the engine's connection pool.
+
+        Returns:
+            PoolStatistics: Checkouts, checkins and wait times of the pool.
+        """
+        return self.engine.pool_statistics
+
+    @property
+    def is_sqlite(self) -> bool:
+        """ Whether the application runs on a local SQLite database.
+
+        Returns:
+            bool: True for SQLite URLs.
+        """
+        return self.engine.dialect.name == 'sqlite'
+
+    def create_schema(self) -> None:
+        """ Create or upgrade the schema by applying the pending migrations.
+        """
+        # pylint: disable=import-outside-toplevel
+        from src.db.migrations import MigrationRunner
+        MigrationRunner(self.engine).upgrade()
+
     def execute_raw_sql(self, sql: object, params:str=None, is_select:bool=True) -> list:
         """ Executes a raw SQL query.
 
@@ -0,0 +1,316 @@
+"""
+Module Name: Database Executor
+
+Description:
+This module contains the `DbExecutor` class, which runs logic-layer operations that
+touch the database (logins, item creation, conclusions, ...) on a pool of worker
+threads so that the Tkinter main loop never blocks on SQL.
+
+Tkinter widgets may only be used from the thread running the main loop, so results
+are not handed to the GUI from the workers. Each finished operation posts its
+callbacks to a queue that the executor drains on the Tk thread, polling it with
+`root.after`. Sessions are per thread: the units of work create one for each worker
+the first time it runs a query.
+
+The items of a user are read by the Tk thread and are not locked, so operations that
+change them go through `submit_writes`: the operation runs on the Tk thread, where
+the items change and their events are published, and only the writes it collected
+from the unit of work run on a worker.
+
+Until a Tk root is attached, operations run inline on the calling thread and their
+callbacks are invoked at once, which keeps scripts and tests synchronous.
+
+Classes:
+- DbFuture: Result of an operation submitted to the executor.
+- DbExecutor: Thread pool whose callbacks are delivered on the Tk thread.
+
+Dependencies:
+- concurrent.futures: Worker threads and futures.
+- queue: Hand-off of the callbacks to the Tk thread.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List
+from src.db.unit_of_work import UnitOfWork
+
+
+class DbFuture:
+    """ Result of an operation submitted to a `DbExecutor`.
+
+    Callbacks registered with `then` are always invoked on the Tk thread (or inline
+    when the executor has no root), whether they were registered before or after the
+    operation finished.
+
+    Attributes:
+        _executor (DbExecutor): The executor running the operation.
+        _future (Future): The underlying concurrent future.
+    """
+    def __init__(self, executor: 'DbExecutor', future: Future) -> None:
+        self._executor = executor
+        self._future = future
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._delivered = False
+        future.add_done_callback(lambda _: executor.post(self._deliver))
+
+    def then(self, on_success: Callable[[Any], None] = None,
+             on_error: Callable[[BaseException], None] = None) -> 'DbFuture':
+        """ Register the callbacks of the operation.
+
+        Args:
+            on_success (Callable[[Any], None], optional): Called with the result.
+            on_error (Callable[[BaseException], None], optional): Called with the raised
+                exception. Without it, errors are handed to the executor's error handler.
+
+        Returns:
+            DbFuture: self, so that calls can be chained.
+        """
+        with self._lock:
+            if not self._delivered:
+                self._callbacks.append((on_success, on_error))
+                return self
+        self._executor.post(lambda: self._invoke(on_success, on_error))
+        return self
+
+    def result(self, timeout: float = None) -> Any:
+        """ Block until the operation finishes and return its result.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+
+        Returns:
+            Any: The value returned by the operation.
+        """
+        return self._future.result(timeout)
+
+    def done(self) -> bool:
+        """ Check if the operation finished.
+
+        Returns:
+            bool: True once the operation returned or raised.
+        """
+        return self._future.done()
+
+    def _deliver(self) -> None:
+        """ Invoke the callbacks registered so far; runs on the Tk thread. """
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+            self._delivered = True
+        self._executor.finished()
+        if not callbacks:
+            callbacks = [(None, None)]
+        for on_success, on_error in callbacks:
+            self._invoke(on_success, on_error)
+
+    def _invoke(self, on_success: Callable, on_error: Callable) -> None:
+        error = self._future.exception()
+        if error is None:
+            if on_success is not None:
+                on_success(self._future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            self._executor.error_handler(error)
+
+
+class DbExecutor:
+    """ Thread pool running database operations off the Tk thread.
+
+    Attributes:
+        _instance (DbExecutor): The executor shared by the application.
+        _root (tk.Tk): Root whose `after` polls the callback queue, None when inline.
+        _pool (ThreadPoolExecutor): Worker threads.
+        _callbacks (queue.Queue): Callbacks waiting to run on the Tk thread.
+        _pending (int): Operations submitted and not yet delivered.
+        error_handler (Callable[[BaseException], None]): Called with the errors that
+            have no `on_error` callback.
+    """
+    _instance = None
+
+    def __init__(self, max_workers: int = 2, poll_interval: int = 50) -> None:
+        """ Create an executor.
+
+        Args:
+            max_workers (int, optional): Number of worker threads. Defaults to 2.
+            poll_interval (int, optional): Milliseconds between two polls of the
+                callback queue. Defaults to 50.
+        """
+        self._max_workers = max_workers
+        self._poll_interval = poll_interval
+        self._root = None
+        self._pool = None
+        self._callbacks = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._busy_listeners: List[Callable[[bool], None]] = []
+        self.error_handler = self._print_error
+
+    @classmethod
+    def instance(cls) -> 'DbExecutor':
+        """ Return the executor shared by the application.
+
+        Returns:
+            DbExecutor: The shared executor, created on first use.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def attach(self, root: object) -> None:
+        """ Start running operations in the background, with callbacks on `root`'s thread.
+
+        Args:
+            root (tk.Tk): The root window of the application.
+        """
+        self._root = root
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers,
+                                            thread_name_prefix='db-worker')
+        self._root.after(self._poll_interval, self._poll)
+
+    def detach(self) -> None:
+        """ Stop the workers and go back to running operations inline.
+        """
+        self._root = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.process_callbacks()
+
+    def submit(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> DbFuture:
+        """ Run an operation on a worker thread.
+
+        Args:
+            operation (Callable[..., Any]): The function to run.
+            *args (Any): Positional arguments of the function.
+            **kwargs (Any): Keyword arguments of the function.
+
+        Returns:
+            DbFuture: The future result of the operation.
+        """
+        with self._lock:
+            self._pending += 1
+            became_busy = self._pending == 1
+        if became_busy:
+            self._notify_busy(True)
+
+        if self._pool is None:
+            future = Future()
+            try:
+                future.set_result(operation(*args, **kwargs))
+            except Exception as e: # pylint: disable=broad-except
+                future.set_exception(e)
+            return DbFuture(self, future)
+        return DbFuture(self, self._pool.submit(operation, *args, **kwargs))
+
+    def submit_writes(self, unit_of_work: UnitOfWork, operation: Callable[..., Any],
+                      *args: Any, **kwargs: Any) -> DbFuture:
+        """ Run an operation changing the items on the calling (Tk) thread, and only its
+        database writes on a worker thread.
+
+        Callbacks waiting for the writes, such as the registration of new items, run on
+        the Tk thread before those registered with `then`.
+
+        Args:
+            unit_of_work (UnitOfWork): The unit of work of the items changed.
+            operation (Callable[..., Any]): The function to run.
+            *args (Any): Positional arguments of the function.
+            **kwargs (Any): Keyword arguments of the function.
+
+        Returns:
+            DbFuture: The future result of the operation, done once it is written.
+        """
+        try:
+            with unit_of_work.deferred() as writes:
+                result = operation(*args, **kwargs)
+        except Exception as e: # pylint: disable=broad-except
+            return self.submit(_raise, e)
+
+        def apply() -> Any:
+            writes.apply()
+            return result
+        return self.submit(apply).then(lambda _: writes.written(), lambda _: None)
+
+    def post(self, callback: Callable[[], None]) -> None:
+        """ Run a callback on the Tk thread (at once when no root is attached).
+
+        Args:
+            callback (Callable[[], None]): The callback.
+        """
+        if self._root is None:
+            callback()
+        else:
+            self._callbacks.put(callback)
+
+    def process_callbacks(self) -> int:
+        """ Run the callbacks waiting in the queue.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        count = 0
+        while True:
+            try:
+                callback = self._callbacks.get_nowait()
+            except queue.Empty:
+                return count
+            callback()
+            count += 1
+
+    def finished(self) -> None:
+        """ Mark one operation as delivered; called by its future on the Tk thread.
+        """
+        with self._lock:
+            self._pending -= 1
+            became_idle = self._pending == 0
+        if became_idle:
+            self._notify_busy(False)
+
+    def add_busy_listener(self, listener: Callable[[bool], None]) -> None:
+        """ Register a function called with True when the first operation starts and
+        with False when the last one is delivered, e.g. to show a busy cursor.
+
+        Args:
+            listener (Callable[[bool], None]): The busy indicator hook.
+        """
+        self._busy_listeners.append(listener)
+
+    def remove_busy_listener(self, listener: Callable[[bool], None]) -> None:
+        """ Unregister a busy indicator hook.
+
+        Args:
+            listener (Callable[[bool], None]): The hook to remove.
+        """
+        if listener in self._busy_listeners:
+            self._busy_listeners.remove(listener)
+
+    @property
+    def busy(self) -> bool:
+        """bool: True while some operation has not been delivered yet."""
+        return self._pending > 0
+
+    def _notify_busy(self, busy: bool) -> None:
+        for listener in list(self._busy_listeners):
+            self.post(lambda listener=listener: listener(busy))
+
+    def _poll(self) -> None:
+        """ Drain the callback queue and schedule the next poll. """
+        if self._root is None:
+            return
+        self.process_callbacks()
+        try:
+            self._root.after(self._poll_interval, self._poll)
+        except Exception: # pylint: disable=broad-except
+            # The root window was destroyed
+            self._root = None
+
+    @staticmethod
+    def _print_error(error: BaseException) -> None:
+        print(f"An error occurred: {error}")
+
+
+def _raise(error: BaseException) -> None:
+    """ Raise an error, to report it through a future. """
+    raise error
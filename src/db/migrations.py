@@ -0,0 +1,177 @@
+"""
+Module Name: Migrations
+
+Description:
+This module creates and upgrades the schema of the application's database, on MySQL
+as well as on SQLite.
+
+Each migration has a version number. The versions applied to a database are recorded
+in its `schema_version` table, so running the migrations again only applies the new
+ones. A database created before this table existed is at version 0: its tables are
+kept and the migrations add what is missing.
+
+MySQL commits DDL statements implicitly, so a migration cannot be rolled back half
+way through there. Migrations are therefore written to be idempotent (tables and
+indexes are only created when missing), and rerunning one that failed is safe.
+
+Usage:
+    python -m src.db.migrations [target_version]
+
+Classes:
+- Migration: A numbered change of the schema.
+- MigrationRunner: Applies the pending migrations to a database.
+
+Dependencies:
+- sqlalchemy: Schema inspection and DDL.
+"""
+
+import sys
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, insert, select
+from sqlalchemy.engine import Connection, Engine
+
+schema_metadata = MetaData()
+
+schema_version = Table(
+    'schema_version', schema_metadata,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('description', String(200), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+
+class Migration:
+    """ A numbered change of the schema.
+
+    Attributes:
+        version (int): Position of the migration, starting at 1.
+        description (str): What the migration does.
+        upgrade (Callable[[Connection], None]): Applies the change on a connection.
+    """
+    def __init__(self, version: int, description: str,
+                 upgrade: Callable[[Connection], None]) -> None:
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+    def __repr__(self) -> str:
+        return f'Migration({self.version}, {self.description!r})'
+
+
+def create_tables(connection: Connection) -> None:
+    """ Create the tables of the ORM models that do not exist yet.
+
+    Args:
+        connection (Connection): Connection to the database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.logic.orms.orm import Base
+    Base.metadata.create_all(connection)
+
+
+def create_indexes(connection: Connection) -> None:
+    """ Create the indexes declared by the ORM models that do not exist yet.
+
+    Args:
+        connection (Connection): Connection to the database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.logic.orms.orm import Base
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
+
+
+MIGRATIONS = [
+    Migration(1, 'Tabelas User, Label, Project, Task e Subtask', create_tables),
+    Migration(2, 'Índices das chaves estrangeiras, do nome do usuário e das datas das tarefas',
+              create_indexes),
+]
+
+
+class MigrationRunner:
+    """ Applies the pending migrations to a database.
+
+    Attributes:
+        engine (Engine): Engine of the database.
+        migrations (List[Migration]): Known migrations, sorted by version.
+    """
+    def __init__(self, engine: Engine, migrations: List[Migration] = None) -> None:
+        """ Create a runner.
+
+        Args:
+            engine (Engine): Engine of the database.
+            migrations (List[Migration], optional): Migrations to apply. Defaults to the
+                migrations of the application.
+        """
+        self.engine = engine
+        self.migrations = sorted(MIGRATIONS if migrations is None else migrations,
+                                 key=lambda migration: migration.version)
+
+    def current_version(self) -> int:
+        """ Return the version of the database.
+
+        Returns:
+            int: Highest version applied, 0 for a database never migrated.
+        """
+        with self.engine.connect() as connection:
+            if not inspect(connection).has_table(schema_version.name):
+                return 0
+            versions = connection.execute(select(schema_version.c.version)).scalars().all()
+        return max(versions, default=0)
+
+    def pending(self, target: int = None) -> List[Migration]:
+        """ Return the migrations not applied yet.
+
+        Args:
+            target (int, optional): Last version to consider. Defaults to the latest.
+
+        Returns:
+            List[Migration]: The migrations to apply, in order.
+        """
+        current = self.current_version()
+        return [migration for migration in self.migrations
+                if migration.version > current
+                and (target is None or migration.version <= target)]
+
+    def upgrade(self, target: int = None) -> List[int]:
+        """ Apply the pending migrations, each one in its own transaction.
+
+        Args:
+            target (int, optional): Version to upgrade to. Defaults to the latest.
+
+        Returns:
+            List[int]: Versions applied.
+        """
+        schema_metadata.create_all(self.engine)
+        applied = []
+        for migration in self.pending(target):
+            with self.engine.begin() as connection:
+                migration.upgrade(connection)
+                connection.execute(insert(schema_version).values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.now()))
+            applied.append(migration.version)
+        return applied
+
+
+def main() -> None:
+    """ Upgrade the database configured in the environment. """
+    # pylint: disable=import-outside-toplevel
+    from src.db.database import Database
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    runner = MigrationRunner(Database().engine)
+    applied = runner.upgrade(target)
+    for migration in runner.migrations:
+        if migration.version in applied:
+            print(f'Aplicada {migration.version}: {migration.description}')
+    print(f'Versão do banco: {runner.current_version()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Module Name: Connection Pool Statistics
+
+Description:
+This module measures how the connection pool of the application's engine is used, so
+that its size can be tuned for a deployment.
+
+Checkouts, checkins, new connections and invalidations are counted with SQLAlchemy
+pool events. The time spent waiting for a free connection is not reported by those
+events, so `TimedQueuePool` wraps the blocking part of `QueuePool` and records it.
+
+Classes:
+- PoolStatistics: Counters and wait times of a connection pool.
+- TimedQueuePool: QueuePool recording how long each checkout waited.
+
+Dependencies:
+- threading: Lock protecting the counters.
+- sqlalchemy: Pool events and QueuePool.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStatistics:
+    """ Counters and wait times of a connection pool.
+
+    Attributes:
+        connects (int): Connections opened by the pool.
+        checkouts (int): Connections handed out.
+        checkins (int): Connections given back.
+        invalidations (int): Connections discarded after an error or a failed pre-ping.
+        checked_out (int): Connections currently in use.
+        peak_checked_out (int): Highest number of connections in use at the same time.
+        waits (int): Checkouts measured by `TimedQueuePool`.
+        wait_total (float): Time spent waiting for those checkouts, in seconds.
+        wait_max (float): Longest wait, in seconds.
+        timeouts (int): Checkouts that gave up after the pool timeout.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def attach(self, engine: Engine) -> 'PoolStatistics':
+        """ Start collecting the statistics of an engine's pool.
+
+        Args:
+            engine (Engine): The engine to observe.
+
+        Returns:
+            PoolStatistics: self, for chaining.
+        """
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+        if isinstance(engine.pool, TimedQueuePool):
+            engine.pool.statistics = self
+        return self
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """ Record the time a checkout spent waiting for a connection.
+
+        Args:
+            seconds (float): Duration of the wait.
+            timed_out (bool, optional): True if the checkout gave up. Defaults to False.
+        """
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    @property
+    def wait_mean(self) -> float:
+        """float: Mean wait of the measured checkouts, in seconds."""
+        return self.wait_total / self.waits if self.waits else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """ Return the statistics as a plain dictionary.
+
+        Returns:
+            Dict[str, Any]: Counters and wait times.
+        """
+        with self._lock:
+            return {'connects': self.connects,
+                    'checkouts': self.checkouts,
+                    'checkins': self.checkins,
+                    'invalidations': self.invalidations,
+                    'checked_out': self.checked_out,
+                    'peak_checked_out': self.peak_checked_out,
+                    'waits': self.waits,
+                    'wait_mean': self.wait_mean,
+                    'wait_max': self.wait_max,
+                    'timeouts': self.timeouts}
+
+    # pylint: disable=unused-argument
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+class TimedQueuePool(QueuePool):
+    """ QueuePool recording how long each checkout waited for a connection.
+
+    Attributes:
+        statistics (PoolStatistics): Where the waits are recorded, set by
+                                     `PoolStatistics.attach`.
+    """
+    statistics: PoolStatistics = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.statistics is not None:
+                self.statistics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.statistics is not None:
+            self.statistics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> 'TimedQueuePool':
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
@@ -0,0 +1,136 @@
+"""
+Module Name: Query Plans
+
+Description:
+This module runs EXPLAIN on the queries the application depends on to check that the
+database answers them through an index instead of scanning a whole table.
+
+The plans are read with `EXPLAIN QUERY PLAN` on SQLite, whose `detail` column names the
+index used (`SEARCH Task USING INDEX ix_Task_id_project ...`), and with `EXPLAIN` on
+MySQL, whose `key` column does.
+
+Usage:
+    python -m src.db.query_plan
+
+Functions:
+- hot_queries(): The queries to check and the indexes they must use.
+- explain(): The plan of a statement, as a list of rows.
+- used_indexes(): The indexes a statement's plan uses.
+- check_hot_queries(): The hot queries whose plans miss an expected index.
+
+Dependencies:
+- sqlalchemy: Statement compilation.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Set, Tuple
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+
+SQLITE_INDEX = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+
+
+def hot_queries() -> Dict[str, Tuple[Any, Tuple[str, ...]]]:
+    """ Return the queries to check and the indexes they must use.
+
+    Returns:
+        Dict[str, Tuple[Select, Tuple[str, ...]]]: Statement and expected indexes, by
+            name of the access path.
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.logic.orms.orm import UserORM, LabelORM, ProjectORM, TaskORM, SubtaskORM
+    today = date.today()
+    return {
+        'login': (select(UserORM).where(UserORM.name == 'usuario',
+                                        UserORM.password == 'senha'),
+                  ('ix_User_name',)),
+        'labels of a user': (select(LabelORM).where(LabelORM.id_user == 1),
+                             ('ix_Label_id_user',)),
+        'projects of a user': (select(ProjectORM).where(ProjectORM.id_user == 1),
+                               ('ix_Project_id_user',)),
+        'tasks of a project': (select(TaskORM).where(TaskORM.id_project == 1),
+                               ('ix_Task_id_project',)),
+        'subtasks of a task': (select(SubtaskORM).where(SubtaskORM.id_task == 1),
+                               ('ix_Subtask_id_task',)),
+        'tasks of a user': (select(TaskORM)
+                            .join(ProjectORM, TaskORM.id_project == ProjectORM.id_project)
+                            .where(ProjectORM.id_user == 1),
+                            ('ix_Project_id_user', 'ix_Task_id_project')),
+        'tasks ending in a period': (select(TaskORM).where(TaskORM.end_date >= today,
+                                                           TaskORM.end_date <= today),
+                                     ('ix_Task_end_date',)),
+        'tasks to notify': (select(TaskORM).where(TaskORM.notification_date == today),
+                            ('ix_Task_notification_date',)),
+    }
+
+
+def explain(connection: Connection, statement: Any) -> List[Dict[str, Any]]:
+    """ Return the plan of a statement.
+
+    Args:
+        connection (Connection): Connection to the database.
+        statement (Select): The statement to explain.
+
+    Returns:
+        List[Dict[str, Any]]: Rows of the plan, as returned by the database.
+    """
+    compiled = statement.compile(dialect=connection.dialect)
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.dialect.name == 'sqlite' else 'EXPLAIN '
+    result = connection.exec_driver_sql(prefix + str(compiled), params)
+    return [dict(row._mapping) for row in result]
+
+
+def used_indexes(connection: Connection, statement: Any) -> Set[str]:
+    """ Return the indexes a statement's plan uses.
+
+    Args:
+        connection (Connection): Connection to the database.
+        statement (Select): The statement to explain.
+
+    Returns:
+        Set[str]: Names of the indexes.
+    """
+    indexes = set()
+    for row in explain(connection, statement):
+        if 'detail' in row:
+            indexes.update(SQLITE_INDEX.findall(row['detail']))
+        elif row.get('key'):
+            indexes.add(row['key'])
+    return indexes
+
+
+def check_hot_queries(connection: Connection) -> Dict[str, Set[str]]:
+    """ Return the hot queries whose plans do not use an expected index.
+
+    Args:
+        connection (Connection): Connection to the database.
+
+    Returns:
+        Dict[str, Set[str]]: Missing indexes, by query. Empty when every plan is good.
+    """
+    missing = {}
+    for name, (statement, expected) in hot_queries().items():
+        absent = set(expected) - used_indexes(connection, statement)
+        if absent:
+            missing[name] = absent
+    return missing
+
+
+def main() -> None:
+    """ Print the plan of each hot query of the configured database. """
+    # pylint: disable=import-outside-toplevel
+    from src.db.database import Database
+    with Database().engine.connect() as connection:
+        for name, (statement, expected) in hot_queries().items():
+            used = used_indexes(connection, statement)
+            status = 'ok' if set(expected) <= used else 'SEM INDICE'
+            print(f'{name:>25}: {status:10} {", ".join(sorted(used)) or "-"}')
+
+
+if __name__ == '__main__':
+    main()
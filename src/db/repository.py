@@ -0,0 +1,146 @@
+"""
+Module Name: Repository
+
+Description:
+This module contains the `Repository` class, which groups the write statements the
+domain objects need on top of a session.
+
+Updating a row through the ORM usually means loading it first (a SELECT) and then
+changing its attributes (an UPDATE at flush time). When the primary key and the new
+values are already known, as is the case for every item of the application, the
+SELECT is wasted: `update_by_id` emits a single `UPDATE ... WHERE id = :id` and
+`update_many` sends a batch of them as one executemany.
+
+`insert_many` is the bulk counterpart of `session.add()` for imports: it inserts many
+rows of a model in one batch and returns their generated ids in the order of the rows.
+
+Classes:
+- Repository: Primary-key based writes and bulk inserts on a session.
+
+Dependencies:
+- sqlalchemy: Mapper inspection, INSERT and UPDATE statements.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy import inspect, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+
+class Repository:
+    """ Primary-key based writes and bulk inserts on a session.
+
+    Attributes:
+        _session (Session): The session the statements are executed on.
+        KEY_BATCH (int): Keys per SELECT when reading back ids without RETURNING.
+    """
+    KEY_BATCH = 500
+
+    def __init__(self, session: Session) -> None:
+        """ Create a repository on a session.
+
+        Args:
+            session (Session): The session the statements are executed on.
+        """
+        self._session = session
+
+    @staticmethod
+    def primary_key(model: type) -> Any:
+        """ Return the mapped primary key attribute of a model.
+
+        Args:
+            model (type): ORM class with a single column primary key.
+
+        Returns:
+            InstrumentedAttribute: The primary key attribute, e.g. `TaskORM.id_task`.
+        """
+        mapper = inspect(model)
+        return getattr(model, mapper.get_property_by_column(mapper.primary_key[0]).key)
+
+    def update_by_id(self, model: type, id_value: Any, **fields: Any) -> int:
+        """ Update columns of one row with a single UPDATE statement.
+
+        Instances of the row already loaded in the session are updated in memory, no
+        SELECT is issued.
+
+        Args:
+            model (type): ORM class of the row.
+            id_value (Any): Primary key of the row.
+            **fields (Any): Columns to update and their new values.
+
+        Returns:
+            int: Number of rows matched (0 if the row does not exist).
+        """
+        if not fields:
+            return 0
+        statement = update(model)\
+            .where(self.primary_key(model) == id_value)\
+            .values(**fields)\
+            .execution_options(synchronize_session='evaluate')
+        return self._session.execute(statement).rowcount
+
+    def update_many(self, model: type, changes: Iterable[Tuple[Any, Dict[str, Any]]]) -> int:
+        """ Update many rows of a model, batching the statements with executemany.
+
+        Rows changing the same set of columns share one UPDATE statement executed with
+        all their parameters at once.
+
+        Args:
+            model (type): ORM class of the rows.
+            changes (Iterable[Tuple[Any, Dict[str, Any]]]): Pairs of primary key and
+                columns to update.
+
+        Returns:
+            int: Number of rows sent to the database.
+        """
+        key_name = self.primary_key(model).key
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for id_value, fields in changes:
+            if fields:
+                groups.setdefault(frozenset(fields), []).append({key_name: id_value, **fields})
+
+        count = 0
+        for rows in groups.values():
+            self._session.execute(update(model), rows)
+            count += len(rows)
+        return count
+
+    def insert_many(self, model: type, rows: List[Dict[str, Any]],
+                    key: Sequence[str]) -> List[Any]:
+        """ Insert many rows of a model and return their primary keys.
+
+        The rows are sent as one batched INSERT. Their generated ids are matched back to
+        them through `key`, columns whose values identify each row of the batch (e.g. the
+        parent id and the name): with `INSERT ... RETURNING` where the dialect supports
+        it for executemany, otherwise (MySQL) with a single SELECT of the keys afterwards.
+
+        Args:
+            model (type): ORM class of the rows.
+            rows (List[Dict[str, Any]]): Column values of each row.
+            key (Sequence[str]): Columns whose values are unique among `rows` and among
+                the rows already stored with the same values.
+
+        Returns:
+            List[Any]: The primary key of each row, in the order of `rows`.
+        """
+        if not rows:
+            return []
+        primary_key = self.primary_key(model)
+        key_columns = [getattr(model, name) for name in key]
+        dialect = self._session.get_bind().dialect
+
+        if dialect.insert_executemany_returning:
+            result = self._session.execute(insert(model).returning(primary_key, *key_columns),
+                                           rows)
+        else:
+            self._session.execute(insert(model), rows)
+            keys = list({tuple(row[name] for name in key) for row in rows})
+            result = []
+            for start in range(0, len(keys), self.KEY_BATCH):
+                batch = keys[start:start + self.KEY_BATCH]
+                result.extend(self._session.execute(
+                    select(primary_key, *key_columns)
+                    .where(tuple_(*key_columns).in_(batch))
+                    .order_by(primary_key)))
+
+        ids = {tuple(found[1:]): found[0] for found in result}
+        return [ids[tuple(row[name] for name in key)] for row in rows]
@@ -0,0 +1,396 @@
+"""
+Module Name: Unit of Work
+
+Description:
+This module contains the `UnitOfWork` class, a session scope shared by every domain
+object taking part in an operation (a login, an import, the items of a user, ...).
+
+Domain objects do not own a database session. They reach the database through the
+unit of work of their parent (a task through its project, a project through its
+user), so hydrating a large account uses one session instead of one per item.
+
+Scopes can be nested: only the outermost `begin()` commits (or rolls back), inner
+scopes just share its transaction. This lets an import wrap thousands of item
+creations in a single transaction while each item still persists itself.
+
+Column updates of existing rows go through `persist()`. They are written at once, or
+queued in a `WriteBehindQueue` when write-behind is enabled on the unit of work.
+
+Inside a `deferred()` block, the new rows (`insert()`) and the updates of the calling
+thread are collected instead of written. The GUI changes the items and publishes their
+events on the Tk thread, then hands only the collected writes to a worker thread.
+Deferred writes are applied in the order they were collected, so a row never goes to
+the database before the parent row it refers to. The id of a row inserted that way is
+only known once its write has run: until the block is written, `row_id()` gives a
+`PendingId` in its place, which the later writes read when they run. The item itself
+gets its id on the thread that collected the block, in `DeferredWrites.written()`.
+
+Classes:
+- UnitOfWork: Shared session scope with nestable transactions.
+- DeferredWrites: Writes collected by `UnitOfWork.deferred()`, applied later.
+- PendingId: The id of a row inserted by a deferred write.
+
+Dependencies:
+- threading: Per-thread nesting depth and sessions.
+- sqlalchemy.orm: Session, sessionmaker and scoped_session.
+- src.db.repository: Primary-key based UPDATE statements.
+- src.db.write_behind: Optional coalescing queue of updates.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, sessionmaker, scoped_session
+
+from src.db.database import Database
+from src.db.repository import Repository
+from src.db.write_behind import WriteBehindQueue
+
+
+class UnitOfWork:
+    """ Session scope shared by the domain objects of an operation.
+
+    A unit of work either wraps an existing session (used as is by every thread) or
+    creates sessions from a session factory, one per thread, the first time they are
+    needed. The factory defaults to the one of the application's `Database`.
+
+    Attributes:
+        _session (Session): Explicit session given at construction, if any.
+        _registry (scoped_session): Per-thread sessions created from the factory.
+        _local (threading.local): Per-thread nesting depth of `begin()`.
+        _write_behind (WriteBehindQueue): Queue of delayed updates, if enabled.
+    """
+    def __init__(self, session: Session = None, session_factory: sessionmaker = None) -> None:
+        """ Create a unit of work.
+
+        Args:
+            session (Session, optional): Session to use. Defaults to None.
+            session_factory (sessionmaker, optional): Factory of the per-thread sessions,
+                used when no session is given. Defaults to the `Database` factory.
+        """
+        self._session = session
+        self._session_factory = session_factory
+        self._registry = None
+        self._local = threading.local()
+        self._write_behind = None
+        self._tickets = itertools.count()
+        self._applied = 0
+        self._turns = threading.Condition()
+        self._pending: Dict[int, Tuple[Any, 'PendingId']] = {}
+
+    @classmethod
+    def resolve(cls, unit_of_work: 'UnitOfWork' = None, session: Session = None,
+                parent: 'UnitOfWork' = None) -> 'UnitOfWork':
+        """ Pick the unit of work of a domain object.
+
+        An explicit unit of work wins, then an explicit session (reusing the parent's
+        unit of work if it already wraps that session), then the parent's.
+
+        Args:
+            unit_of_work (UnitOfWork, optional): Explicit unit of work.
+            session (Session, optional): Explicit session.
+            parent (UnitOfWork, optional): Unit of work of the parent object.
+
+        Returns:
+            UnitOfWork: The unit of work to use.
+        """
+        if unit_of_work is not None:
+            return unit_of_work
+        if session is not None:
+            if parent is not None and parent.wraps(session):
+                return parent
+            return cls(session=session)
+        if parent is not None:
+            return parent
+        return cls()
+
+    def wraps(self, session: Session) -> bool:
+        """ Check if this unit of work was built around the given session.
+
+        Args:
+            session (Session): The session to compare.
+
+        Returns:
+            bool: True if the unit of work uses exactly this session.
+        """
+        return self._session is session
+
+    @property
+    def session(self) -> Session:
+        """Session: The session of the current thread."""
+        if self._session is not None:
+            return self._session
+        if self._registry is None:
+            factory = self._session_factory or Database().session_factory
+            self._registry = scoped_session(factory)
+        return self._registry()
+
+    @contextmanager
+    def begin(self) -> Iterator[Session]:
+        """ Open a (possibly nested) transactional scope.
+
+        The outermost scope commits when the block succeeds and rolls back when it
+        raises. Inner scopes only share the session; objects added in them are flushed
+        by their callers when an id is needed.
+
+        Yields:
+            Session: The session of the current thread.
+        """
+        session = self.session
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        try:
+            yield session
+            if depth == 0:
+                session.commit()
+        except Exception:
+            if depth == 0:
+                session.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+
+    @contextmanager
+    def deferred(self) -> Iterator['DeferredWrites']:
+        """ Collect the writes of the current thread instead of running them.
+
+        The writes collected must be applied, with `DeferredWrites.apply()`, on any
+        thread: the writes of the later blocks wait for them.
+
+        Yields:
+            DeferredWrites: The writes of the block.
+        """
+        writes = DeferredWrites(self)
+        self._local.deferred = writes
+        try:
+            yield writes
+        finally:
+            self._local.deferred = None
+        if writes.writes:
+            writes.ticket = next(self._tickets)
+
+    def insert(self, item: Any, build: Callable[[], Any],
+               inserted: Callable[[Any], None]) -> None:
+        """ Write the new row of an item.
+
+        Inside a `deferred()` block, the id of the row is given to `inserted` by
+        `DeferredWrites.written()`, on the thread that collected it; until then
+        `row_id()` returns a `PendingId` for the item.
+
+        Args:
+            item (Any): The item saved.
+            build (Callable[[], Any]): Creates the ORM row. It is called when the row is
+                written.
+            inserted (Callable[[Any], None]): Called with the id of the row once flushed.
+        """
+        pending = PendingId()
+
+        def write() -> None:
+            with self.begin() as session:
+                row = build()
+                session.add(row)
+                session.flush()
+                pending.value = inspect(row).identity[0]
+
+        writes = getattr(self._local, 'deferred', None)
+        if writes is None:
+            write()
+            inserted(pending.value)
+            return
+        writes.writes.append(write)
+        self._pending[id(item)] = (item, pending)
+
+        def written() -> None:
+            if self._pending.get(id(item), (None,))[0] is item:
+                del self._pending[id(item)]
+            inserted(pending.value)
+        writes.callbacks.append(written)
+
+    def row_id(self, item: Any, id_value: Any) -> Any:
+        """ The id of the row of an item, for a write collected now.
+
+        Args:
+            item (Any): The item, or None.
+            id_value (Any): The id the item knows, None while its insert is deferred.
+
+        Returns:
+            Any: The id, or the `PendingId` of the row while its insert is not written.
+        """
+        if id_value is None and item is not None:
+            entry = self._pending.get(id(item))
+            if entry is not None and entry[0] is item:
+                return entry[1]
+        return id_value
+
+    def when_written(self, callback: Callable[[], None]) -> None:
+        """ Run a callback once the writes made so far are in the database: at once, or
+        by `DeferredWrites.written()` inside a `deferred()` block.
+
+        Args:
+            callback (Callable[[], None]): The callback.
+        """
+        writes = getattr(self._local, 'deferred', None)
+        if writes is None:
+            callback()
+        else:
+            writes.callbacks.append(callback)
+
+    @contextmanager
+    def _turn(self, ticket: int) -> Iterator[None]:
+        """ Wait for the deferred writes collected before a ticket to be applied. """
+        with self._turns:
+            self._turns.wait_for(lambda: self._applied == ticket)
+        try:
+            yield
+        finally:
+            with self._turns:
+                self._applied += 1
+                self._turns.notify_all()
+
+    def _collect(self, write: Callable[[], None]) -> bool:
+        """ Add a write to the deferred writes of the current thread, if collecting. """
+        writes = getattr(self._local, 'deferred', None)
+        if writes is None:
+            return False
+        writes.writes.append(write)
+        return True
+
+    @property
+    def in_transaction(self) -> bool:
+        """bool: True while the current thread is inside a `begin()` block."""
+        return getattr(self._local, 'depth', 0) > 0
+
+    def enable_write_behind(self, interval: float = 0.5) -> WriteBehindQueue:
+        """ Queue the updates made through `persist()` instead of writing them at once.
+
+        Args:
+            interval (float, optional): Delay of the automatic flush, in seconds. None
+                leaves flushing to explicit `flush()` calls and shutdown. Defaults to 0.5.
+
+        Returns:
+            WriteBehindQueue: The queue, already enabled.
+        """
+        if self._write_behind is None:
+            self._write_behind = WriteBehindQueue(self, interval)
+        return self._write_behind
+
+    def disable_write_behind(self) -> None:
+        """ Flush the pending updates and go back to immediate writes.
+        """
+        if self._write_behind is not None:
+            queue, self._write_behind = self._write_behind, None
+            queue.close()
+
+    @property
+    def write_behind(self) -> WriteBehindQueue:
+        """WriteBehindQueue: The queue of delayed updates, or None when disabled."""
+        return self._write_behind
+
+    def persist(self, orm: type, id_value: Any, **fields: Any) -> None:
+        """ Write new values for columns of an existing row.
+
+        The row is not loaded: a single UPDATE by primary key is emitted.
+
+        Args:
+            orm (type): ORM class of the row.
+            id_value (Any): Primary key of the row, or its `PendingId` (see `row_id`).
+            **fields (Any): Columns to update and their new values, ids possibly
+                pending.
+        """
+        if self._collect(lambda: self.persist(orm, written_id(id_value), **{
+                name: written_id(value) for name, value in fields.items()})):
+            return
+        if self._write_behind is not None:
+            self._write_behind.enqueue(orm, id_value, **fields)
+            return
+        with self.begin() as session:
+            Repository(session).update_by_id(orm, id_value, **fields)
+
+    def discard(self, orm: type, id_value: Any) -> None:
+        """ Forget the delayed updates of a row that is about to be deleted.
+
+        Args:
+            orm (type): ORM class of the row.
+            id_value (Any): Primary key of the row.
+        """
+        if self._write_behind is not None:
+            self._write_behind.discard(orm, id_value)
+
+    def flush(self) -> int:
+        """ Write the delayed updates now.
+
+        Returns:
+            int: Number of rows written (0 when write-behind is disabled).
+        """
+        if self._write_behind is None:
+            return 0
+        return self._write_behind.flush()
+
+    def close(self) -> None:
+        """ Close the session this unit of work created for the current thread.
+
+        Explicit sessions given at construction belong to the caller and are left open.
+        """
+        if self._registry is not None:
+            self._registry.remove()
+
+
+class PendingId:
+    """ The id of a row inserted by a deferred write, set when the write runs.
+
+    Attributes:
+        value (Any): The id, None until the row is written.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self) -> None:
+        self.value = None
+
+
+def written_id(value: Any) -> Any:
+    """ The id a deferred write uses, read when the write runs.
+
+    Args:
+        value (Any): An id, or a `PendingId`.
+
+    Returns:
+        Any: The id.
+    """
+    return value.value if isinstance(value, PendingId) else value
+
+
+class DeferredWrites:
+    """ Writes collected by `UnitOfWork.deferred()`.
+
+    Attributes:
+        writes (List[Callable[[], None]]): The writes, in the order they were made.
+        callbacks (List[Callable[[], None]]): Run by `written()`, once the writes are in
+            the database.
+        ticket (int): Rank of the block among the deferred blocks of the unit of work,
+            None when the block wrote nothing.
+    """
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+        self.writes: List[Callable[[], None]] = []
+        self.callbacks: List[Callable[[], None]] = []
+        self.ticket = None
+
+    def apply(self) -> None:
+        """ Run the writes in one transaction, after the writes of the earlier blocks.
+        """
+        if self.ticket is None:
+            return
+        # pylint: disable=protected-access
+        with self._unit_of_work._turn(self.ticket):
+            with self._unit_of_work.begin():
+                for write in self.writes:
+                    write()
+
+    def written(self) -> None:
+        """ Run the callbacks waiting for the writes; call it on the thread that
+        collected them, once `apply()` returned.
+        """
+        for callback in self.callbacks:
+            callback()
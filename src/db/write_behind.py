@@ -0,0 +1,241 @@
+"""
+Module Name: Write-Behind Queue
+
+Description:
+This module contains the `WriteBehindQueue` class, an optional layer that delays the
+column updates of the domain objects and writes them in batches.
+
+Without it every state change (a conclusion, an edit, an undo) runs its own
+transaction. With it the changed fields are recorded per row, repeated changes to the
+same row are collapsed into a single UPDATE, and all pending rows are written in one
+transaction: periodically on a timer, on an explicit `flush()` or when the
+application exits.
+
+Classes:
+- WriteBehindMetrics: Counters and timings of the flushes of a queue.
+- WriteBehindQueue: Coalescing queue of pending updates.
+
+Dependencies:
+- threading: Lock and flush timer.
+- atexit: Flush on interpreter shutdown.
+- src.db.repository: Batched UPDATE statements by primary key.
+"""
+
+import atexit
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+from src.db.repository import Repository
+
+
+class WriteBehindMetrics:
+    """ Counters and timings of the flushes of a write-behind queue.
+
+    Attributes:
+        enqueued (int): Field updates received.
+        coalesced (int): Field updates that overwrote a pending one of the same row.
+        flushes (int): Non-empty flushes performed.
+        rows_written (int): Rows updated by all flushes.
+        failures (int): Flushes that raised and were rolled back.
+        latencies (Deque[float]): Duration, in seconds, of the latest flushes.
+        batch_sizes (Deque[int]): Number of rows of the latest flushes.
+    """
+    def __init__(self, history: int = 100) -> None:
+        self.enqueued = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.failures = 0
+        self.latencies: Deque[float] = deque(maxlen=history)
+        self.batch_sizes: Deque[int] = deque(maxlen=history)
+
+    def record_flush(self, rows: int, latency: float) -> None:
+        """ Record a successful flush.
+
+        Args:
+            rows (int): Number of rows written.
+            latency (float): Duration of the flush, in seconds.
+        """
+        self.flushes += 1
+        self.rows_written += rows
+        self.latencies.append(latency)
+        self.batch_sizes.append(rows)
+
+    @property
+    def mean_latency(self) -> float:
+        """float: Mean duration of the latest flushes, in seconds."""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        """float: Longest of the latest flushes, in seconds."""
+        return max(self.latencies, default=0.0)
+
+    @property
+    def mean_batch_size(self) -> float:
+        """float: Mean number of rows of the latest flushes."""
+        return sum(self.batch_sizes) / len(self.batch_sizes) if self.batch_sizes else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """ Return the metrics as a plain dictionary.
+
+        Returns:
+            Dict[str, Any]: Counters and aggregated timings.
+        """
+        return {'enqueued': self.enqueued,
+                'coalesced': self.coalesced,
+                'flushes': self.flushes,
+                'rows_written': self.rows_written,
+                'failures': self.failures,
+                'mean_latency': self.mean_latency,
+                'max_latency': self.max_latency,
+                'mean_batch_size': self.mean_batch_size}
+
+
+class WriteBehindQueue:
+    """ Coalescing queue of pending column updates.
+
+    Updates are keyed by (ORM class, primary key). Enqueuing fields of a row that is
+    already pending merges them, the latest value of each field winning. A flush writes
+    every pending row in a single transaction of the unit of work; if it fails the
+    batch is put back in front of the updates received meanwhile and the error is
+    raised.
+
+    Attributes:
+        _unit_of_work (UnitOfWork): Unit of work used by the flushes.
+        _interval (float): Seconds between the first pending update and the automatic
+                           flush. None disables the timer.
+        _pending (Dict[Tuple[type, Any], Dict[str, Any]]): Dirty fields per row.
+        metrics (WriteBehindMetrics): Flush counters and timings.
+    """
+    def __init__(self, unit_of_work: object, interval: float = 0.5) -> None:
+        """ Create a queue and register its flush at interpreter shutdown.
+
+        Args:
+            unit_of_work (UnitOfWork): Unit of work used by the flushes.
+            interval (float, optional): Delay of the automatic flush, in seconds. None
+                disables the timer. Defaults to 0.5.
+        """
+        self._unit_of_work = unit_of_work
+        self._interval = interval
+        self._pending: Dict[Tuple[type, Any], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._timer = None
+        self._closed = False
+        self.metrics = WriteBehindMetrics()
+        atexit.register(self.close)
+
+    def enqueue(self, orm: type, id_value: Any, **fields: Any) -> None:
+        """ Record new values for columns of a row.
+
+        Args:
+            orm (type): ORM class of the row.
+            id_value (Any): Primary key of the row.
+            **fields (Any): Columns to update and their new values.
+        """
+        if not fields:
+            return
+        with self._lock:
+            dirty = self._pending.setdefault((orm, id_value), {})
+            self.metrics.coalesced += len(dirty.keys() & fields.keys())
+            self.metrics.enqueued += len(fields)
+            dirty.update(fields)
+            self._schedule()
+
+    def discard(self, orm: type, id_value: Any) -> None:
+        """ Drop the pending updates of a row, e.g. because it is being deleted.
+
+        Args:
+            orm (type): ORM class of the row.
+            id_value (Any): Primary key of the row.
+        """
+        with self._lock:
+            self._pending.pop((orm, id_value), None)
+
+    def pending(self, orm: type, id_value: Any) -> Dict[str, Any]:
+        """ Return a copy of the pending fields of a row.
+
+        Args:
+            orm (type): ORM class of the row.
+            id_value (Any): Primary key of the row.
+
+        Returns:
+            Dict[str, Any]: The fields not yet written (empty if none).
+        """
+        with self._lock:
+            return dict(self._pending.get((orm, id_value), {}))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """ Write every pending row in a single transaction.
+
+        Returns:
+            int: Number of rows written.
+        """
+        with self._lock:
+            self._cancel_timer()
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        changes_by_model: Dict[type, List[Tuple[Any, Dict[str, Any]]]] = {}
+        for (orm, id_value), fields in batch.items():
+            changes_by_model.setdefault(orm, []).append((id_value, fields))
+
+        start = time.perf_counter()
+        try:
+            with self._unit_of_work.begin() as session:
+                repository = Repository(session)
+                for orm, changes in changes_by_model.items():
+                    repository.update_many(orm, changes)
+        except Exception:
+            with self._lock:
+                self.metrics.failures += 1
+                for key, fields in self._pending.items():
+                    batch.setdefault(key, {}).update(fields)
+                self._pending = batch
+            raise
+        self.metrics.record_flush(len(batch), time.perf_counter() - start)
+        return len(batch)
+
+    def close(self) -> None:
+        """ Stop the timer and write what is still pending.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.flush()
+
+    def _schedule(self) -> None:
+        """ Start the flush timer if it is enabled and not already running.
+        """
+        if self._interval is None or self._timer is not None or self._closed:
+            return
+        self._timer = threading.Timer(self._interval, self._flush_from_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """ Timer callback: flush and keep failed rows for the next attempt.
+        """
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception as e: # pylint: disable=broad-except
+            print(f"Write-behind flush failed: {e}")
+            with self._lock:
+                self._schedule()
+        finally:
+            self._unit_of_work.close()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -19,6 +19,7 @@ application framework.
 """
 
 import tkinter as tk
+from src.db.executor import DbExecutor
 from src.logic.authentication.authentication import LoginLogic, RegisterLogic
 from src.gui.homepage import HomePage
 
@@ -70,8 +71,7 @@ class Login(tk.Frame):
         username = self.username_entry.get()
         password = self.password_entry.get()
         self.update_status("Logging in...", "blue")
-        self.update_idletasks()  # Force GUI update
-        self.after(100, lambda: self.on_login(username, password))
+        self.on_login(username, password)
 
     def update_status(self, message, color="red"):
         """
@@ -135,8 +135,7 @@ class Register(tk.Frame):
         password = self.password_entry.get()
         email = self.email_entry.get()
         self.update_status("Registering...", "blue")
-        self.update_idletasks()
-        self.after(100, lambda: self.on_register(username, password, email))
+        self.on_register(username, password, email)
 
     def update_status(self, message, color="red"):
         """
@@ -166,8 +165,10 @@ class Authentication:
         """
 
         self.parent = parent
-        self.login_frame = Login(parent, self.login_user, self.show_register)
-        self.register_frame = Register(parent, self.register_user)
+        self.executor = DbExecutor.instance()
+        self.executor.add_busy_listener(self.show_busy)
+        self.login_frame = Login(parent, self.start_login, self.show_register)
+        self.register_frame = Register(parent, self.start_register)
         self.user = None
         self.homepage_frame = None
 
@@ -219,7 +220,27 @@ class Authentication:
             username (str): The username of the user.
             password (str): The password of the user.
         """
-        user = LoginLogic.login(username, password)
+        return self.finish_login(LoginLogic.login(username, password))
+
+    def start_login(self, username, password):
+        """
+        Log in in the background, without blocking the interface while the user is
+        loaded from the database.
+
+        Parameters:
+            username (str): The username of the user.
+            password (str): The password of the user.
+        """
+        self.executor.submit(LoginLogic.login, username, password)\
+            .then(self.finish_login, lambda e: self.login_frame.update_status("Login failed"))
+
+    def finish_login(self, user):
+        """
+        Open the homepage of a logged-in user, or report the failure.
+
+        Parameters:
+            user (User): The user returned by the login, None if it failed.
+        """
         if user:
             self.user = user
             self.show_homepage()
@@ -269,12 +290,47 @@ class Authentication:
             password (str): The password for the new account.
             email (str): The email for the new account.
         """
-        user = RegisterLogic.register(username, password, email)
+        return self.finish_register(RegisterLogic.register(username, password, email))
+
+    def start_register(self, username, password, email):
+        """
+        Register a new user in the background, without blocking the interface.
+
+        Parameters:
+            username (str): The username for the new account.
+            password (str): The password for the new account.
+            email (str): The email for the new account.
+        """
+        self.executor.submit(RegisterLogic.register, username, password, email)\
+            .then(self.finish_register,
+                  lambda e: self.register_frame.update_status("Registration failed"))
+
+    def finish_register(self, user):
+        """
+        Open the homepage of a newly registered user, or report the failure.
+
+        Parameters:
+            user (User): The user returned by the registration, None if it failed.
+        """
         if user:
             self.user = user
             self.show_homepage()
             return True
         self.register_frame.update_status("Registration failed")
+        return False
+
+    def show_busy(self, busy):
+        """
+        Show a busy cursor while database operations run in the background.
+
+        Parameters:
+            busy (bool): True when the first operation starts, False when the last ends.
+        """
+        try:
+            self.parent.config(cursor='watch' if busy else '')
+        except tk.TclError:
+            pass
+
     def show_login(self):
         """
         Display the login interface.
@@ -1,6 +1,7 @@
 from tkinter import messagebox
 import tkinter as tk
 from tkinter import ttk
+from src.db.executor import DbExecutor
 from src.logic.items.item_factory import ItemFactory
 from src.logic.execeptions.exceptions_items import ItemNameBlank,\
                                                     ItemNameAlreadyExists
@@ -11,21 +12,28 @@ class BaseDisplayManager:
         self.top_window = None
 
     def submit_item(self, item_type, data):
-        try:
-            ItemFactory.create_item(item_type, **data)
-            self.refresh_parent_page()
-            self.top_window.destroy()
-            print("Submetido:", data)
-        except ItemNameBlank as e:
-            if not messagebox.showerror("Erro", e):
-                return
-        except ItemNameAlreadyExists as e:
-            if not messagebox.showerror("Erro", e):
-                return
+        # O item é criado nesta thread (a do Tk); só o INSERT roda numa thread do
+        # DbExecutor, e a janela é atualizada no callback
+        parent = data.get('user') or data.get('project') or data.get('task')
+        DbExecutor.instance().submit_writes(parent.unit_of_work, ItemFactory.create_item,
+                                            item_type, **data)\
+            .then(lambda _: self.item_submitted(data), self.show_submit_error)
+
+    def item_submitted(self, data):
+        self.refresh_parent_page()
+        self.top_window.destroy()
+        print("Submetido:", data)
+
+    def show_submit_error(self, error):
+        if isinstance(error, (ItemNameBlank, ItemNameAlreadyExists)):
+            messagebox.showerror("Erro", error)
+        else:
+            DbExecutor.instance().error_handler(error)
 
     def update_item(self, data):
         try:
-            self.item.update(**data)
+            with self.item.undo_manager.group():
+                self.item.update(**data)
             self.refresh_parent_page()
             print("Atualizado:", data)
         except ItemNameBlank as e:
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+from src.db.executor import DbExecutor
 
 class BasePage(tk.Frame):
     def __init__(self, master, home, manager, item):
@@ -62,12 +63,21 @@ class BasePage(tk.Frame):
         self.manager.refresh_parent_page()
 
     def conclusion(self):
-        self.item.conclusion()
-        self.manager.refresh_parent_page()
-        self.close_window()
+        DbExecutor.instance().submit_writes(self.item.unit_of_work, self.run_grouped,
+                                            self.item.conclusion)\
+            .then(lambda _: self.item_changed())
 
     def unconclusion(self):
-        self.item.unconclusion()
+        DbExecutor.instance().submit_writes(self.item.unit_of_work, self.run_grouped,
+                                            self.item.unconclusion)\
+            .then(lambda _: self.item_changed())
+
+    def run_grouped(self, operation):
+        # Tudo o que a operação muda é desfeito de uma vez pelo botão Desfazer
+        with self.item.undo_manager.group():
+            operation()
+
+    def item_changed(self):
         self.manager.refresh_parent_page()
         self.close_window()
 
@@ -75,8 +85,7 @@ class BasePage(tk.Frame):
         self.master.destroy()
 
     def undo_update(self):
-        if self.item.has_memento():
-            self.item.restore_from_memento()
+        if self.item.undo_manager.undo(self.item):
             messagebox.showinfo("Sucesso", "Atualização desfeita com sucesso")
             self.manager.refresh_parent_page()
             self.manager.refrash_page()
@@ -8,6 +8,7 @@ import tkinter as tk
 from typing import Callable as function
 from src import CalendarDisplay, TaskDetails, MonthView, MonthYearNavigation
 from src.logic.users.user import User
+from src.logic.authentication.hydration import prefetch_tasks
 
 class CalendarPage:
     """
@@ -40,7 +41,7 @@ a given month and year.
         """
         self.interface = CalendarDisplay(master, on_close=on_close)
         self.user = user
-        self.tasks_dict = self.create_task_dict()
+        self.tasks_dict = self.user.views.result_cache.get(('calendar',), self.create_task_dict)
 
 
         self.task_details = TaskDetails(
@@ -71,6 +72,7 @@ a given month and year.
         tasks_dict = {}
         color_dict = {"verde": "green", "azul": "blue", "vermelho": "red",
                       "amarelo": "yellow", "laranja": "orange"}
+        prefetch_tasks(self.user.projects)
         for project in self.user.projects:
             if project.label is None:
                 label = ''
@@ -95,8 +97,12 @@ a given month and year.
         return tasks_dict
 
     def update_calendar(self, month: int, year: int) -> None:
-        """Updates the calendar view for a given month and year."""
-        self.tasks_dict = self.create_task_dict()
+        """Updates the calendar view for a given month and year.
+
+        The tasks by date are read from the user's result cache while the user's data
+        is unchanged, so moving between months does not go through every task again.
+        """
+        self.tasks_dict = self.user.views.result_cache.get(('calendar',), self.create_task_dict)
         month_year_tuple = (month, year)
         self.month_view = MonthView(self.interface.calendar_frame,
                                     self.tasks_dict, self.task_details, month_year_tuple)
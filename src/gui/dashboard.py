@@ -24,7 +24,7 @@ import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from src.logic.dashboard.plot import Plot
-from src.logic.dashboard.dashboard_data import DashboardData
+from src.logic.dashboard.sql_dashboard_data import create_dashboard_data
 
 
 class GridFrame(tk.Frame):
@@ -303,6 +303,6 @@ class DashboardPage(tk.Frame):
         self.configure(bg="#eaeaea")
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
-        dashboard_data = DashboardData(user)
+        dashboard_data = create_dashboard_data(user)
         Sidebar(self, row=0, col=0, back=on_close, dashboard_data=dashboard_data)
         Dashboard(self, row=0, col=1, dashboard_data=dashboard_data, rowspan=2)
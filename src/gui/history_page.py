@@ -11,7 +11,6 @@ Usage:
 """
 import tkinter as tk
 from tkinter import ttk
-from src.logic.history.task_history import HistorySingleton
 from src.logic.users.user import User
 
 class HistoryManagerApp(tk.Frame):
@@ -21,7 +20,7 @@ class HistoryManagerApp(tk.Frame):
         super().__init__(master)
         self.user = user
         self.controller = controller
-        self.history = HistorySingleton()
+        self.history = user.history
         self.on_close = on_close
         self.create_widgets()
 
@@ -31,7 +30,6 @@ class HistoryManagerApp(tk.Frame):
         self.grid_columnconfigure(0, weight=0)
         self.grid_rowconfigure(6, weight=1)
 
-        #self.history = HistorySingleton()
         #self.call_add_completed_task(self.call_list_of_projects(self.user))
         self.display_completed_tasks()
 
@@ -122,7 +120,7 @@ class HistoryManagerApp(tk.Frame):
 
     def call_add_completed_task(self, list_of_projects: list) -> None:
         """ This method will be used to call the add_completed_task method
-        from the HistorySingleton class.
+        from the history of the user.
 
         Args:
             list_of_projects (list): List of projects
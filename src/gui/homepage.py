@@ -31,11 +31,26 @@ from src.gui.load_page import LoadPage
 from src.gui.labels.labelpage import LabelManager
 from src.gui.filter_by_project import ProjectFilterPage
 from src.gui.filter_by_label import LabelFilterPage
+from src.db.executor import DbExecutor
+from src.logic.events.event_bus import ChangeEvent
+from src.logic.filter.search_index import project_of
 from src.logic.items.project import Project
+from src.logic.authentication.hydration import prefetch_tasks
 from src.logic.users.user import User
 from src.gui.notifications_page import NotificationPage
+from src.gui.tree_sync import TreeRow, TreeSync
+from src.gui.row_model import RowModel
+from src.gui.virtual_list import VirtualList
 from .calendar_page import CalendarPage
 
+# Projects whose tasks are loaded before the list is shown; the tasks of the others are
+# loaded when their row is opened.
+VISIBLE_PROJECTS = 30
+# Above this number of rows, the projects are shown in a virtual list, which only draws
+# the rows in view, instead of the tree view.
+VIRTUAL_ROWS = 2000
+# Items read from the search index for a search of the project list.
+SEARCH_RESULTS = 200
 
 
 
@@ -47,6 +62,7 @@ class TopBar(tk.Frame):
         on_navigate (function): A callback function to handle navigation requests.
         bg_color (str): Background color for the top bar.
         fg_color (str): Foreground color for the text in the top bar.
+        search_text (tk.StringVar): The text of the search box.
     """
     def __init__(
             self,
@@ -96,6 +112,14 @@ class TopBar(tk.Frame):
         ttk.Button(self, text='Remover Filtro', style='TButton',
                     command=lambda: on_navigate('remove_filter')).grid(row=0, column=9, padx=5)
 
+        self.search_text = tk.StringVar()
+        search_entry = ttk.Entry(self, textvariable=self.search_text, font=('Arial', 12),
+                                 width=20)
+        search_entry.grid(row=0, column=10, padx=5)
+        search_entry.bind('<Return>', lambda event: on_navigate('search'))
+        ttk.Button(self, text='Buscar', style='TButton',
+                    command=lambda: on_navigate('search')).grid(row=0, column=11, padx=5)
+
 class ProjectList(tk.Frame):
     """ A custom tkinter Frame to display a list of projects.
 
@@ -123,7 +147,6 @@ class ProjectList(tk.Frame):
         title_label.grid(row=0, column=0, sticky='ew', padx=10, pady=(10, 20))
 
         self.user = user
-        self.project_map = {}
         self.project_manager = ProjectDisplayManager(self, self.user)
         self.task_manager = TaskDisplayManager(self)
         self.subtask_manager = SubtaskDisplayManager(self)
@@ -131,6 +154,8 @@ class ProjectList(tk.Frame):
 
         self.tree = ttk.Treeview(self, show='tree')
         self.tree.grid(row=1, column=0, sticky='nsew')
+        self.rows = TreeSync(self.tree)
+        self.virtual_list = None
 
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -139,12 +164,16 @@ class ProjectList(tk.Frame):
         style.configure('Treeview', font=('Arial', 12), rowheight=25)
         style.layout('Treeview', [('Treeview.treearea', {'sticky': 'nswe'})])
 
-        scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
-        scrollbar.grid(row=1, column=1, sticky='ns')
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
+        self.scrollbar.grid(row=1, column=1, sticky='ns')
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
 
+        # Changes are delivered on the Tk thread; a burst of them refreshes the list once.
+        self._refresh_pending = False
         self.mock_projects()
+        self.user.events.subscribe(self.on_change, schedule=DbExecutor.instance().post)
         self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.bind("<<TreeviewOpen>>", self.on_open)
         open_create_project_button = tk.Button(
                                     self,
                                     text="Criar Projeto",
@@ -162,6 +191,48 @@ class ProjectList(tk.Frame):
 
         self.project_manager.open_page(project)
 
+    @property
+    def project_map(self) -> object:
+        """ The user's projects by name, shared with the user's name index.
+
+        Returns:
+            NameIndex: The index of the user's projects.
+        """
+        return self.user.project_names
+
+    @staticmethod
+    def project_iid(project: Project) -> str:
+        """ The row of a project in the tree view.
+
+        Parameters:
+            project (Project): The project.
+
+        Returns:
+            str: The iid of the project's row.
+        """
+        return f'project-{project.id_project}'
+
+    def project_of(self, item_id: str) -> Project:
+        """ Find the project of a row of the tree view.
+
+        Parameters:
+            item_id (str): The iid of a project, task or placeholder row.
+
+        Returns:
+            Project: The project of the row, or None if it no longer exists or the iid
+                holds no id.
+        """
+        kind, _, id_value = item_id.partition('-')
+        if not id_value.isdigit():
+            return None
+        identity_map = self.user.identity_map
+        if kind in ('project', 'more'):
+            return identity_map.get_project(int(id_value))
+        if kind == 'task':
+            task = identity_map.get_task(int(id_value))
+            return task.project if task else None
+        return None
+
     # pylint: disable=unused-argument
     def on_double_click(self, event: object):
         """ Handle double-click events on project items.
@@ -171,8 +242,7 @@ class ProjectList(tk.Frame):
         """
 
         item_id = self.tree.selection()[0]
-        project_name = self.tree.item(item_id, 'tags')[0]
-        project = self.project_map.get(project_name)
+        project = self.project_of(item_id)
 
         if project:
             self.show_project_page(project)
@@ -185,18 +255,30 @@ class ProjectList(tk.Frame):
         self.tree.tag_configure('projectname', font=('Arial', 12, 'bold'))
         self.tree.tag_configure('concluded', foreground='green')
         print(self.user.projects)
-        for project in self.user.projects:
-            if project.status:
-                project_id = self.tree.insert('', tk.END, text=f'{project.name} - Concluído',\
-                     open=True, tags=(project.name, 'projectname', 'concluded'))
-            else:
-                project_id = self.tree.insert('', tk.END, text=project.name, open=True,\
-                     tags=(project.name, 'projectname'))
-
-            self.project_map[project.name] = project
-            for task in project.tasks:
-                if not task.status:
-                    self.tree.insert(project_id, tk.END, text=task.name)
+        self.update_project_list(self.user.projects)
+
+    # pylint: disable=unused-argument
+    def on_change(self, event: ChangeEvent) -> None:
+        """ Schedule a refresh of the list after a change of the user's items.
+
+        Parameters:
+            event (ChangeEvent): The change event.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        """ Refresh the list with the changes received since the last refresh.
+        """
+        self._refresh_pending = False
+        self.update_main_page()
+
+    def destroy(self) -> None:
+        """ Stop following the changes of the user's items and destroy the list.
+        """
+        self.user.events.unsubscribe(self.on_change)
+        super().destroy()
 
     def update_main_page(self) -> None:
         """ Update the main page by refreshing the project list.
@@ -215,40 +297,141 @@ class ProjectList(tk.Frame):
     def update_project_list(self, projects: list) -> None:
         """ Update the project list with a new list of projects.
 
+        Only the differences with the rows shown are applied to the tree view: rows of
+        projects and tasks that are gone are deleted, new ones inserted, and rows whose
+        text, tags or position changed updated. Projects deleted since the list was
+        filtered are left out, and so are the projects and tasks whose creation is not
+        written yet: their rows are named after their ids, and they are shown by the
+        refresh that follows their `Created` event.
+
+        Once there are more than VIRTUAL_ROWS rows to show, the tree view is replaced
+        by a virtual list for the rest of the session.
+
         Args:
             projects (list): A list of projects to display.
         """
-        self.tree.delete(*self.tree.get_children())
-        self.project_map.clear()
+        user_projects = self.user.projects
+        projects = [project for project in projects
+                    if project in user_projects and project.id_project is not None]
+        if self.virtual_list is None and self.row_count(projects) > VIRTUAL_ROWS:
+            self.use_virtual_list()
+        if self.virtual_list is not None:
+            self.virtual_list.model.set_projects(projects)
+            self.virtual_list.refresh()
+            return
+        prefetch_tasks(projects[:VISIBLE_PROJECTS])
+        self.rows.sync('', [self.project_row(project) for project in projects])
+        for project in projects:
+            self.rows.sync(self.project_iid(project), self.task_rows(project))
 
-        self.tree.tag_configure('projectname', font=('Arial', 12, 'bold'))
-        self.tree.tag_configure('concluded', foreground='green')
+    @staticmethod
+    def row_count(projects: list) -> int:
+        """ Count the rows of a list of projects and of their loaded tasks.
 
-        for project in projects:
-            if project.status:
-                project_id = self.tree.insert('', tk.END, text=f'{project.name} - Concluído',
-                     open=True, tags=(project.name, 'projectname', 'concluded'))
-            else:
-                project_id = self.tree.insert('', tk.END, text=project.name, open=True,
-                     tags=(project.name, 'projectname'))
-
-            self.project_map[project.name] = project
-            for task in project.tasks:
-                if not task.status:
-                    self.tree.insert(project_id, tk.END, text=task.name)
+        Args:
+            projects (list): The projects.
+
+        Returns:
+            int: The number of rows, at most, of the projects in the tree view.
+        """
+        return sum(1 if project.deferred_tasks is not None else 1 + len(project.tasks)
+                   for project in projects)
+
+    def use_virtual_list(self) -> None:
+        """ Replace the tree view with a virtual list, with the same tag styles.
+        """
+        self.rows.clear()
+        self.tree.destroy()
+        self.scrollbar.destroy()
+        self.virtual_list = VirtualList(self, RowModel(), self.show_project_page,
+                                        bg_color=self.cget('bg'))
+        self.virtual_list.grid(row=1, column=0, columnspan=2, sticky='nsew')
+        self.virtual_list.tag_configure('projectname', font=('Arial', 12, 'bold'))
+        self.virtual_list.tag_configure('concluded', foreground='green')
+
+    @staticmethod
+    def project_row(project: Project) -> TreeRow:
+        """ The row of a project in the tree view.
+
+        A project whose tasks are still in the database is shown closed, with a
+        placeholder row; its tasks are loaded when it is opened.
+
+        Args:
+            project (Project): The project.
+
+        Returns:
+            TreeRow: The row of the project.
+        """
+        tags = ('projectname', 'concluded') if project.status else ('projectname',)
+        text = f'{project.name} - Concluído' if project.status else project.name
+        iid = ProjectList.project_iid(project)
+        if project.deferred_tasks is not None:
+            return TreeRow(iid, text, tags + ('deferred',), open=False)
+        return TreeRow(iid, text, tags, open=True)
+
+    @staticmethod
+    def task_rows(project: Project) -> list:
+        """ The rows under a project: its open tasks, or a placeholder while they are
+        still in the database.
+
+        Args:
+            project (Project): The project.
+
+        Returns:
+            list: The rows under the project's row.
+        """
+        if project.deferred_tasks is not None:
+            return [TreeRow(f'more-{project.id_project}', '...')]
+        return [TreeRow(f'task-{task.id_task}', task.name)
+                for task in project.tasks if not task.status and task.id_task is not None]
+
+    # pylint: disable=unused-argument
+    def on_open(self, event: object) -> None:
+        """ Load the tasks of a deferred project when its row is opened.
+
+        Parameters:
+            event: The event object containing details of the open event.
+        """
+        item_id = self.tree.focus()
+        if 'deferred' not in self.tree.item(item_id, 'tags'):
+            return
+        project = self.project_of(item_id)
+        if project:
+            prefetch_tasks([project])
+            self.update_main_page()
 
     def apply_label_filter(self, selected_labels):
         """
-        Apply a label filter to the project list.
+        Apply a label filter to the project list: the projects of the selected labels
+        are read from the user's label index.
 
         Parameters:
             selected_labels (list): A list of labels to filter by.
         """
-        filtered_projects = [project for project in self.user.projects\
-                     if project.label in selected_labels]
+        filtered_projects = self.user.views.label_index.projects(*selected_labels)
         self.filtered_projects = filtered_projects
         self.update_project_list(filtered_projects)
 
+    def apply_search(self, text: str) -> list:
+        """
+        Show the projects whose name or description, or one of whose tasks or subtasks,
+        matches a text, the most relevant first.
+
+        Parameters:
+            text (str): The text searched.
+
+        Returns:
+            list: The projects shown.
+        """
+        projects, seen = [], set()
+        for result in self.user.views.search_index.search(text, limit=SEARCH_RESULTS):
+            project = project_of(result.item)
+            if id(project) not in seen:
+                seen.add(id(project))
+                projects.append(project)
+        self.apply_filter(projects)
+        return projects
+
     def remove_filter(self):
         """
         Remove any filters applied to the project list.
@@ -324,6 +507,20 @@ class HomePage(tk.Frame):
         self.project_list.remove_filter()
         tk.messagebox.showinfo("Filtro Removido", "Todos os projetos estão agora visíveis.")
 
+    def search_projects(self, text: str) -> None:
+        """
+        Filter the project list by a search of the names and descriptions of the
+        projects, tasks and subtasks. An empty search removes the filter.
+
+        Parameters:
+            text (str): The text searched.
+        """
+        if not text.strip():
+            self.project_list.remove_filter()
+            return
+        if not self.project_list.apply_search(text):
+            tk.messagebox.showinfo("Busca", "Nenhum projeto, tarefa ou subtarefa encontrado.")
+
     def show_home_page(self) -> None:
         """
         Display the home page layout.
@@ -428,6 +625,8 @@ class HomePage(tk.Frame):
             self.show_label_filter_page()
         if destination == 'remove_filter':
             self.remove_project_filter()
+        if destination == 'search':
+            self.search_projects(self.top_bar.search_text.get())
 
     def show_notification_page(self) -> None:
         """ Display the notification page layout.
@@ -264,11 +264,15 @@ class LabelManager(tk.Toplevel):
     """
     def update_label_list(self) -> None:
         """
-        Updates the list of labels displayed in the interface.
+        Updates the list of labels displayed in the interface, with the number of
+        projects and tasks of each label.
         """
         self.label_list.delete(0, tk.END)
+        index = self.user.views.label_index
         for label in self.user.labels:
-            label_text = f"{label.name} (Color: {label.color})"
+            label_text = f"{label.name} (Color: {label.color}) - "\
+                         f"{index.project_count(label)} projetos, "\
+                         f"{index.task_count(label)} tarefas"
             self.label_list.insert(tk.END, label_text)
 
     def center_window(self, width:int, height:int) -> None:
@@ -102,8 +102,8 @@ class LoadPage(tk.Toplevel):
             return
 
         try:
+            # The project list refreshes itself from the change events of the import
             FileAdapter.read_file(self.user, self.file_path)
-            self.controller.update_main_page()
             messagebox.showinfo("Sucesso", "Arquivo carregado com sucesso!")
             self.destroy()
         except FileNotFoundError as _:
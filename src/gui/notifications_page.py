@@ -12,6 +12,7 @@ such as urgent tasks, tasks due for today, and tasks with notifications for the
 import tkinter as tk
 from tkinter import ttk
 from src.logic.notifications.notification import Notification
+from src.logic.authentication.hydration import prefetch_tasks
 
 class NotificationPage(tk.Frame):
     """This class creates a Tkinter interface to display notifications.
@@ -45,6 +46,7 @@ class NotificationPage(tk.Frame):
     def create_widgets(self) -> None:
         """ This method will be used to create the widgets.
         """
+        prefetch_tasks(self.user.projects)
         notfi = Notification(self.user)
         notfi.check_notification_date()
         notfi.check_due_date()
@@ -113,8 +113,9 @@ class ProjectDisplayManager(BaseDisplayManager):
 
     def refresh_parent_page(self) -> None:
         """ Refreshes the parent page.
+
+        The project list follows the change events of the user and refreshes itself.
         """
-        self.home.update_main_page()
 
     def refrash_page(self) -> None:
         """ Refreshes the page.
@@ -0,0 +1,190 @@
+"""
+Module Name: Row Model
+
+Description:
+This module contains the RowModel class, the flat list of rows shown by the virtual
+project list of the home page: each project, followed by its open tasks while it is
+expanded.
+
+The model does not build a row per task. It keeps the start index of each project in
+the flat list, so finding the row at an index is a binary search, and only the rows in
+the visible window are ever built. The open tasks of a project are listed when it is
+expanded; a project whose tasks are still in the database is shown collapsed and its
+tasks are loaded the first time it is expanded.
+
+Classes:
+- Row: One row of the list.
+- RowModel: The flat list of the rows of a list of projects.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from src.logic.authentication.hydration import prefetch_tasks
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+
+
+class Row(NamedTuple):
+    """ One row of the list.
+
+    Attributes:
+        text (str): Text of the row.
+        tags (Tuple[str, ...]): Style tags of the row ('projectname', 'concluded').
+        project (Project): The project of the row.
+        task (Task): The task of the row, None for the row of a project.
+        expanded (bool): For a project, whether its tasks are shown.
+    """
+    text: str
+    tags: Tuple[str, ...]
+    project: Project
+    task: Task = None
+    expanded: bool = False
+
+    @property
+    def depth(self) -> int:
+        """int: 0 for a project, 1 for a task."""
+        return 0 if self.task is None else 1
+
+
+class RowModel:
+    """ The flat list of the rows of a list of projects.
+
+    Attributes:
+        _projects (List[Project]): The projects shown, in order.
+        _collapsed (set): Ids of the loaded projects collapsed by the user.
+        _expanded (set): Ids of the deferred projects expanded by the user.
+        _tasks (Dict[int, List[Task]]): The open tasks of each expanded project.
+        _starts (List[int]): Index of the row of each project.
+        _length (int): Number of rows.
+    """
+    def __init__(self, projects: Iterable[Project] = ()) -> None:
+        """ Create the model of a list of projects.
+
+        Args:
+            projects (Iterable[Project], optional): The projects shown. Defaults to none.
+        """
+        self._projects: List[Project] = []
+        self._collapsed = set()
+        self._expanded = set()
+        self._tasks: Dict[int, List[Task]] = {}
+        self._starts: List[int] = []
+        self._length = 0
+        self.set_projects(projects)
+
+    def set_projects(self, projects: Iterable[Project]) -> None:
+        """ Show another list of projects, or the same one after a change.
+
+        Args:
+            projects (Iterable[Project]): The projects shown, in order.
+        """
+        self._projects = list(projects)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """ Recompute the rows after a change of the projects or their tasks.
+        """
+        self._tasks = {}
+        self._starts = []
+        index = 0
+        for project in self._projects:
+            self._starts.append(index)
+            index += 1
+            if self.is_expanded(project):
+                tasks = [task for task in project.tasks if not task.status]
+                self._tasks[id(project)] = tasks
+                index += len(tasks)
+        self._length = index
+
+    def is_expanded(self, project: Project) -> bool:
+        """ Check whether the tasks of a project are shown.
+
+        Loaded projects are expanded and deferred ones collapsed, until the user
+        toggles them.
+
+        Args:
+            project (Project): The project.
+
+        Returns:
+            bool: True if the open tasks of the project follow its row.
+        """
+        if project.deferred_tasks is not None:
+            return project.id_project in self._expanded
+        return project.id_project not in self._collapsed
+
+    def toggle(self, index: int) -> bool:
+        """ Expand or collapse the project of a row, loading its tasks if needed.
+
+        Args:
+            index (int): The index of the row of a project.
+
+        Returns:
+            bool: True if the row was a project row, False for a task row.
+        """
+        row = self.row(index)
+        if row.task is not None:
+            return False
+        project = row.project
+        if row.expanded:
+            self._expanded.discard(project.id_project)
+            self._collapsed.add(project.id_project)
+        else:
+            self._collapsed.discard(project.id_project)
+            self._expanded.add(project.id_project)
+            prefetch_tasks([project])
+        self.refresh()
+        return True
+
+    def row(self, index: int) -> Row:
+        """ Build the row at an index.
+
+        Args:
+            index (int): The index, from 0 to len(model) - 1.
+
+        Returns:
+            Row: The row.
+
+        Raises:
+            IndexError: If the index is out of the list.
+        """
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        position = bisect_right(self._starts, index) - 1
+        project = self._projects[position]
+        offset = index - self._starts[position]
+        if offset == 0:
+            tags = ('projectname', 'concluded') if project.status else ('projectname',)
+            text = f'{project.name} - Concluído' if project.status else project.name
+            return Row(text, tags, project, expanded=id(project) in self._tasks)
+        task = self._tasks[id(project)][offset - 1]
+        return Row(task.name, (), project, task)
+
+    def window(self, start: int, count: int) -> List[Row]:
+        """ Build the rows of a window of the list.
+
+        Args:
+            start (int): Index of the first row.
+            count (int): Number of rows wanted.
+
+        Returns:
+            List[Row]: The rows from `start`, fewer at the end of the list.
+        """
+        start = max(start, 0)
+        return [self.row(index) for index in range(start, min(start + count, self._length))]
+
+    def index_of(self, project: Project) -> int:
+        """ Return the index of the row of a project.
+
+        Args:
+            project (Project): The project.
+
+        Returns:
+            int: The index of its row, or -1 if it is not shown.
+        """
+        for position, each in enumerate(self._projects):
+            if each is project:
+                return self._starts[position]
+        return -1
+
+    def __len__(self) -> int:
+        return self._length
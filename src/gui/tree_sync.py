@@ -0,0 +1,122 @@
+"""
+Module Name: Tree Sync
+
+Description:
+This module contains the TreeSync class, which keeps the rows of a ttk.Treeview in
+line with a model by applying only the differences.
+
+Rebuilding a tree (`delete(*get_children())` then inserting every row again) costs
+Tcl calls for every row, after every edit and every filter change. TreeSync gives each
+model item a stable iid and remembers the text and tags it last wrote for it: syncing
+the children of a row then deletes the rows that are gone, inserts the new ones, moves
+the ones whose position changed and reconfigures only the rows whose text or tags
+changed. Rows that did not change cost no Tcl call.
+
+Classes:
+- TreeRow: The wanted state of one row.
+- TreeSync: Applies the difference between the wanted rows and the tree.
+"""
+
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+
+class TreeRow(NamedTuple):
+    """ The wanted state of one row.
+
+    Attributes:
+        iid (str): Stable id of the row, derived from the id of its item.
+        text (str): Text of the row.
+        tags (Tuple[str, ...]): Tags of the row.
+        open (bool): Whether the row is open when it is inserted. An existing row keeps
+            the state chosen by the user.
+    """
+    iid: str
+    text: str
+    tags: Tuple[str, ...] = ()
+    open: bool = False
+
+
+class TreeSync:
+    """ Applies the difference between the wanted rows and a ttk.Treeview.
+
+    Attributes:
+        tree (ttk.Treeview): The tree.
+        _rows (Dict[str, Tuple[str, Tuple[str, ...]]]): Text and tags written for each
+            row in the tree, by iid.
+        _parents (Dict[str, str]): The parent of each row in the tree, by iid.
+        _children (Dict[str, List[str]]): The children of each synced row, in order.
+    """
+    def __init__(self, tree: object) -> None:
+        """ Follow a tree, which must only be changed through this object.
+
+        Args:
+            tree (ttk.Treeview): The tree.
+        """
+        self.tree = tree
+        self._rows: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        self._parents: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+
+    def __contains__(self, iid: str) -> bool:
+        return iid in self._rows
+
+    def children(self, parent: str = '') -> List[str]:
+        """ Return the rows under a row, in order.
+
+        Args:
+            parent (str, optional): The row. Defaults to the root of the tree.
+
+        Returns:
+            List[str]: The iids of the children.
+        """
+        return list(self._children.get(parent, ()))
+
+    def sync(self, parent: str, rows: Sequence[TreeRow]) -> None:
+        """ Make the children of a row match the wanted rows.
+
+        Args:
+            parent (str): The row, '' for the root of the tree.
+            rows (Sequence[TreeRow]): The wanted children, in order.
+        """
+        wanted = {row.iid for row in rows}
+        current = self._children.setdefault(parent, [])
+        stale = [iid for iid in current if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                self._forget(iid)
+            current[:] = [iid for iid in current if iid in wanted]
+
+        for index, row in enumerate(rows):
+            state = (row.text, tuple(row.tags))
+            if row.iid not in self._rows:
+                self.tree.insert(parent, index, iid=row.iid, text=row.text,
+                                 tags=state[1], open=row.open)
+                self._rows[row.iid] = state
+                self._parents[row.iid] = parent
+                current.insert(index, row.iid)
+                continue
+            if index >= len(current) or current[index] != row.iid:
+                self.tree.move(row.iid, parent, index)
+                self._children[self._parents[row.iid]].remove(row.iid)
+                self._parents[row.iid] = parent
+                current.insert(index, row.iid)
+            if self._rows[row.iid] != state:
+                self.tree.item(row.iid, text=row.text, tags=state[1])
+                self._rows[row.iid] = state
+
+    def clear(self) -> None:
+        """ Delete every row of the tree.
+        """
+        top = self._children.get('', [])
+        if top:
+            self.tree.delete(*top)
+        self._rows.clear()
+        self._parents.clear()
+        self._children.clear()
+
+    def _forget(self, iid: str) -> None:
+        self._rows.pop(iid, None)
+        self._parents.pop(iid, None)
+        for child in self._children.pop(iid, ()):
+            self._forget(child)
@@ -0,0 +1,195 @@
+"""
+Module Name: Virtual List
+
+Description:
+This module contains the VirtualList class, a scrollable list that draws only the rows
+in view of a RowModel.
+
+A ttk.Treeview keeps a row in Tk for every project and task, so accounts with tens of
+thousands of them are slow to show and to scroll. VirtualList keeps the rows in the
+model and draws on a canvas only the few that fit in the window; scrolling moves the
+window over the model and draws it again. Project rows are expanded and collapsed by a
+click on their arrow, and a double click on a row opens its project.
+
+Classes:
+- VirtualList: A list drawing the visible window of a RowModel.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+from src.gui.row_model import RowModel
+from src.logic.items.project import Project
+
+# Horizontal room taken by the arrow of a project and by each level of indentation.
+INDENT = 20
+
+
+class VirtualList(tk.Frame):
+    """ A list drawing only the rows in view of a RowModel.
+
+    Attributes:
+        model (RowModel): The rows of the list.
+        on_activate (Callable[[Project], None]): Called with the project of a row
+            double-clicked.
+        row_height (int): Height of a row, in pixels.
+        font (tuple): Font of the rows without a font tag.
+        canvas (tk.Canvas): The canvas the rows are drawn on.
+        scrollbar (ttk.Scrollbar): The vertical scrollbar.
+        top (int): Index of the first row in view.
+        selected (int): Index of the selected row, or None.
+        _styles (dict): Font and foreground of each tag.
+    """
+    def __init__(self, parent: tk.Widget, model: RowModel,
+                 on_activate: Callable[[Project], None], row_height: int = 25,
+                 font: tuple = ('Arial', 12), bg_color: str = '#ffffff') -> None:
+        """ Create the list.
+
+        Parameters:
+            parent (tk.Widget): The parent widget.
+            model (RowModel): The rows of the list.
+            on_activate (Callable[[Project], None]): Called with the project of a row
+                double-clicked.
+            row_height (int, optional): Height of a row, in pixels. Defaults to 25.
+            font (tuple, optional): Font of the rows. Defaults to ('Arial', 12).
+            bg_color (str, optional): Background color. Defaults to '#ffffff'.
+        """
+        super().__init__(parent, bg=bg_color)
+        self.model = model
+        self.on_activate = on_activate
+        self.row_height = row_height
+        self.font = font
+        self.top = 0
+        self.selected = None
+        self._styles = {}
+
+        self.canvas = tk.Canvas(self, bg=bg_color, highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind('<Configure>', lambda event: self.redraw())
+        self.canvas.bind('<Button-1>', self.on_click)
+        self.canvas.bind('<Double-1>', self.on_double_click)
+        self.canvas.bind('<MouseWheel>', self.on_wheel)
+        self.canvas.bind('<Button-4>', lambda event: self.yview('scroll', -3, 'units'))
+        self.canvas.bind('<Button-5>', lambda event: self.yview('scroll', 3, 'units'))
+
+    def tag_configure(self, tag: str, font: tuple = None, foreground: str = None) -> None:
+        """ Set the style of the rows with a tag, as ttk.Treeview.tag_configure does.
+
+        Parameters:
+            tag (str): The tag.
+            font (tuple, optional): Font of the rows. Defaults to the list's font.
+            foreground (str, optional): Color of the text. Defaults to black.
+        """
+        self._styles[tag] = {'font': font, 'fill': foreground}
+        self.redraw()
+
+    @property
+    def visible_rows(self) -> int:
+        """int: The number of rows that fit in the canvas."""
+        return max(self.canvas.winfo_height() // self.row_height, 1)
+
+    def refresh(self) -> None:
+        """ Draw the list again after a change of the model.
+        """
+        if self.selected is not None and self.selected >= len(self.model):
+            self.selected = None
+        self.scroll_to(self.top)
+
+    def scroll_to(self, top: int) -> None:
+        """ Move the window to start at a row, within the list.
+
+        Parameters:
+            top (int): Index of the first row to show.
+        """
+        self.top = max(0, min(top, len(self.model) - self.visible_rows))
+        self.redraw()
+
+    def yview(self, *args) -> None:
+        """ Scroll the list, with the arguments of a scrollbar's command.
+
+        Parameters:
+            *args: ('moveto', fraction) or ('scroll', number, 'units' | 'pages').
+        """
+        if args[0] == 'moveto':
+            self.scroll_to(round(float(args[1]) * len(self.model)))
+        elif args[0] == 'scroll':
+            step = self.visible_rows if args[2] == 'pages' else 1
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def redraw(self) -> None:
+        """ Draw the rows in view and update the scrollbar.
+        """
+        self.canvas.delete('row')
+        width = self.canvas.winfo_width()
+        count = self.visible_rows + 1
+        for offset, row in enumerate(self.model.window(self.top, count)):
+            y_top = offset * self.row_height
+            if self.top + offset == self.selected:
+                self.canvas.create_rectangle(0, y_top, width, y_top + self.row_height,
+                                             fill='#cce4f7', width=0, tags='row')
+            style = {'font': self.font, 'fill': 'black'}
+            for tag in row.tags:
+                style.update({key: value for key, value in self._styles.get(tag, {}).items()
+                              if value is not None})
+            x_text = INDENT * (row.depth + 1)
+            if row.task is None:
+                self.canvas.create_text(INDENT // 2, y_top + self.row_height // 2,
+                                        text='▾' if row.expanded else '▸',
+                                        font=self.font, tags='row')
+            self.canvas.create_text(x_text, y_top + self.row_height // 2, anchor='w',
+                                    text=row.text, tags='row', **style)
+
+        total = len(self.model)
+        if total:
+            self.scrollbar.set(self.top / total, min((self.top + count - 1) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def index_at(self, y_position: int) -> int:
+        """ Return the index of the row at a height of the canvas.
+
+        Parameters:
+            y_position (int): The height, in pixels from the top of the canvas.
+
+        Returns:
+            int: The index of the row, or None below the last row.
+        """
+        index = self.top + y_position // self.row_height
+        return index if index < len(self.model) else None
+
+    def on_click(self, event: object) -> None:
+        """ Select the row clicked, and expand or collapse a project on its arrow.
+
+        Parameters:
+            event: The event object containing details of the click event.
+        """
+        index = self.index_at(event.y)
+        self.selected = index
+        if index is not None and event.x < INDENT and self.model.toggle(index):
+            self.refresh()
+        else:
+            self.redraw()
+
+    def on_double_click(self, event: object) -> None:
+        """ Open the project of the row double-clicked.
+
+        Parameters:
+            event: The event object containing details of the double-click event.
+        """
+        index = self.index_at(event.y)
+        if index is not None:
+            self.on_activate(self.model.row(index).project)
+
+    def on_wheel(self, event: object) -> None:
+        """ Scroll the list with the mouse wheel.
+
+        Parameters:
+            event: The event object containing details of the wheel event.
+        """
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
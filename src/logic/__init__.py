@@ -17,6 +17,7 @@ from .items.label import Label
 
 from .users.user import User
 from .users.user_interface import IUser
+from .users.user_context import UserContext, UserContexts
 
 from .execeptions.exceptions_items import  ItemNameBlank,\
                                             ItemNameAlreadyExists,\
@@ -24,5 +25,5 @@ from .execeptions.exceptions_items import  ItemNameBlank,\
                                             NonChangeableProperty,\
                                             ItemDontHaveThisAttribute
 
-from .history.task_history import HistorySingleton
+from .history.task_history import HistorySingleton, TaskHistory
 from .notifications.notification import Notification
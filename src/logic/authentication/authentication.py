@@ -7,42 +7,49 @@ from src.logic.items.project import Project
 from src.logic.items.task import Task
 from src.logic.items.subtask import Subtask
 from src.logic.items.label import Label
-from sqlalchemy.orm import sessionmaker
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.users.user_context import UserContext
 
 db = Database()
 
-SessionLocal = sessionmaker(bind=db.engine) # pylint: disable=no-member
+# Every login shares the engine and connection pool of the process.
+SessionLocal = db.session_factory # pylint: disable=no-member
 
-def instance_user(db_user):
+def instance_user(db_user, session=None, unit_of_work=None, lazy=None):
     """
     Converts a UserORM instance into a User instance, along with associated projects, tasks, subtasks, and labels.
 
+    When a session is given, the whole graph is loaded with a constant number of batched
+    queries (see `hydrate_user`). Otherwise the lazy relationships of `db_user` are walked,
+    which costs one query per project and one per task.
+
     Parameters:
         db_user (UserORM): An instance of UserORM representing a user in the database.
+        session (Session, optional): Session used for the eager, batched hydration.
+        unit_of_work (UnitOfWork, optional): Unit of work shared by the user and its items.
+        lazy (bool, optional): With a session, load the tasks of each project on first use
+            (see `hydrate_user`). Defaults to the LAZY_HYDRATION environment variable.
 
     Returns:
         User: An instance of the User class, populated with data from the UserORM instance, including associated projects, tasks, subtasks, and labels.
     """
     print(f'Creating user instance from {db_user.name}')
-    user = User(db_user.name, id_user=db_user.id_user)
+    if session is not None:
+        return hydrate_user(db_user, session, unit_of_work, lazy)
+
+    user = User(db_user.name, id_user=db_user.id_user, unit_of_work=unit_of_work)
     db_projects = db_user.projects
     db_labes = db_user.labels
-    list_labels = []
 
     for db_label in db_labes:
-        label = Label(  user = user,
-                        name = db_label.name,
-                        id_label = db_label.id_label,
-                        color = db_label.color)
-        list_labels.append(label)
+        Label(  user = user,
+                name = db_label.name,
+                id_label = db_label.id_label,
+                color = db_label.color)
     
         
     for db_project in db_projects:
-        label = None
-        for each_label in list_labels:
-            if each_label.id_label == db_project.id_label:
-                 label = each_label
-                 break
+        label = user.identity_map.get_label(db_project.id_label)
         
         project = Project(user = user,
                               name=db_project.name,
@@ -102,8 +109,7 @@ class LoginLogic:
 
                 # Check if user exists with the given username and password
                 if user is not None:
-                    user_instance = instance_user(user)
-                    return user_instance
+                    return UserContext.open(user, session, SessionLocal).user
                 return None
         except Exception as e:
             print(f"An error occurred: {e}")
@@ -139,9 +145,8 @@ class RegisterLogic:
                 new_user = UserORM(name=username, password=password, email=email)
                 session.add(new_user)
                 session.commit()
-                new_user_intance = instance_user(new_user)
                 # Return the new user
-                return new_user_intance
+                return UserContext.open(new_user, session, SessionLocal).user
         except SQLAlchemyError as e:
             print(f"Database error occurred: {e}")
             return None
@@ -0,0 +1,257 @@
+"""
+Module Name: User Hydration
+
+Description:
+This module loads the whole object graph of a user (labels, projects, tasks and
+subtasks) with a constant number of queries and turns it into the domain objects
+used by the application.
+
+The lazy relationships of the ORM models (`UserORM.projects`, `ProjectORM.tasks`,
+`TaskORM.subtasks`) issue one SELECT per parent row, so hydrating an account with
+thousands of tasks costs thousands of round trips. Here every level of the graph
+is fetched with a single query filtered by the user id, and the rows are grouped
+by their parent id in memory. Labels are found through the user's identity map.
+
+In lazy mode (`lazy=True`, or the LAZY_HYDRATION environment variable) only the labels
+and projects are read at login. Each project keeps a TaskLoader and reads its tasks and
+subtasks, with a single query, the first time they are needed. `prefetch_tasks` loads
+several projects with one query, for screens about to show them.
+
+Classes:
+- UserGraph: Rows of a user's graph, grouped by parent id.
+- TaskLoader: Loads the tasks and subtasks of deferred projects.
+
+Functions:
+- fetch_user_graph(session, id_user, with_tasks): Runs the batched queries of a user graph.
+- hydrate_user(db_user, session, unit_of_work, lazy): Builds a User, with its items, from
+  the database.
+- prefetch_tasks(projects): Loads the tasks of the deferred projects among `projects`.
+"""
+
+import os
+from collections import defaultdict
+from functools import partial
+from typing import Callable, Dict, Iterable, List
+from sqlalchemy.orm import Session
+
+from src.logic.orms.orm import LabelORM, ProjectORM, TaskORM, SubtaskORM
+from src.logic.users.user import User
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+from src.logic.items.subtask import Subtask
+from src.logic.items.label import Label
+from src.db.database import TRUE_VALUES
+from src.db.unit_of_work import UnitOfWork
+
+LAZY_HYDRATION = os.environ.get('LAZY_HYDRATION', 'false').lower() in TRUE_VALUES
+
+
+class UserGraph:
+    """ Rows of a user's object graph, grouped by the id of their parent.
+
+    Attributes:
+        labels (List[LabelORM]): Labels of the user.
+        projects (List[ProjectORM]): Projects of the user.
+        tasks_by_project (Dict[int, List[TaskORM]]): Tasks grouped by project id.
+        subtasks_by_task (Dict[int, List[SubtaskORM]]): Subtasks grouped by task id.
+    """
+    def __init__(self, labels: List[LabelORM], projects: List[ProjectORM],
+                 tasks: List[TaskORM], subtasks: List[SubtaskORM]) -> None:
+        self.labels = labels
+        self.projects = projects
+        self.tasks_by_project: Dict[int, List[TaskORM]] = defaultdict(list)
+        self.subtasks_by_task: Dict[int, List[SubtaskORM]] = defaultdict(list)
+
+        for db_task in tasks:
+            self.tasks_by_project[db_task.id_project].append(db_task)
+        for db_subtask in subtasks:
+            self.subtasks_by_task[db_subtask.id_task].append(db_subtask)
+
+
+def fetch_user_graph(session: Session, id_user: int, with_tasks: bool = True) -> UserGraph:
+    """ Fetch every label, project, task and subtask of a user.
+
+    Exactly four queries are issued, whatever the size of the account (two without the
+    tasks). Tasks and subtasks are selected through joins on their parents instead of
+    `IN` lists, so the statements do not grow with the number of projects or tasks.
+
+    Args:
+        session (Session): Session used to run the queries.
+        id_user (int): Id of the user.
+        with_tasks (bool, optional): False to skip the tasks and subtasks. Defaults to True.
+
+    Returns:
+        UserGraph: The rows of the user's graph.
+    """
+    labels = session.query(LabelORM)\
+        .filter(LabelORM.id_user == id_user)\
+        .order_by(LabelORM.id_label).all()
+
+    projects = session.query(ProjectORM)\
+        .filter(ProjectORM.id_user == id_user)\
+        .order_by(ProjectORM.id_project).all()
+
+    if not with_tasks:
+        return UserGraph(labels, projects, [], [])
+
+    tasks = session.query(TaskORM)\
+        .join(ProjectORM, TaskORM.id_project == ProjectORM.id_project)\
+        .filter(ProjectORM.id_user == id_user)\
+        .order_by(TaskORM.id_task).all()
+
+    subtasks = session.query(SubtaskORM)\
+        .join(TaskORM, SubtaskORM.id_task == TaskORM.id_task)\
+        .join(ProjectORM, TaskORM.id_project == ProjectORM.id_project)\
+        .filter(ProjectORM.id_user == id_user)\
+        .order_by(SubtaskORM.id_subtask).all()
+
+    return UserGraph(labels, projects, tasks, subtasks)
+
+
+def hydrate_user(db_user: object, session: Session, unit_of_work: UnitOfWork = None,
+                 lazy: bool = None) -> User:
+    """ Build a User instance, with all of its items, using batched queries.
+
+    Args:
+        db_user (UserORM): The user row.
+        session (Session): Session used to fetch the user's graph.
+        unit_of_work (UnitOfWork, optional): Unit of work shared by the user and its items
+            afterwards. Defaults to one on the application's database.
+        lazy (bool, optional): Leave the tasks and subtasks in the database until each
+            project needs them. Defaults to the LAZY_HYDRATION environment variable.
+
+    Returns:
+        User: The user populated with its labels, projects, tasks and subtasks.
+    """
+    lazy = LAZY_HYDRATION if lazy is None else lazy
+    user = User(db_user.name, id_user=db_user.id_user, unit_of_work=unit_of_work)
+    graph = fetch_user_graph(session, db_user.id_user, with_tasks=not lazy)
+    loader = TaskLoader(user.unit_of_work, partial(_invalidate_results, user)) if lazy else None
+
+    for db_label in graph.labels:
+        Label(user=user,
+              name=db_label.name,
+              id_label=db_label.id_label,
+              color=db_label.color)
+
+    for db_project in graph.projects:
+        project = Project(user=user,
+                          name=db_project.name,
+                          id_project=db_project.id_project,
+                          id_label=db_project.id_label,
+                          label=user.identity_map.get_label(db_project.id_label),
+                          creation_date=db_project.creation_date,
+                          end_date=db_project.end_date,
+                          conclusion_date=db_project.conclusion_date,
+                          status=db_project.status,
+                          description=db_project.description)
+        if lazy:
+            project.defer_tasks(loader)
+            continue
+
+        for db_task in graph.tasks_by_project.get(db_project.id_project, []):
+            task = _build_task(project, db_task)
+            for db_subtask in graph.subtasks_by_task.get(db_task.id_task, []):
+                _build_subtask(task, db_subtask)
+
+    return user
+
+
+class TaskLoader:
+    """ Loads the tasks and subtasks of deferred projects.
+
+    Attributes:
+        _unit_of_work (UnitOfWork): Unit of work used to read the rows.
+        _loaded (Callable[[], None]): Called after tasks were loaded, or None.
+    """
+    def __init__(self, unit_of_work: UnitOfWork, loaded: Callable[[], None] = None) -> None:
+        self._unit_of_work = unit_of_work
+        self._loaded = loaded
+
+    def load(self, project: Project) -> None:
+        """ Load the tasks of a project deferred to this loader.
+
+        Args:
+            project (Project): The project.
+        """
+        self.prefetch([project])
+
+    def prefetch(self, projects: Iterable[Project]) -> None:
+        """ Load, with one query, the tasks of the projects deferred to this loader.
+
+        Tasks and subtasks are read together, the subtasks through an outer join.
+
+        Args:
+            projects (Iterable[Project]): The projects; those already loaded are skipped.
+        """
+        pending = {project.id_project: project for project in projects
+                   if project.deferred_tasks is self}
+        if not pending:
+            return
+        for project in pending.values():
+            project.defer_tasks(None)
+
+        with self._unit_of_work.begin() as session:
+            try:
+                rows = session.query(TaskORM, SubtaskORM)\
+                    .outerjoin(SubtaskORM, SubtaskORM.id_task == TaskORM.id_task)\
+                    .filter(TaskORM.id_project.in_(list(pending)))\
+                    .order_by(TaskORM.id_task, SubtaskORM.id_subtask).all()
+            except Exception:
+                for project in pending.values():
+                    project.defer_tasks(self)
+                raise
+
+            task = None
+            for db_task, db_subtask in rows:
+                if task is None or task.id_task != db_task.id_task:
+                    task = _build_task(pending[db_task.id_project], db_task)
+                if db_subtask is not None:
+                    _build_subtask(task, db_subtask)
+        if self._loaded is not None:
+            self._loaded()
+
+
+def prefetch_tasks(projects: Iterable[Project]) -> None:
+    """ Load the tasks of the deferred projects among `projects`, one query per loader.
+
+    Projects that are already loaded are skipped, so screens can call it before showing
+    any list of projects.
+
+    Args:
+        projects (Iterable[Project]): The projects about to be used.
+    """
+    loaders = {}
+    for project in projects:
+        loader = project.deferred_tasks
+        if loader is not None:
+            loaders.setdefault(id(loader), (loader, []))[1].append(project)
+    for loader, pending in loaders.values():
+        loader.prefetch(pending)
+
+
+def _invalidate_results(user: User) -> None:
+    # The results cached before the load may have left the loaded tasks out.
+    if user.views.built('result_cache'):
+        user.views.result_cache.invalidate()
+
+
+def _build_task(project: Project, db_task: TaskORM) -> Task:
+    return Task(project=project,
+                name=db_task.name,
+                id_task=db_task.id_task,
+                status=db_task.status,
+                priority=db_task.priority,
+                creation_date=db_task.creation_date,
+                end_date=db_task.end_date,
+                notification_date=db_task.notification_date,
+                conclusion_date=db_task.conclusion_date,
+                description=db_task.description)
+
+
+def _build_subtask(task: Task, db_subtask: SubtaskORM) -> Subtask:
+    return Subtask(task=task,
+                   name=db_subtask.name,
+                   id_subtask=db_subtask.id_subtask,
+                   status=db_subtask.status,
+                   conclusion_date=db_subtask.conclusion_date)
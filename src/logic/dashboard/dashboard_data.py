@@ -5,6 +5,8 @@ Module providing a DashboardData class for analyzing task-related metrics.
 analysis of various task-related metrics based on user projects. It includes 
 methods to retrieve statistics such as the total number of tasks, completed tasks
 by weekday, tasks ending on time, late tasks, tasks created in specific time frames, and more.
+The numbers are counted with the vectorized predicates and group-bys of the user's task
+snapshot (src.logic.filter.task_snapshot) instead of loops over the tasks.
 
 Usage:
     - Initialize the DashboardData class by providing a user object containing project
@@ -33,8 +35,11 @@ Example:
 """
 
 import datetime
+import numpy as np
 import pandas as pd
 from src.logic.filter.filter import Filter
+from src.logic.filter.task_snapshot import TaskSnapshot
+from src.logic.users.result_cache import cached
 
 class DashboardData:
     """ Dashboard data class
@@ -47,6 +52,7 @@ class DashboardData:
         """
         self.user = user
         self.projects = user.projects
+        self.project_name = 'Todos'
         self.filter = Filter(user)
 
     def update_data(self, project_name='Todos') -> None:
@@ -55,30 +61,77 @@ class DashboardData:
         Args:
             project_name (str, optional): Project name. Defaults to 'Todos'.
         """
+        self.project_name = project_name
         if project_name == 'Todos':
             self.projects = self.user.projects
         else:
             self.projects = [self.filter.filter_project_by_name(project_name)]
 
+    @property
+    def cache_scope(self) -> str:
+        """ The project shown, part of the key of the results in the user's result cache
+        """
+        return self.project_name
+
+    @property
+    def snapshot(self) -> TaskSnapshot:
+        """ The user's tasks in NumPy columns, read by the getters
+        """
+        return self.user.views.task_snapshot
+
+    def scope(self) -> np.ndarray:
+        """ The rows of the snapshot of the tasks of the projects shown
+
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        if self.projects is self.user.projects:
+            return self.snapshot.alive()
+        return self.snapshot.in_projects(self.projects)
+
+    def count_pending(self, mask: np.ndarray) -> int:
+        """ Count the tasks not done among the rows of a mask, in the projects shown
+
+        Args:
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            int: Number of tasks
+        """
+        return self.snapshot.count(mask & self.scope() & self.snapshot.where(status=False))
+
+    def count_by_weeks(self, days: np.ndarray, mask: np.ndarray) -> dict:
+        """ Count the rows of a mask by weeks of a number of days
+
+        Args:
+            days (np.ndarray): Days of every row
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            dict: Every bucket of weeks with its number of tasks
+        """
+        counts = self.snapshot.count_by_bucket(days, (7, 14, 21), mask)
+        return dict(zip(('até 1', '1 a 2', '2 a 3', '3+'), counts.tolist()))
+
+    @cached
     def get_number_of_tasks(self) -> int:
         """ Get the number of tasks
 
         Returns:
             int: Number of tasks
         """
-        tasks = []
-        for project in self.projects:
-            tasks += project.tasks
-        return len(tasks)
+        return self.snapshot.count(self.scope())
 
+    @cached
     def get_number_of_done_tasks(self) -> int:
         """ Get the number of done tasks
 
         Returns:
             int: Number of done tasks
         """
-        return len(self.filter.filter_tasks_by_status(self.projects, True))
+        return self.snapshot.count(self.scope() & self.snapshot.where(status=True))
 
+    @cached
     def get_number_of_on_time_tasks(self) -> int:
         """ Get the number of tasks that will end on time
 
@@ -86,9 +139,9 @@ class DashboardData:
             int: Number of tasks that will end on time
         """
         today = datetime.datetime.today().date()
-        on_time = self.filter.filter_tasks_by_end_date(self.projects, upper_limit=today)
-        return len([task for task in on_time if not task.status])
+        return self.count_pending(self.snapshot.between('end_date', upper=today))
 
+    @cached
     def get_number_of_for_today_tasks(self) -> int:
         """ Get the number of tasks that will end today
 
@@ -96,9 +149,9 @@ class DashboardData:
             int: Number of tasks that will end today
         """
         today = datetime.datetime.today().date()
-        end_today_tasks = self.filter.filter_tasks_by_end_date(self.projects, today, today)
-        return len([task for task in end_today_tasks if not task.status])
+        return self.count_pending(self.snapshot.between('end_date', today, today))
 
+    @cached
     def get_number_of_late_tasks(self) -> int:
         """ Get the number of late tasks
 
@@ -106,8 +159,7 @@ class DashboardData:
             int: Number of late tasks
         """
         yesterday = (datetime.datetime.today() - pd.DateOffset(days=1)).date()
-        late_tasks = self.filter.filter_tasks_by_end_date(self.projects, upper_limit=yesterday)
-        return len([task for task in late_tasks if not task.status])
+        return self.count_pending(self.snapshot.between('end_date', upper=yesterday))
 
     # pylint: disable=pointless-string-statement
     '''
@@ -156,30 +208,18 @@ class DashboardData:
                 data['3+'] += 1
         return data
     '''
+    @cached
     def get_timespan_of_tasks(self) -> dict:
         """ Get the number of tasks created in the last month
 
         Returns:
             dict: Every day of the last month with the number of tasks created on that day
         """
-        tasks = []
-        for project in self.projects:
-            for task in project.tasks:
-                if task.creation_date is not None and task.end_date is not None:
-                    tasks.append(task)
-        days_diffs = list(map(lambda x: (x.end_date - x.creation_date).days, tasks))
-        data = {'até 1': 0, '1 a 2': 0, '2 a 3': 0, '3+': 0}
-        for days_diff in days_diffs:
-            if days_diff <= 7:
-                data['até 1'] += 1
-            elif days_diff <= 14:
-                data['1 a 2'] += 1
-            elif days_diff <= 21:
-                data['2 a 3'] += 1
-            else:
-                data['3+'] += 1
-        return data
+        snapshot = self.snapshot
+        mask = self.scope() & snapshot.between('creation_date') & snapshot.between('end_date')
+        return self.count_by_weeks(snapshot.days_between('creation_date', 'end_date'), mask)
 
+    @cached
     def get_next_deadlines(self) -> dict:
         """ Get the number of tasks that will end in the next 7 days
 
@@ -187,20 +227,11 @@ class DashboardData:
             dict: Every day of the next 7 days with the number of tasks that will end on that day
         """
         today = datetime.datetime.today().date()
-        tasks = self.filter.filter_tasks_by_end_date(self.projects, today)
-        days_diffs = list(map(lambda x: (x.end_date - today).days, tasks))
-        data = {'até 1': 0, '1 a 2': 0, '2 a 3': 0, '3+': 0}
-        for days_diff in days_diffs:
-            if days_diff <= 7:
-                data['até 1'] += 1
-            elif days_diff <= 14:
-                data['1 a 2'] += 1
-            elif days_diff <= 21:
-                data['2 a 3'] += 1
-            else:
-                data['3+'] += 1
-        return data
+        snapshot = self.snapshot
+        mask = self.scope() & snapshot.between('end_date', lower=today)
+        return self.count_by_weeks(snapshot.days_between(today, 'end_date'), mask)
 
+    @cached
     def get_created_tasks(self) -> dict:
         """ Get the number of tasks created in the last month
 
@@ -214,36 +245,17 @@ class DashboardData:
         while day <= today:
             data[day.strftime('%d-%m-%Y')] = 0
             day = (day + pd.DateOffset(days=1)).date()
-        created_tasks = self.filter.filter_tasks_by_creation_date(self.projects, one_month_ago, today)
-        dates = [task.creation_date for task in created_tasks]
-        dates.sort()
-        dates = [date.strftime('%d-%m-%Y') for date in dates ]
-        for date in dates:
-            data[date] += 1
-        return data
+        counts = self.snapshot.count_by_day('creation_date', one_month_ago, today,
+                                            self.scope())
+        return dict(zip(data, counts.tolist()))
 
+    @cached
     def get_finished_by_weekday(self) -> dict:
         """ Get the number of tasks finished by weekday
 
         Returns:
             dict: Every weekday with the number of tasks finished on that day
         """
-        finished_tasks = self.filter.filter_tasks_by_status(self.projects, True)
-        week_days = list(map(lambda x: x.conclusion_date.weekday(), finished_tasks))
-        data = {'seg': 0, 'ter': 0, 'qua': 0, 'qui': 0, 'sex': 0, 'sab': 0, 'dom': 0}
-        for day in week_days:
-            if day == 0:
-                data['seg'] += 1
-            elif day == 1:
-                data['ter'] += 1
-            elif day == 2:
-                data['qua'] += 1
-            elif day == 3:
-                data['qui'] += 1
-            elif day == 4:
-                data['sex'] += 1
-            elif day == 5:
-                data['sab'] += 1
-            elif day == 6:
-                data['dom'] += 1
-        return data
+        mask = self.scope() & self.snapshot.where(status=True)
+        counts = self.snapshot.count_by_weekday('conclusion_date', mask)
+        return dict(zip(('seg', 'ter', 'qua', 'qui', 'sex', 'sab', 'dom'), counts.tolist()))
@@ -0,0 +1,268 @@
+"""
+Module providing SqlDashboardData, a DashboardData computed by the database.
+
+    DashboardData walks every task of the selected projects in memory, several times
+per dashboard. SqlDashboardData returns the same numbers and dictionaries, but asks the
+database for them with aggregate queries on `Task` joined to `Project`, filtered by
+user and, after `update_data`, by project:
+
+    - one query with SUM(CASE ...) columns for the counters (tasks, done, on time,
+      today, late) and the buckets of the timespan and deadline charts;
+    - one GROUP BY creation date for the tasks created in the last month;
+    - one GROUP BY conclusion date for the tasks finished by weekday.
+
+The counters are read once and kept until `update_data` or `refresh` is called, or the
+user's data changes, so drawing a dashboard costs three queries whatever the size of
+the account. Like DashboardData, every number and chart is also kept in the user's
+result cache, so drawing it again with unchanged data costs none. Pending
+write-behind updates are flushed first, so the numbers include them.
+
+Usage:
+    - Use create_dashboard_data(user) to get the provider fit for the account: the
+in-memory DashboardData for small accounts, SqlDashboardData for large ones.
+
+Example:
+    dashboard = create_dashboard_data(user)
+    late_tasks = dashboard.get_number_of_late_tasks()
+"""
+
+import datetime
+from typing import Any, Dict
+import pandas as pd
+from sqlalchemy import and_, case, func, select
+from src.logic.dashboard.dashboard_data import DashboardData
+from src.logic.orms.orm import ProjectORM, TaskORM
+from src.logic.users.result_cache import cached
+
+SQL_THRESHOLD = 2000
+BUCKETS = ('até 1', '1 a 2', '2 a 3', '3+')
+WEEKDAYS = ('seg', 'ter', 'qua', 'qui', 'sex', 'sab', 'dom')
+
+
+def create_dashboard_data(user: callable, threshold: int = SQL_THRESHOLD) -> DashboardData:
+    """ Create the dashboard data provider fit for the size of an account
+
+    Accounts whose tasks are still partly in the database (lazy hydration) are counted
+    by the database too, instead of being loaded for the count.
+
+    Args:
+        user (callable): User
+        threshold (int, optional): Number of tasks from which the database computes
+            the dashboard. Defaults to SQL_THRESHOLD.
+
+    Returns:
+        DashboardData: DashboardData or SqlDashboardData
+    """
+    if any(project.deferred_tasks is not None for project in user.projects):
+        return SqlDashboardData(user)
+    number_of_tasks = sum(len(project.tasks) for project in user.projects)
+    if number_of_tasks >= threshold:
+        return SqlDashboardData(user)
+    return DashboardData(user)
+
+
+class SqlDashboardData(DashboardData):
+    """ Dashboard data computed with aggregate queries
+    """
+    def __init__(self, user: callable, unit_of_work: object = None) -> None:
+        """ Initialize the class
+
+        Args:
+            user (callable): User
+            unit_of_work (UnitOfWork, optional): Unit of work running the queries.
+                Defaults to the user's.
+        """
+        super().__init__(user)
+        self._unit_of_work = unit_of_work or user.unit_of_work
+        self._project_name = None
+        self._counters = None
+        self._counters_version = None
+
+    def update_data(self, project_name='Todos') -> None:
+        """ Update the data
+
+        Args:
+            project_name (str, optional): Project name. Defaults to 'Todos'.
+        """
+        super().update_data(project_name)
+        self._project_name = None if project_name == 'Todos' else project_name
+        self.refresh()
+
+    def refresh(self) -> None:
+        """ Forget the counters read, so that the next number not found in the user's
+        result cache queries them again
+        """
+        self._counters = None
+
+    @cached
+    def get_number_of_tasks(self) -> int:
+        """ Get the number of tasks
+
+        Returns:
+            int: Number of tasks
+        """
+        return self._get_counters()['tasks']
+
+    @cached
+    def get_number_of_done_tasks(self) -> int:
+        """ Get the number of done tasks
+
+        Returns:
+            int: Number of done tasks
+        """
+        return self._get_counters()['done']
+
+    @cached
+    def get_number_of_on_time_tasks(self) -> int:
+        """ Get the number of tasks that will end on time
+
+        Returns:
+            int: Number of tasks that will end on time
+        """
+        return self._get_counters()['on_time']
+
+    @cached
+    def get_number_of_for_today_tasks(self) -> int:
+        """ Get the number of tasks that will end today
+
+        Returns:
+            int: Number of tasks that will end today
+        """
+        return self._get_counters()['today']
+
+    @cached
+    def get_number_of_late_tasks(self) -> int:
+        """ Get the number of late tasks
+
+        Returns:
+            int: Number of late tasks
+        """
+        return self._get_counters()['late']
+
+    @cached
+    def get_timespan_of_tasks(self) -> dict:
+        """ Get the number of tasks by weeks between creation and end date
+
+        Returns:
+            dict: Every bucket of weeks with its number of tasks
+        """
+        counters = self._get_counters()
+        return {bucket: counters[f'timespan {bucket}'] for bucket in BUCKETS}
+
+    @cached
+    def get_next_deadlines(self) -> dict:
+        """ Get the number of tasks by weeks until their end date
+
+        Returns:
+            dict: Every bucket of weeks with its number of tasks
+        """
+        counters = self._get_counters()
+        return {bucket: counters[f'deadline {bucket}'] for bucket in BUCKETS}
+
+    @cached
+    def get_created_tasks(self) -> dict:
+        """ Get the number of tasks created in the last month
+
+        Returns:
+            dict: Every day of the last month with the number of tasks created on that day
+        """
+        today = datetime.datetime.today().date()
+        one_month_ago = (datetime.datetime.today() - pd.DateOffset(days=30)).date()
+        data = {}
+        day = one_month_ago
+        while day <= today:
+            data[day.strftime('%d-%m-%Y')] = 0
+            day = (day + pd.DateOffset(days=1)).date()
+
+        statement = self._select(TaskORM.creation_date, func.count())\
+            .where(TaskORM.creation_date >= one_month_ago, TaskORM.creation_date <= today)\
+            .group_by(TaskORM.creation_date)
+        for creation_date, count in self._execute(statement):
+            data[creation_date.strftime('%d-%m-%Y')] += count
+        return data
+
+    @cached
+    def get_finished_by_weekday(self) -> dict:
+        """ Get the number of tasks finished by weekday
+
+        Returns:
+            dict: Every weekday with the number of tasks finished on that day
+        """
+        data = dict.fromkeys(WEEKDAYS, 0)
+        statement = self._select(TaskORM.conclusion_date, func.count())\
+            .where(TaskORM.status.is_(True), TaskORM.conclusion_date.is_not(None))\
+            .group_by(TaskORM.conclusion_date)
+        for conclusion_date, count in self._execute(statement):
+            data[WEEKDAYS[conclusion_date.weekday()]] += count
+        return data
+
+    def _get_counters(self) -> Dict[str, int]:
+        """ Read the counters and chart buckets with a single aggregate query
+
+        Returns:
+            Dict[str, int]: Value of every counter
+        """
+        version = self.user.views.result_cache.version
+        if self._counters is not None and self._counters_version == version:
+            return self._counters
+        today = datetime.datetime.today().date()
+        yesterday = (datetime.datetime.today() - pd.DateOffset(days=1)).date()
+        pending = TaskORM.status.is_(False)
+        has_end = TaskORM.end_date.is_not(None)
+
+        columns = {
+            'tasks': func.count(),
+            'done': self._count(TaskORM.status.is_(True)),
+            'on_time': self._count(and_(pending, has_end, TaskORM.end_date <= today)),
+            'today': self._count(and_(pending, TaskORM.end_date == today)),
+            'late': self._count(and_(pending, has_end, TaskORM.end_date <= yesterday)),
+        }
+        timespan = self._days_between(TaskORM.creation_date, TaskORM.end_date)
+        columns.update(self._buckets('timespan', timespan,
+                                     and_(TaskORM.creation_date.is_not(None), has_end)))
+        deadline = self._days_between(today, TaskORM.end_date)
+        columns.update(self._buckets('deadline', deadline,
+                                     and_(has_end, TaskORM.end_date >= today)))
+
+        names = list(columns)
+        row = self._execute(self._select(*[columns[name] for name in names]))[0]
+        self._counters = {name: int(value or 0) for name, value in zip(names, row)}
+        self._counters_version = version
+        return self._counters
+
+    def _select(self, *columns: Any) -> Any:
+        """ Select columns of the tasks of the user, or of the selected project
+        """
+        statement = select(*columns)\
+            .select_from(TaskORM)\
+            .join(ProjectORM, TaskORM.id_project == ProjectORM.id_project)\
+            .where(ProjectORM.id_user == self.user.id_user)
+        if self._project_name is not None:
+            statement = statement.where(ProjectORM.name == self._project_name)
+        return statement
+
+    def _execute(self, statement: Any) -> Any:
+        self._unit_of_work.flush()
+        with self._unit_of_work.begin() as session:
+            return session.execute(statement).all()
+
+    def _days_between(self, start: Any, end: Any) -> Any:
+        """ Number of days from start to end, in the SQL dialect of the database
+        """
+        if self._unit_of_work.session.get_bind().dialect.name == 'sqlite':
+            return func.julianday(end) - func.julianday(start)
+        return func.datediff(end, start)
+
+    @staticmethod
+    def _count(condition: Any) -> Any:
+        return func.sum(case((condition, 1), else_=0))
+
+    def _buckets(self, prefix: str, days: Any, condition: Any) -> Dict[str, Any]:
+        """ Count the rows by weeks of days: up to 7, 14, 21 and more
+        """
+        return {
+            f'{prefix} até 1': self._count(and_(condition, days <= 7)),
+            f'{prefix} 1 a 2': self._count(and_(condition, days > 7, days <= 14)),
+            f'{prefix} 2 a 3': self._count(and_(condition, days > 14, days <= 21)),
+            f'{prefix} 3+': self._count(and_(condition, days > 21)),
+        }
@@ -0,0 +1,151 @@
+"""
+Module Name: Event Bus
+
+Description:
+This module contains the change events published by the items of a user and the
+EventBus delivering them.
+
+Every operation that changes the object graph of a user publishes one event once it
+is persisted: `Created` when a label, project, task or subtask is created, `Updated`
+with the names of the fields that actually changed, `Moved` when a project changes
+label, and `Deleted` when an item is deleted. Views, caches and indexes subscribe to
+the bus of the user and apply the change, instead of rebuilding everything after
+every edit.
+
+Items loaded from the database (login, lazy task loading) are not changes and publish
+nothing.
+
+A subscriber is called synchronously, on the thread that made the change, unless it
+gives a `schedule` callable: the bus then hands it the delivery instead, e.g.
+`DbExecutor.instance().post` to be called on the Tk thread.
+
+Classes:
+- ChangeEvent: Base of the change events, holding the changed item.
+- Created: An item was created.
+- Updated: Fields of an item changed.
+- Moved: A project changed label.
+- Deleted: An item was deleted.
+- EventBus: Delivers the change events of a user to its subscribers.
+"""
+
+import threading
+from functools import partial
+from typing import Any, Callable, Tuple, Type
+
+
+class ChangeEvent:
+    """ Base of the change events, holding the changed item.
+
+    Attributes:
+        item (IItem): The label, project, task or subtask that changed.
+    """
+    __slots__ = ('item',)
+
+    def __init__(self, item: Any) -> None:
+        self.item = item
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({type(self.item).__name__} {self.item.name!r})'
+
+
+class Created(ChangeEvent):
+    """ An item was created. """
+    __slots__ = ()
+
+
+class Updated(ChangeEvent):
+    """ Fields of an item changed.
+
+    Attributes:
+        fields (Tuple[str, ...]): The names of the fields that changed.
+    """
+    __slots__ = ('fields',)
+
+    def __init__(self, item: Any, fields: Tuple[str, ...]) -> None:
+        super().__init__(item)
+        self.fields = tuple(fields)
+
+
+class Moved(Updated):
+    """ A project changed label.
+
+    Attributes:
+        source (IItem): The previous label, or None.
+        target (IItem): The new label, or None.
+    """
+    __slots__ = ('source', 'target')
+
+    def __init__(self, item: Any, fields: Tuple[str, ...], source: Any, target: Any) -> None:
+        super().__init__(item, fields)
+        self.source = source
+        self.target = target
+
+
+class Deleted(ChangeEvent):
+    """ An item was deleted. """
+    __slots__ = ()
+
+
+class EventBus:
+    """ Delivers the change events of a user to its subscribers.
+
+    Attributes:
+        _subscriptions (Tuple[Tuple[Callable, Tuple[Type[ChangeEvent], ...], Callable], ...]):
+            Handler, event types and scheduler of each subscriber. Replaced, never
+            modified, so that publishing needs no lock.
+        _lock (threading.Lock): Serializes the changes of the subscriptions.
+    """
+    def __init__(self) -> None:
+        """ Create a bus without subscribers.
+        """
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler: Callable[[ChangeEvent], None],
+                  *event_types: Type[ChangeEvent],
+                  schedule: Callable[[Callable[[], None]], None] = None) -> None:
+        """ Call a handler with the events of the given types.
+
+        Args:
+            handler (Callable[[ChangeEvent], None]): Called with each event.
+            *event_types (Type[ChangeEvent]): The event types delivered to the handler.
+                Defaults to every change event.
+            schedule (Callable[[Callable[[], None]], None], optional): Runs the delivery
+                later or elsewhere. Defaults to calling the handler at once.
+        """
+        subscription = (handler, event_types or (ChangeEvent,), schedule)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+
+    def unsubscribe(self, handler: Callable[[ChangeEvent], None]) -> None:
+        """ Stop delivering events to a handler.
+
+        Args:
+            handler (Callable[[ChangeEvent], None]): The handler given to `subscribe`.
+        """
+        with self._lock:
+            self._subscriptions = tuple(subscription for subscription in self._subscriptions
+                                        if subscription[0] != handler)
+
+    def publish(self, event: ChangeEvent) -> None:
+        """ Deliver an event to the subscribers of its type.
+
+        An error raised by a handler is printed and does not reach the publisher, whose
+        change is already persisted.
+
+        Args:
+            event (ChangeEvent): The event.
+        """
+        for handler, event_types, schedule in self._subscriptions:
+            if not isinstance(event, event_types):
+                continue
+            if schedule is not None:
+                schedule(partial(handler, event))
+                continue
+            try:
+                handler(event)
+            except Exception as error: # pylint: disable=broad-except
+                print(f"An error occurred: {error}")
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
@@ -32,11 +32,15 @@ Example:
     filtered_tasks = filter.filter_tasks_by_creation_date(projects_list, start_date, end_date)
 
 Note:
+    - The methods are thin wrappers around Query (src.logic.filter.query); use Query
+directly to combine several criteria in a single pass. Their results are kept in the
+user's result cache until the user's data changes.
     - Ensure the provided user object contains projects and tasks.
     - Methods return filtered lists of projects or tasks based on the specified criteria.
 """
 
 from datetime import date
+from src.logic.filter.query import Query
 
 class Filter:
     """ Filter class
@@ -78,10 +82,7 @@ class Filter:
         Returns:
             Project: Project
         """
-        for project in self.user.projects:
-            if project.name == name:
-                return project
-        return None
+        return self.user.project_names.get(name)
 
     def filter_projects_by_similar_name(self, name: str) -> list:
         """ Filter projects by similar name
@@ -92,7 +93,7 @@ class Filter:
         Returns:
             list: List of projects
         """
-        return [project for project in self.user.projects if name in project.name]
+        return Query.projects().name_contains(name).run_cached(self.user)
 
     def filter_projects_by_creation_date(
             self,
@@ -109,11 +110,7 @@ class Filter:
         Returns:
             list: List of projects
         """
-        projects = [project for project in self.user.projects
-                    if isinstance(project.creation_date, date)]
-        return [project for project in projects
-                if project.creation_date >= lower_limit
-                and project.creation_date <= upper_limit]
+        return Query.projects().created_between(lower_limit, upper_limit).run_cached(self.user)
 
     def filter_projects_by_end_date(
             self,
@@ -130,11 +127,7 @@ class Filter:
         Returns:
             list: List of projects
         """
-        projects = [project for project in self.user.projects
-                    if isinstance(project.end_date, date)]
-        return [project for project in projects
-                if project.end_date >= lower_limit
-                and project.end_date <= upper_limit]
+        return Query.projects().ending_between(lower_limit, upper_limit).run_cached(self.user)
 
     def filter_projects_by_conclusion_date(
             self,
@@ -151,11 +144,7 @@ class Filter:
         Returns:
             list: list of projects
         """
-        projects = [project for project in self.user.projects
-                    if isinstance(project.conclusion_date, date)]
-        return [project for project in projects
-                if project.conclusion_date >= lower_limit
-                and project.conclusion_date <= upper_limit]
+        return Query.projects().concluded_between(lower_limit, upper_limit).run_cached(self.user)
 
     def filter_projects_by_status(self, status: str) -> list:
         """ Filter projects by status
@@ -166,8 +155,7 @@ class Filter:
         Returns:
             list: List of projects
         """
-        return [project for project in self.user.projects
-                if project.status == status]
+        return Query.projects().with_status(status).run_cached(self.user)
 
     def filter_projects_by_label_name(self, name: str) -> list:
         """ Filter projects by label name
@@ -178,8 +166,7 @@ class Filter:
         Returns:
             list: List of projects
         """
-        valid_projects = [project for project in self.user.projects if project.label is not None]
-        return [project for project in valid_projects if project.label.name == name]
+        return Query.projects().with_label(name).run_cached(self.user)
 
     def filter_tasks_by_creation_date(
             self,
@@ -197,14 +184,8 @@ class Filter:
         Returns:
             list: _description_
         """
-        valid_tasks = []
-        for project in projects:
-            valid_tasks += [task for task in project.tasks if isinstance(task.creation_date, date)]
-        tasks = []
-        for task in valid_tasks:
-            if task.creation_date >= lower_limit and task.creation_date <= upper_limit:
-                tasks.append(task)
-        return tasks
+        query = Query.tasks().created_between(lower_limit, upper_limit)
+        return query.run_cached(self.user, projects)
 
     def filter_tasks_by_end_date(
             self,
@@ -222,14 +203,8 @@ class Filter:
         Returns:
             list: _description_
         """
-        valid_tasks = []
-        for project in projects:
-            valid_tasks += [task for task in project.tasks if isinstance(task.end_date, date)]
-        tasks = []
-        for task in valid_tasks:
-            if task.end_date >= lower_limit and task.end_date <= upper_limit:
-                tasks.append(task)
-        return tasks
+        query = Query.tasks().ending_between(lower_limit, upper_limit)
+        return query.run_cached(self.user, projects)
 
     def filter_tasks_by_conclusion_date(
             self,
@@ -247,14 +222,8 @@ class Filter:
         Returns:
             list: _description_
         """
-        valid_tasks = []
-        for project in projects:
-            valid_tasks +=[task for task in project.tasks if isinstance(task.conclusion_date, date)]
-        tasks = []
-        for task in valid_tasks:
-            if task.conclusion_date >= lower_limit and task.conclusion_date <= upper_limit:
-                tasks.append(task)
-        return tasks
+        query = Query.tasks().concluded_between(lower_limit, upper_limit)
+        return query.run_cached(self.user, projects)
 
     def filter_tasks_by_status(self, projects: list, status: str) -> list:
         """ Filter tasks by status
@@ -266,9 +235,4 @@ class Filter:
         Returns:
             list: List of tasks
         """
-        tasks = []
-        for project in projects:
-            for task in project.tasks:
-                if task.status == status:
-                    tasks.append(task)
-        return tasks
+        return Query.tasks().with_status(status).run_cached(self.user, projects)
@@ -0,0 +1,184 @@
+"""
+Module providing LabelIndex, the projects of a user grouped by label.
+
+The index maps every label to the projects that carry it, and keeps the number of
+projects and tasks of each label, so that:
+
+    - filtering the projects by one or several labels is the union of their groups,
+      instead of a scan of every project;
+    - the label page reads the counts of a label in O(1).
+
+The labels are keys by identity: renaming a label, or changing its color, leaves the
+index as it is. The index is built on first use from the user's projects, counting
+the tasks of the projects still in the database (lazy hydration) with a single query,
+and follows the change events of the user's items afterwards: a project moved to
+another label (`Moved`) changes group, created and deleted projects and tasks change
+the counts, and the projects of a deleted label join the projects without a label.
+
+Example:
+    index = user.views.label_index
+    projects = index.projects(work, home)
+    print(index.project_count(work), index.task_count(work))
+"""
+
+from typing import Any, Dict, List
+from sqlalchemy import func, select
+from src.logic.events.event_bus import ChangeEvent, Created, Deleted, Moved
+from src.logic.items.label import Label
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+from src.logic.orms.orm import TaskORM
+
+
+def label_key(label: Any) -> int:
+    """ The key of a label in the index, None for the projects without a label
+
+    Args:
+        label (Any): Label, or None
+
+    Returns:
+        int: The key
+    """
+    return None if label is None else id(label)
+
+
+class LabelIndex:
+    """ The projects of a user by label, with the number of projects and tasks of each
+    """
+    def __init__(self, user: callable) -> None:
+        """ Initialize the class and follow the changes of the user's items
+
+        Args:
+            user (callable): User
+        """
+        self._user = user
+        self._projects: Dict[int, Dict[int, Project]] = {}
+        self._keys: Dict[int, int] = {}
+        self._tasks: Dict[int, int] = {}
+        self._task_counts: Dict[int, int] = {}
+        self._built = False
+        user.events.subscribe(self.on_change)
+
+    def projects(self, *labels: Label) -> List[Project]:
+        """ The projects with any of the labels
+
+        Args:
+            *labels (Label): Labels; None stands for the projects without a label
+
+        Returns:
+            List[Project]: The projects, label by label, newest first within a label
+        """
+        self._build()
+        found = {}
+        for label in labels:
+            # The groups keep their projects oldest first.
+            found.update(reversed(self._projects.get(label_key(label), {}).items()))
+        return list(found.values())
+
+    def project_count(self, label: Label) -> int:
+        """ The number of projects with a label
+
+        Args:
+            label (Label): Label, or None for the projects without a label
+
+        Returns:
+            int: The number of projects
+        """
+        self._build()
+        return len(self._projects.get(label_key(label), ()))
+
+    def task_count(self, label: Label) -> int:
+        """ The number of tasks of the projects with a label
+
+        Args:
+            label (Label): Label, or None for the projects without a label
+
+        Returns:
+            int: The number of tasks
+        """
+        self._build()
+        return self._tasks.get(label_key(label), 0)
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """ Keep the index in line with a change of an item
+
+        Args:
+            event (ChangeEvent): The change event
+        """
+        if not self._built:
+            return
+        item = event.item
+        if isinstance(item, Project):
+            if isinstance(event, Created):
+                self._add(item, label_key(item.label), 0)
+            elif isinstance(event, Deleted):
+                self._remove(item)
+            elif isinstance(event, Moved):
+                self._add(item, label_key(event.target), self._remove(item))
+        elif isinstance(item, Task) and id(item.project) in self._task_counts:
+            if isinstance(event, Created):
+                self._count_task(item.project, 1)
+            elif isinstance(event, Deleted):
+                self._count_task(item.project, -1)
+        elif isinstance(item, Label) and isinstance(event, Deleted):
+            # The projects keep the deleted label in memory; in the database, and in
+            # the index, they are left without a label.
+            projects = self._projects.pop(id(item), {})
+            for project in projects.values():
+                self._keys[id(project)] = None
+            self._projects.setdefault(None, {}).update(projects)
+            self._tasks[None] = self._tasks.get(None, 0) + self._tasks.pop(id(item), 0)
+
+    def _add(self, project: Project, key: int, count: int) -> None:
+        # A project created or moved in goes last, as the newest of its label.
+        self._projects.setdefault(key, {})[id(project)] = project
+        self._keys[id(project)] = key
+        self._task_counts[id(project)] = count
+        self._tasks[key] = self._tasks.get(key, 0) + count
+
+    def _remove(self, project: Project) -> int:
+        key = self._keys.pop(id(project), None)
+        self._projects.get(key, {}).pop(id(project), None)
+        count = self._task_counts.pop(id(project), 0)
+        if key in self._tasks:
+            self._tasks[key] -= count
+        return count
+
+    def _count_task(self, project: Project, step: int) -> None:
+        self._task_counts[id(project)] += step
+        self._tasks[self._keys[id(project)]] += step
+
+    def _build(self) -> None:
+        """ Group the user's projects by label and count their tasks
+        """
+        if self._built:
+            return
+        self._built = True
+        projects = list(self._user.projects)
+        deferred = self._deferred_task_counts([project for project in projects
+                                               if project.deferred_tasks is not None])
+        for project in reversed(projects):
+            if project.deferred_tasks is None:
+                count = len(project.tasks)
+            else:
+                count = deferred.get(project.id_project, 0)
+            self._add(project, label_key(project.label), count)
+
+    def _deferred_task_counts(self, projects: List[Project]) -> Dict[int, int]:
+        """ Count the tasks of the deferred projects in the database, with one query
+
+        Args:
+            projects (List[Project]): Deferred projects
+
+        Returns:
+            Dict[int, int]: The number of tasks by project id
+        """
+        if not projects:
+            return {}
+        statement = select(TaskORM.id_project, func.count(TaskORM.id_task))\
+            .where(TaskORM.id_project.in_([project.id_project for project in projects]))\
+            .group_by(TaskORM.id_project)
+        unit_of_work = self._user.unit_of_work
+        unit_of_work.flush()
+        with unit_of_work.begin() as session:
+            return dict(session.execute(statement).all())
@@ -0,0 +1,395 @@
+"""
+Module providing Query, a composable filter over the projects or tasks of a user.
+
+A Query is built by chaining criteria, each call returning a new query:
+
+    - name_contains: the name contains a text;
+    - created_between, ending_between, concluded_between: a date range on the creation,
+      end or conclusion date (items without that date are left out);
+    - with_status: the status;
+    - with_label: the name of the label of the project;
+    - with_priority: the priority of the task.
+
+`run` compiles the criteria once and goes through the projects, and their tasks, in a
+single pass: the criteria on the project (its label) are checked once per project and
+skip all its tasks. With a date range, the pass starts from the user's sorted date
+index (src.logic.filter.date_index) instead of every item, and a query of projects
+with a label starts from the user's label index (src.logic.filter.label_index).
+Without a date range, the status and priority of the tasks are checked on the columns
+of the user's task snapshot (src.logic.filter.task_snapshot) once every task of the
+user is in memory, and only the tasks left are read. When
+some of the projects still have their tasks in the database (lazy hydration), the same
+criteria are pushed down to SQL first: only the deferred projects that have a matching
+task are loaded, the others are skipped unread.
+
+Usage:
+    - Start from Query.projects() or Query.tasks(), add criteria, then call run(user),
+or run_cached(user) to reuse the result until the user's data changes.
+
+Example:
+    late = Query.tasks().with_status(False).ending_between(upper=yesterday).run(user)
+    statement = Query.projects().with_label('Trabalho').statement(user.id_user)
+"""
+
+from datetime import date
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, NamedTuple, Tuple
+from sqlalchemy import select
+from src.logic.authentication.hydration import prefetch_tasks
+from src.logic.execeptions.exceptions_items import ItemDontHaveThisAttribute
+from src.logic.filter.date_index import date_key
+from src.logic.filter.task_snapshot import PRIORITY_CODES
+from src.logic.orms.orm import LabelORM, ProjectORM, TaskORM
+
+PROJECTS = 'projects'
+TASKS = 'tasks'
+
+
+class Criterion(NamedTuple):
+    """ A condition on an attribute of the items
+
+    Attributes:
+        attribute (str): Attribute of the item, or 'label' for the label's name.
+        operator (str): 'eq', 'contains' or 'between'.
+        value (Any): The value compared; a (lower, upper) tuple for 'between'.
+    """
+    attribute: str
+    operator: str
+    value: Any
+
+
+class Query:
+    """ A composable filter over the projects or the tasks of a user
+    """
+    def __init__(self, target: str = TASKS, criteria: Tuple[Criterion, ...] = ()) -> None:
+        """ Initialize the class
+
+        Args:
+            target (str, optional): PROJECTS or TASKS. Defaults to TASKS.
+            criteria (Tuple[Criterion, ...], optional): The criteria. Defaults to none.
+        """
+        self.target = target
+        self.criteria = criteria
+
+    @classmethod
+    def projects(cls) -> 'Query':
+        """ A query returning projects
+
+        Returns:
+            Query: Query without criteria
+        """
+        return cls(PROJECTS)
+
+    @classmethod
+    def tasks(cls) -> 'Query':
+        """ A query returning tasks
+
+        Returns:
+            Query: Query without criteria
+        """
+        return cls(TASKS)
+
+    def name_contains(self, text: str) -> 'Query':
+        """ Keep the items whose name contains a text
+
+        Args:
+            text (str): Text
+
+        Returns:
+            Query: New query
+        """
+        return self._where('name', 'contains', text)
+
+    def created_between(self, lower: date = date(1, 1, 1),
+                        upper: date = date(9999, 12, 31)) -> 'Query':
+        """ Keep the items created in a date range
+
+        Args:
+            lower (date, optional): Lower limit. Defaults to date(1,1,1).
+            upper (date, optional): Upper limit. Defaults to date(9999,12,31).
+
+        Returns:
+            Query: New query
+        """
+        return self._where('creation_date', 'between', (lower, upper))
+
+    def ending_between(self, lower: date = date(1, 1, 1),
+                       upper: date = date(9999, 12, 31)) -> 'Query':
+        """ Keep the items whose end date is in a date range
+
+        Args:
+            lower (date, optional): Lower limit. Defaults to date(1,1,1).
+            upper (date, optional): Upper limit. Defaults to date(9999,12,31).
+
+        Returns:
+            Query: New query
+        """
+        return self._where('end_date', 'between', (lower, upper))
+
+    def concluded_between(self, lower: date = date(1, 1, 1),
+                          upper: date = date(9999, 12, 31)) -> 'Query':
+        """ Keep the items concluded in a date range
+
+        Args:
+            lower (date, optional): Lower limit. Defaults to date(1,1,1).
+            upper (date, optional): Upper limit. Defaults to date(9999,12,31).
+
+        Returns:
+            Query: New query
+        """
+        return self._where('conclusion_date', 'between', (lower, upper))
+
+    def with_status(self, status: bool) -> 'Query':
+        """ Keep the items with a status
+
+        Args:
+            status (bool): Status
+
+        Returns:
+            Query: New query
+        """
+        return self._where('status', 'eq', status)
+
+    def with_label(self, name: str) -> 'Query':
+        """ Keep the projects, or the tasks of the projects, with a label
+
+        Args:
+            name (str): Name of the label
+
+        Returns:
+            Query: New query
+        """
+        return self._where('label', 'eq', name)
+
+    def with_priority(self, priority: str) -> 'Query':
+        """ Keep the tasks with a priority
+
+        Args:
+            priority (str): Priority
+
+        Raises:
+            ItemDontHaveThisAttribute: If the query returns projects.
+
+        Returns:
+            Query: New query
+        """
+        if self.target == PROJECTS:
+            raise ItemDontHaveThisAttribute('Projetos não têm prioridade.')
+        return self._where('priority', 'eq', priority)
+
+    def run(self, user: callable, projects: Iterable = None) -> list:
+        """ Return the items matching the criteria, in a single pass
+
+        With a date range, the items are read from the user's date index for the
+        first range, and the other criteria are checked on those items only. Projects
+        with a label are read from the user's label index. Otherwise the status and
+        priority of the tasks are checked on the user's task snapshot, if it can be
+        used.
+
+        Args:
+            user (callable): User
+            projects (Iterable, optional): Projects searched. Defaults to all the
+                projects of the user.
+
+        Returns:
+            list: The matching projects or tasks, in the order of the projects, and the
+                tasks of a project newest first
+        """
+        ranged = next((criterion for criterion in self.criteria
+                       if criterion.operator == 'between'), None)
+        project_tests, item_tests = self._compile(skip=(ranged,))
+        if self.target == PROJECTS:
+            projects = self._labelled(user, projects)
+            tests = project_tests + item_tests
+            if ranged is not None:
+                projects = user.views.date_indexes.projects(ranged.attribute, *ranged.value,
+                                                            projects)
+            return [project for project in projects if all(test(project) for test in tests)]
+
+        projects = list(user.projects if projects is None else projects)
+        if ranged is None and self._snapshot_usable(user, projects):
+            return self._from_snapshot(user, projects)
+        deferred = [project for project in projects if project.deferred_tasks is not None]
+        if deferred:
+            wanted = self._matching_projects(user, deferred)
+            projects = [project for project in projects
+                        if project.deferred_tasks is None or project.id_project in wanted]
+            prefetch_tasks(projects)
+
+        if ranged is not None:
+            return [task for task in
+                    user.views.date_indexes.tasks(ranged.attribute, *ranged.value, projects)
+                    if all(test(task.project) for test in project_tests)
+                    and all(test(task) for test in item_tests)]
+        tasks = []
+        for project in projects:
+            if all(test(project) for test in project_tests):
+                tasks.extend(task for task in project.tasks
+                             if all(test(task) for test in item_tests))
+        return tasks
+
+    def run_cached(self, user: callable, projects: Iterable = None) -> list:
+        """ Return the items matching the criteria, from the user's result cache while
+        the user's data is unchanged
+
+        Args:
+            user (callable): User
+            projects (Iterable, optional): Projects searched. Defaults to all the
+                projects of the user.
+
+        Returns:
+            list: The same items as run
+        """
+        projects = None if projects is None else list(projects)
+        scope = None if projects is None else tuple(id(project) for project in projects)
+        key = ('query', self.target, self.criteria, scope)
+        return list(user.views.result_cache.get(key, lambda: self.run(user, projects)))
+
+    def statement(self, id_user: int, projects: Iterable = None) -> Any:
+        """ The same query in SQL, against the ORM
+
+        Args:
+            id_user (int): Id of the user
+            projects (Iterable, optional): Projects searched. Defaults to all the
+                projects of the user.
+
+        Returns:
+            Select: Selects the ids of the matching items
+        """
+        if self.target == PROJECTS:
+            statement = select(ProjectORM.id_project)
+        else:
+            statement = select(TaskORM.id_task)\
+                .join(ProjectORM, TaskORM.id_project == ProjectORM.id_project)
+        statement = statement.where(ProjectORM.id_user == id_user)
+        if projects is not None:
+            statement = statement.where(ProjectORM.id_project.in_(
+                [project.id_project for project in projects]))
+        if any(criterion.attribute == 'label' for criterion in self.criteria):
+            statement = statement.join(LabelORM, ProjectORM.id_label == LabelORM.id_label)
+
+        model = ProjectORM if self.target == PROJECTS else TaskORM
+        for attribute, operator, value in self.criteria:
+            column = LabelORM.name if attribute == 'label' else getattr(model, attribute)
+            if operator == 'contains':
+                statement = statement.where(column.contains(value, autoescape=True))
+            elif operator == 'between':
+                statement = statement.where(column.is_not(None), column.between(*value))
+            else:
+                statement = statement.where(column == value)
+        return statement
+
+    def _where(self, attribute: str, operator: str, value: Any) -> 'Query':
+        return Query(self.target, self.criteria + (Criterion(attribute, operator, value),))
+
+    def _compile(self, skip: Tuple[Criterion, ...] = ()) -> Tuple[List[Callable],
+                                                                   List[Callable]]:
+        """ Compile the criteria to tests on the projects and tests on the items
+
+        Args:
+            skip (Tuple[Criterion, ...], optional): Criteria already applied by an index.
+
+        Returns:
+            Tuple[List[Callable], List[Callable]]: Tests on the project, tests on the item
+        """
+        project_tests, item_tests = [], []
+        for criterion in self.criteria:
+            if any(criterion is skipped for skipped in skip):
+                continue
+            attribute, operator, value = criterion
+            if attribute == 'label':
+                project_tests.append(lambda project, name=value:
+                                     project.label is not None and project.label.name == name)
+                continue
+            get = attrgetter(attribute)
+            if operator == 'contains':
+                test = lambda item, get=get, text=value: text in get(item)
+            elif operator == 'between':
+                test = lambda item, get=get, limits=value: \
+                    date_key(get(item)) is not None \
+                    and limits[0] <= date_key(get(item)) <= limits[1]
+            else:
+                test = lambda item, get=get, wanted=value: get(item) == wanted
+            item_tests.append(test)
+        return project_tests, item_tests
+
+    def _snapshot_usable(self, user: callable, projects: list) -> bool:
+        """ Check if the task snapshot of the user can answer the query
+
+        The snapshot holds every task of the user: it is used once it is built, or
+        when no project of the user is deferred, and for the user's own projects only.
+        """
+        if not any(attribute in ('status', 'priority') for attribute, _, _ in self.criteria):
+            return False
+        if not user.views.built('task_snapshot') and any(
+                project.deferred_tasks is not None for project in user.projects):
+            return False
+        return all(project in user.projects for project in projects)
+
+    def _from_snapshot(self, user: callable, projects: list) -> list:
+        """ The matching tasks, their status and priority checked on the task snapshot
+
+        Args:
+            user (callable): User
+            projects (list): Projects searched, of the user
+
+        Returns:
+            list: The matching tasks, in the order of the projects, newest first
+        """
+        # 'Media' and 'Média' share a code: the priority is checked again on the
+        # tasks left.
+        status = tuple(criterion for criterion in self.criteria
+                       if criterion.attribute == 'status' and isinstance(criterion.value, bool))
+        priority = tuple(criterion for criterion in self.criteria
+                         if criterion.attribute == 'priority'
+                         and criterion.value in PRIORITY_CODES)
+        project_tests, item_tests = self._compile(skip=status)
+        projects = [project for project in projects
+                    if all(test(project) for test in project_tests)]
+        snapshot = user.views.task_snapshot
+        mask = snapshot.in_projects(projects)
+        for attribute, _, value in status + priority:
+            mask &= snapshot.where(**{attribute: value})
+        return [task for task in snapshot.tasks(mask, projects)
+                if all(test(task) for test in item_tests)]
+
+    def _labelled(self, user: callable, projects: Iterable = None) -> list:
+        """ The projects searched, narrowed to a label by the user's label index
+
+        Several labels may share a name: the projects of all of them are kept.
+
+        Args:
+            user (callable): User
+            projects (Iterable, optional): Projects searched. Defaults to all the
+                projects of the user.
+
+        Returns:
+            list: The projects with the label of the query, if it has one, in the order
+                of the projects searched
+        """
+        scope = user.projects if projects is None else projects
+        names = [value for attribute, _, value in self.criteria if attribute == 'label']
+        if not names:
+            return list(scope)
+        labels = [label for label in user.labels if label.name == names[0]]
+        if not labels:
+            return []
+        wanted = {id(project) for project in user.views.label_index.projects(*labels)}
+        return [project for project in scope if id(project) in wanted]
+
+    def _matching_projects(self, user: callable, projects: list) -> set:
+        """ Ask the database which of the deferred projects have a matching task
+
+        Args:
+            user (callable): User
+            projects (list): Deferred projects
+
+        Returns:
+            set: Ids of the projects with a matching task
+        """
+        statement = self.statement(user.id_user, projects)\
+            .with_only_columns(TaskORM.id_project).distinct()
+        unit_of_work = user.unit_of_work
+        unit_of_work.flush()
+        with unit_of_work.begin() as session:
+            return set(session.execute(statement).scalars())
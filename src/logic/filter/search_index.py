@@ -0,0 +1,331 @@
+"""
+Module providing SearchIndex, a full-text search over the projects, tasks and subtasks of
+a user.
+
+The names and descriptions of the items are normalized (lower case, accents removed) and
+cut into trigrams, the sequences of three characters of the text padded with a space at
+both ends. An inverted index maps every trigram to the items whose text contains it:
+
+    - a substring search intersects the items of the trigrams of the query, smallest
+      set first, and checks the few candidates left;
+    - a fuzzy search counts the trigrams each item shares with the query, so a name with
+      a typo is still found when most of its trigrams match. Only the rare trigrams
+      of the query propose candidates, so common ones ('tar', ' ta') cost little, and
+      the candidates are read from the one sharing most rare trigrams down, stopping
+      once none left can beat the fuzzy matches already kept.
+
+Results are ranked: a match in the name before a match in the description, a name
+starting with the query first, shorter names first, and fuzzy matches after the
+substring ones, by similarity. The items are also kept by length of name, so a query
+found in most items, or of one or two characters, only ranks the shortest names that
+can still make the results.
+
+The index is built on the first search and follows the change events of the user's
+items afterwards. The projects still in the database (lazy hydration) are loaded by the
+first search, so that every item is found.
+
+Example:
+    for result in user.views.search_index.search('relatorio'):
+        print(result.item.name, result.score)
+"""
+
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Set, Tuple
+from src.logic.events.event_bus import ChangeEvent, Created, Deleted
+from src.logic.items.project import Project
+from src.logic.items.subtask import Subtask
+from src.logic.items.task import Task
+
+# Share of the trigrams of the query an item needs for a fuzzy match, as pg_trgm's.
+SIMILARITY_THRESHOLD = 0.3
+# Trigrams in more items than this (or than 5% of the items) do not propose fuzzy
+# candidates: they are only counted for the candidates of the rarer ones.
+COMMON_TRIGRAM = 1000
+# Queries matching more items than this many times the limit are ranked by reading the
+# items by length of name, stopping once no item left can enter the results.
+BROAD_QUERY = 10
+
+
+def normalize(text: str) -> str:
+    """ Lower-case a text and remove its accents
+
+    Args:
+        text (str): Text, or None
+
+    Returns:
+        str: The normalized text
+    """
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def trigrams(text: str) -> Set[str]:
+    """ The trigrams of a normalized text, padded with a space at both ends
+
+    Args:
+        text (str): Normalized text
+
+    Returns:
+        Set[str]: The trigrams
+    """
+    padded = f' {text} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def project_of(item: Any) -> Project:
+    """ The project of a project, task or subtask
+
+    Args:
+        item (Any): Project, task or subtask
+
+    Returns:
+        Project: The project the item belongs to
+    """
+    if isinstance(item, Subtask):
+        return item.task.project
+    if isinstance(item, Task):
+        return item.project
+    return item
+
+
+class SearchResult(NamedTuple):
+    """ An item found by a search
+
+    Attributes:
+        item (Any): Project, task or subtask.
+        score (float): Relevance, higher first.
+    """
+    item: Any
+    score: float
+
+
+class Document(NamedTuple):
+    """ The indexed text of an item
+    """
+    item: Any
+    name: str
+    text: str
+    grams: Set[str]
+
+
+class SearchIndex:
+    """ An inverted trigram index over the projects, tasks and subtasks of a user
+    """
+    def __init__(self, user: callable) -> None:
+        """ Initialize the class and follow the changes of the user's items
+
+        Args:
+            user (callable): User
+        """
+        self._user = user
+        self._postings: Dict[str, Set[int]] = {}
+        self._documents: Dict[int, Document] = {}
+        self._by_length: List[Tuple[int, int]] = []
+        self._indexed = set()
+        self._built = False
+        user.events.subscribe(self.on_change)
+
+    def search(self, text: str, limit: int = 50, fuzzy: bool = True) -> List[SearchResult]:
+        """ Find the items whose name or description contains a text
+
+        Args:
+            text (str): Text searched, in any case and with or without accents
+            limit (int, optional): Maximum number of results. Defaults to 50.
+            fuzzy (bool, optional): Also return the items similar to the text.
+                Defaults to True.
+
+        Returns:
+            List[SearchResult]: The items found, most relevant first
+        """
+        query = normalize(text).strip()
+        if not query:
+            return []
+        self._build()
+
+        documents = self._documents
+        word_start = f' {query}'
+
+        def score(key: int) -> float:
+            name = documents[key].name
+            if query not in name:
+                return 1.5
+            bonus = 1.0 if name.startswith(query) else 0.5 if word_start in name else 0.0
+            return 2.0 + bonus + len(query) / len(name)
+
+        if len(query) < 3:
+            matched = set()
+            best = self._best_by_length(
+                query, lambda key: query in documents[key].text, score, limit)
+        else:
+            candidates = self._candidates(query)
+            if len(query) == 3:
+                matched = candidates
+            else:
+                matched = {key for key in candidates if query in documents[key].text}
+            if len(matched) > BROAD_QUERY * limit:
+                best = self._best_by_length(query, matched.__contains__, score, limit)
+            else:
+                best = heapq.nlargest(limit, matched, key=score)
+        results = [SearchResult(documents[key].item, score(key)) for key in best]
+        if fuzzy and len(results) < limit and len(query) >= 3:
+            results.extend(SearchResult(documents[key].item, similarity) for similarity, key
+                           in self._similar(query, matched, limit - len(results)))
+        return results
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """ Keep the index in line with a change of an item
+
+        Args:
+            event (ChangeEvent): The change event
+        """
+        item = event.item
+        if not self._built or not isinstance(item, (Project, Task, Subtask)):
+            return
+        if isinstance(event, Deleted):
+            self.discard(item)
+            if isinstance(item, Project):
+                self._indexed.discard(id(item))
+        elif isinstance(event, Created):
+            if isinstance(item, Project):
+                self._indexed.add(id(item))
+                self.add(item)
+            elif id(project_of(item)) in self._indexed:
+                self.add(item)
+        elif id(item) in self._documents:
+            self.update(item)
+
+    def add(self, item: Any) -> None:
+        """ Index the name and description of an item
+
+        Args:
+            item (Any): Project, task or subtask
+        """
+        name = normalize(item.name)
+        text = f"{name}\n{normalize(getattr(item, 'description', None))}"
+        grams = trigrams(text)
+        self._documents[id(item)] = Document(item, name, text, grams)
+        insort(self._by_length, (len(name), id(item)))
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(id(item))
+
+    def discard(self, item: Any) -> None:
+        """ Remove an item from the index, if it is in it
+
+        Args:
+            item (Any): Project, task or subtask
+        """
+        document = self._documents.pop(id(item), None)
+        if document is None:
+            return
+        position = bisect_left(self._by_length, (len(document.name), id(item)))
+        del self._by_length[position]
+        for gram in document.grams:
+            keys = self._postings[gram]
+            keys.discard(id(item))
+            if not keys:
+                del self._postings[gram]
+
+    def update(self, item: Any) -> None:
+        """ Index again an item whose name or description changed
+
+        Args:
+            item (Any): Project, task or subtask
+        """
+        document = self._documents.get(id(item))
+        name = normalize(item.name)
+        text = f"{name}\n{normalize(getattr(item, 'description', None))}"
+        if document is None or document.text != text:
+            self.discard(item)
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _build(self) -> None:
+        """ Index the projects not indexed yet, loading the deferred ones
+        """
+        projects = [project for project in self._user.projects
+                    if id(project) not in self._indexed]
+        if self._built and not projects:
+            return
+        self._built = True
+        # hydration imports User, which holds the search index.
+        from src.logic.authentication.hydration import prefetch_tasks
+        prefetch_tasks(projects)
+        for project in projects:
+            self._indexed.add(id(project))
+            self.add(project)
+            for task in project.tasks:
+                self.add(task)
+                for subtask in task.subtasks:
+                    self.add(subtask)
+
+    def _candidates(self, query: str) -> Set[int]:
+        """ The items having every trigram of a query of three characters or more
+        """
+        grams = {query[index:index + 3] for index in range(len(query) - 2)}
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        keys = set(postings[0])
+        for gram_keys in postings[1:]:
+            if not keys:
+                break
+            keys &= gram_keys
+        return keys
+
+    def _best_by_length(self, query: str, matches: Callable[[int], bool],
+                        score: Callable[[int], float], limit: int) -> List[int]:
+        """ The best matches of a query found in many items, read by length of name
+
+        No item whose name has L characters scores more than 3 + len(query) / L, so
+        reading the shortest names first can stop as soon as the worst of the best
+        matches kept reaches that bound.
+        """
+        heap = []
+        for order, (length, key) in enumerate(self._by_length):
+            if len(heap) == limit and heap[0][0] >= 3.0 + len(query) / max(length, 1):
+                break
+            if matches(key):
+                entry = (score(key), -order, key)
+                if len(heap) < limit:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+        return [key for _, _, key in sorted(heap, reverse=True)]
+
+    def _similar(self, query: str, matched: Set[int], limit: int) -> List[Tuple[float, int]]:
+        """ The items sharing most of the trigrams of the query, with their similarity
+
+        The candidates are the items of the rare trigrams of the query, read from the
+        one sharing most of them down. A candidate sharing `count` rare trigrams shares
+        at most `count` plus the number of common trigrams, so the reading stops once
+        that bound is below the worst of the `limit` best similarities kept.
+        """
+        grams = trigrams(query)
+        common_size = max(COMMON_TRIGRAM, len(self._documents) // 20)
+        shared = Counter()
+        common = 0
+        for gram in grams:
+            keys = self._postings.get(gram, set())
+            if len(keys) <= common_size:
+                shared.update(keys)
+            else:
+                common += 1
+
+        best = []
+        for key, count in shared.most_common():
+            if len(best) == limit and (count + common) / len(grams) < best[0][0]:
+                break
+            if key in matched:
+                continue
+            count = len(grams & self._documents[key].grams)
+            similarity = count / len(grams)
+            if count < 2 or similarity < SIMILARITY_THRESHOLD:
+                continue
+            if len(best) < limit:
+                heapq.heappush(best, (similarity, key))
+            elif similarity > best[0][0]:
+                heapq.heapreplace(best, (similarity, key))
+        return sorted(best, reverse=True)
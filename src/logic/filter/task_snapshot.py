@@ -0,0 +1,355 @@
+"""
+Module providing TaskSnapshot, the tasks of a user in NumPy columns.
+
+The dashboard and the notifications go through every task, reading a few attributes
+of each. TaskSnapshot keeps those attributes in one NumPy array per column, a row per
+task:
+
+    - ids: the database id of the task;
+    - projects: the index of the task's project in `snapshot.projects`;
+    - status: True once concluded;
+    - priority: the code of the priority (PRIORITY_CODES, 0 for none);
+    - creation_date, end_date, conclusion_date, notification_date: `datetime64[D]`,
+      NaT for no date.
+
+Predicates on the columns (`where`, `between`, `in_projects`) return boolean masks,
+combined with `&` and `|`, `tasks` reads the tasks of a mask, in the order of the
+projects when they are given, and the group-bys (`count_by_weekday`, `count_by_day`,
+`count_by_bucket`) count the rows of a mask in one pass of compiled code instead of a
+Python loop over the tasks.
+
+The snapshot is built on first use, loading the projects still in the database (lazy
+hydration), and follows the change events of the user's items afterwards: a created
+task is appended (the columns grow by doubling), an updated or concluded one patched
+in place, a deleted one marked dead, and the dead rows compacted away once they are
+half of the rows.
+
+Example:
+    snapshot = user.views.task_snapshot
+    late = snapshot.between('end_date', upper=yesterday) & snapshot.where(status=False)
+    print(snapshot.count(late), snapshot.tasks(late))
+"""
+
+import datetime
+from typing import Any, Dict, Iterable, List, Sequence
+import numpy as np
+from src.logic.events.event_bus import ChangeEvent, Created, Deleted
+from src.logic.filter.date_index import date_key
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+
+DATE_FIELDS = ('creation_date', 'end_date', 'conclusion_date', 'notification_date')
+PRIORITY_CODES = {'Alta': 1, 'Media': 2, 'Média': 2, 'Baixa': 3}
+INITIAL_CAPACITY = 64
+NAT = np.datetime64('NaT', 'D')
+
+
+def to_day(value: Any) -> np.datetime64:
+    """ The value of a date field as a NumPy day
+
+    Args:
+        value (Any): Date, datetime or None
+
+    Returns:
+        np.datetime64: The day, NaT for no date
+    """
+    day = date_key(value)
+    return NAT if day is None else np.datetime64(day, 'D')
+
+
+class TaskSnapshot:
+    """ The tasks of a user in NumPy columns
+
+    Attributes:
+        projects (List[Project]): The projects, in the order of the project indexes.
+    """
+    def __init__(self, user: callable) -> None:
+        """ Initialize the class and follow the changes of the user's items
+
+        Args:
+            user (callable): User
+        """
+        self._user = user
+        self.projects: List[Project] = []
+        self._project_rows: Dict[int, int] = {}
+        self._rows: Dict[int, int] = {}
+        self._tasks = np.empty(0, dtype=object)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._size = 0
+        self._dead = 0
+        self._built = False
+        self._allocate(INITIAL_CAPACITY)
+        user.events.subscribe(self.on_change)
+
+    def column(self, name: str) -> np.ndarray:
+        """ A column of the snapshot, with a value for every row
+
+        Args:
+            name (str): 'ids', 'projects', 'status', 'priority', 'alive' or a date
+                field
+
+        Returns:
+            np.ndarray: The column; read it only, the snapshot patches it in place
+        """
+        self._build()
+        return self._columns[name][:self._size]
+
+    def alive(self) -> np.ndarray:
+        """ The rows of the tasks not deleted
+
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        return self.column('alive').copy()
+
+    def in_projects(self, projects: Iterable[Project]) -> np.ndarray:
+        """ The rows of the tasks of some projects
+
+        Args:
+            projects (Iterable[Project]): Projects
+
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        self._build()
+        indexes = [self._project_rows[id(project)] for project in projects
+                   if project is not None and id(project) in self._project_rows]
+        if len(indexes) == 1:
+            return (self.column('projects') == indexes[0]) & self.column('alive')
+        return np.isin(self.column('projects'), indexes) & self.column('alive')
+
+    def where(self, status: bool = None, priority: str = None) -> np.ndarray:
+        """ The rows of the tasks with a status and, or, a priority
+
+        Args:
+            status (bool, optional): Status. Defaults to any.
+            priority (str, optional): Priority. Defaults to any.
+
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        mask = self.alive()
+        if status is not None:
+            mask &= self.column('status') == bool(status)
+        if priority is not None:
+            mask &= self.column('priority') == PRIORITY_CODES.get(priority, -1)
+        return mask
+
+    def between(self, field: str, lower: datetime.date = None,
+                upper: datetime.date = None) -> np.ndarray:
+        """ The rows of the tasks with a date in a range
+
+        Args:
+            field (str): Date field
+            lower (datetime.date, optional): Lower limit. Defaults to none.
+            upper (datetime.date, optional): Upper limit. Defaults to none.
+
+        Returns:
+            np.ndarray: Boolean mask, without the tasks that have no date in the field
+        """
+        days = self.column(field)
+        mask = self.alive() & ~np.isnat(days)
+        if lower is not None:
+            mask &= days >= to_day(lower)
+        if upper is not None:
+            mask &= days <= to_day(upper)
+        return mask
+
+    def days_between(self, start: Any, end: Any) -> np.ndarray:
+        """ The number of days from a date field, or a date, to another
+
+        Args:
+            start (Any): Date field or date
+            end (Any): Date field or date
+
+        Returns:
+            np.ndarray: Days of every row; rows with no date in a field are meaningless
+        """
+        def days(value: Any) -> Any:
+            return self.column(value) if isinstance(value, str) else to_day(value)
+        return (days(end) - days(start)).astype('int64')
+
+    def count(self, mask: np.ndarray) -> int:
+        """ The number of rows of a mask
+
+        Args:
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            int: Number of rows
+        """
+        return int(np.count_nonzero(mask))
+
+    def tasks(self, mask: np.ndarray, projects: Sequence[Project] = None) -> List[Task]:
+        """ The tasks of the rows of a mask
+
+        Args:
+            mask (np.ndarray): Boolean mask
+            projects (Sequence[Project], optional): Order the tasks by project, in this
+                order, and newest first within a project, as in `project.tasks`. The
+                mask must keep only tasks of these projects. Defaults to the order of
+                the rows.
+
+        Returns:
+            List[Task]: The tasks
+        """
+        rows = np.flatnonzero(mask)
+        if projects is not None:
+            ranks = np.zeros(len(self.projects), dtype='int64')
+            for position, project in reversed(list(enumerate(projects))):
+                if id(project) in self._project_rows:
+                    ranks[self._project_rows[id(project)]] = position
+            # The tasks of a project are appended oldest first.
+            rows = rows[np.lexsort((-rows, ranks[self.column('projects')[rows]]))]
+        return self._tasks[rows].tolist()
+
+    def count_by_weekday(self, field: str, mask: np.ndarray) -> np.ndarray:
+        """ Count the rows of a mask by weekday of a date field
+
+        Args:
+            field (str): Date field
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            np.ndarray: Seven counts, from Monday to Sunday
+        """
+        days = self.column(field)[mask & ~np.isnat(self.column(field))]
+        # 1970-01-01, day 0, was a Thursday.
+        return np.bincount((days.astype('int64') + 3) % 7, minlength=7)
+
+    def count_by_day(self, field: str, lower: datetime.date, upper: datetime.date,
+                     mask: np.ndarray) -> np.ndarray:
+        """ Count the rows of a mask by day of a date field, from a day to another
+
+        Args:
+            field (str): Date field
+            lower (datetime.date): First day
+            upper (datetime.date): Last day
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            np.ndarray: A count for every day from lower to upper
+        """
+        mask = mask & self.between(field, lower, upper)
+        offsets = (self.column(field)[mask] - to_day(lower)).astype('int64')
+        return np.bincount(offsets, minlength=(upper - lower).days + 1)
+
+    def count_by_bucket(self, values: np.ndarray, limits: Sequence[int],
+                        mask: np.ndarray) -> np.ndarray:
+        """ Count the rows of a mask by bucket of a value
+
+        Args:
+            values (np.ndarray): A value for every row
+            limits (Sequence[int]): Upper limits, included, of every bucket but the
+                last, which takes the values above
+            mask (np.ndarray): Boolean mask
+
+        Returns:
+            np.ndarray: A count for every bucket
+        """
+        buckets = np.searchsorted(np.asarray(limits), values[mask], side='left')
+        return np.bincount(buckets, minlength=len(limits) + 1)
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """ Keep the snapshot in line with a change of an item
+
+        Args:
+            event (ChangeEvent): The change event
+        """
+        if not self._built:
+            return
+        item = event.item
+        if isinstance(item, Project) and isinstance(event, Created):
+            self._add_project(item)
+        elif isinstance(item, Task):
+            if isinstance(event, Created):
+                self._append(item)
+            elif isinstance(event, Deleted):
+                self._kill(item)
+            elif id(item) in self._rows:
+                self._write(self._rows[id(item)], item)
+
+    def __len__(self) -> int:
+        self._build()
+        return self._size - self._dead
+
+    def _build(self) -> None:
+        """ Read every task of the user, loading the deferred projects
+        """
+        if self._built:
+            return
+        self._built = True
+        # hydration imports User, which holds the snapshot.
+        from src.logic.authentication.hydration import prefetch_tasks
+        projects = list(self._user.projects)
+        prefetch_tasks(projects)
+        for project in projects:
+            self._add_project(project)
+            for task in reversed(project.tasks):
+                self._append(task)
+
+    def _add_project(self, project: Project) -> None:
+        if id(project) not in self._project_rows:
+            self._project_rows[id(project)] = len(self.projects)
+            self.projects.append(project)
+
+    def _allocate(self, capacity: int) -> None:
+        """ Move the rows to columns of a new capacity
+        """
+        size = self._size
+        tasks = np.empty(capacity, dtype=object)
+        tasks[:size] = self._tasks[:size]
+        self._tasks = tasks
+        dtypes = {'ids': 'int64', 'projects': 'int32', 'status': bool, 'priority': 'int8',
+                  'alive': bool}
+        dtypes.update((field, 'datetime64[D]') for field in DATE_FIELDS)
+        for name, dtype in dtypes.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if name in self._columns:
+                column[:size] = self._columns[name][:size]
+            self._columns[name] = column
+
+    def _append(self, task: Task) -> None:
+        if id(task) in self._rows:
+            return
+        self._add_project(task.project)
+        if self._size == len(self._tasks):
+            self._allocate(2 * len(self._tasks))
+        row = self._size
+        self._size += 1
+        self._rows[id(task)] = row
+        self._tasks[row] = task
+        self._columns['alive'][row] = True
+        self._write(row, task)
+
+    def _write(self, row: int, task: Task) -> None:
+        columns = self._columns
+        columns['ids'][row] = task.id_task or 0
+        columns['projects'][row] = self._project_rows[id(task.project)]
+        columns['status'][row] = bool(task.status)
+        columns['priority'][row] = PRIORITY_CODES.get(task.priority, 0)
+        for field in DATE_FIELDS:
+            columns[field][row] = to_day(getattr(task, field))
+
+    def _kill(self, task: Task) -> None:
+        row = self._rows.pop(id(task), None)
+        if row is None:
+            return
+        self._columns['alive'][row] = False
+        self._tasks[row] = None
+        self._dead += 1
+        if self._dead * 2 > self._size:
+            self._compact()
+
+    def _compact(self) -> None:
+        """ Drop the dead rows
+        """
+        keep = self._columns['alive'][:self._size].copy()
+        kept = self.count(keep)
+        for column in self._columns.values():
+            column[:kept] = column[:self._size][keep]
+        self._tasks[:kept] = self._tasks[:self._size][keep]
+        self._tasks[kept:] = None
+        self._size = kept
+        self._dead = 0
+        self._rows = {id(task): row for row, task in enumerate(self._tasks[:kept])}
@@ -2,8 +2,14 @@
     This file contains the classes and methods used to create
     the interface for the history of completed tasks.
 
+    Each user owns its own history (`User.history`), so several users served by the
+    same process never see each other's tasks. The history of a user follows the change
+    events of its tasks: a task concluded is added, a task reopened or deleted removed.
+    HistorySingleton is kept for the callers that still expect one history per process.
+
     Classes:
-        HistorySingleton(HistoryInterface): Interface of the history of completed tasks,
+        TaskHistory(HistoryInterface): History of the completed tasks of one user.
+        HistorySingleton(TaskHistory): Process-wide history of completed tasks,
         used to create a singleton instance of the class.
 
     Methods:
@@ -13,27 +19,20 @@
 from typing import List
 from src.logic.items.item_interface import IItem
 from src.logic.history.history_interface import HistoryInterface
-class HistorySingleton(HistoryInterface):
-    """ This class will be used to represent the history of completed tasks
+from src.logic.items.task import Task
+from src.logic.events.event_bus import ChangeEvent, Deleted
+
+
+class TaskHistory(HistoryInterface):
+    """ This class will be used to represent the history of completed tasks of a user
 
     Args:
         HistoryInterface (HistoryInterface): Interface of the history of completed tasks
     """
-    _instance = None
-
-    def __new__(cls) -> object:
-        """ Creates and manages a singleton instance of the class.
-
-        Args:
-            cls (object): The class that will be used to create the singleton instance.
-
-        Returns:
-            object: The singleton instance of the class.
+    def __init__(self) -> None:
+        """ Creates an empty history.
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.tasks_list = []
-        return cls._instance
+        self.tasks_list = []
 
     def add_completed_task(self, project: IItem) -> None:
         """ This method will be used to add a completed task to the list
@@ -44,8 +43,23 @@ class HistorySingleton(HistoryInterface):
         for each_project in project:
             for each_task in each_project.tasks:
                 if each_task.status:
-                    self._instance.tasks_list.append(each_task)
-                    self._instance.tasks_list = list(set(self._instance.tasks_list))
+                    self.tasks_list.append(each_task)
+                    self.tasks_list = list(set(self.tasks_list))
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """ This method will be used to follow the changes of the user's tasks
+
+        Args:
+            event (ChangeEvent): The change event
+        """
+        task = event.item
+        if not isinstance(task, Task):
+            return
+        if isinstance(event, Deleted) or not task.status:
+            if task in self.tasks_list:
+                self.tasks_list.remove(task)
+        elif task not in self.tasks_list:
+            self.tasks_list.append(task)
 
     def tasks_completed(self) -> List[IItem]:
         """ This method will be used to return the list of completed tasks
@@ -53,5 +67,31 @@ class HistorySingleton(HistoryInterface):
         Returns:
             List[Item]: List of completed tasks
         """
-        #return self._instance.tasks_list
-        return self._instance.tasks_list
+        return self.tasks_list
+
+
+class HistorySingleton(TaskHistory):
+    """ This class will be used to represent the process-wide history of completed tasks
+
+    Args:
+        TaskHistory (TaskHistory): History of completed tasks
+    """
+    _instance = None
+
+    def __new__(cls) -> object:
+        """ Creates and manages a singleton instance of the class.
+
+        Args:
+            cls (object): The class that will be used to create the singleton instance.
+
+        Returns:
+            object: The singleton instance of the class.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            TaskHistory.__init__(cls._instance)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """ Keeps the tasks of the existing instance.
+        """
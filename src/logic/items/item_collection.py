@@ -0,0 +1,160 @@
+"""
+Module Name: Item Collection
+
+Description:
+This module contains the ItemCollection class, the container of the children of an
+item: the projects and labels of a user, the tasks of a project and the subtasks of a
+task.
+
+The children used to be kept in lists, newest first, so adding one was a
+`list.insert(0, item)` and removing one a `list.remove(item)`, both linear in the size
+of the list. ItemCollection keeps them in a dictionary keyed by the identity of each
+item, in insertion order, which makes adding, removing and membership tests constant
+time. It iterates newest first, like the lists did, and behaves as a read-only
+sequence for the existing callers: `len`, indexing, slicing (which returns a list) and
+comparison with lists. Indexing goes through a list snapshot rebuilt after each change,
+so reading many positions in a row stays cheap.
+
+Most tasks have a handful of subtasks at most, and a dictionary costs several times the
+memory of a short list, so a collection keeps a plain list until it grows past
+`SMALL_COLLECTION` items: scanning a list that short is as fast as hashing. A
+collection of a single item, the most common one after the empty one, keeps the item
+itself and no list at all.
+
+The collection also owns the name index of its items, built on first use.
+
+Classes:
+- ItemCollection: Insertion-ordered collection of items, iterated newest first.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List
+from src.logic.items.name_index import NameIndex
+
+SMALL_COLLECTION = 8
+
+
+class ItemCollection(Sequence):
+    """ Insertion-ordered collection of items, iterated newest first.
+
+    Attributes:
+        _items (Any): The items, oldest first: None while the collection is empty, the
+            item itself while it is the only one, then a list, then a dictionary keyed
+            by identity once the collection is larger than SMALL_COLLECTION. The items
+            are domain objects, never lists or dictionaries themselves.
+        _names (NameIndex): The items by name, None until it is first used.
+        _snapshot (List[Any]): The items newest first, None after a change.
+    """
+    __slots__ = ('_items', '_names', '_snapshot')
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """ Create a collection.
+
+        Args:
+            items (Iterable[Any], optional): Items to add, oldest first. Defaults to none.
+        """
+        self._items = None
+        self._names: NameIndex = None
+        self._snapshot: List[Any] = None
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        """ Add an item as the newest of the collection.
+
+        Args:
+            item (Any): The item to add.
+        """
+        items = self._items
+        if isinstance(items, dict):
+            items[id(item)] = item
+        elif isinstance(items, list):
+            if item not in self:
+                items.append(item)
+                if len(items) > SMALL_COLLECTION:
+                    self._items = {id(each): each for each in items}
+        elif items is None:
+            self._items = item
+        elif items is not item:
+            self._items = [items, item]
+        self._snapshot = None
+        if self._names is not None:
+            self._names.add(item)
+
+    def remove(self, item: Any) -> None:
+        """ Remove an item from the collection.
+
+        Args:
+            item (Any): The item to remove.
+
+        Raises:
+            ValueError: If the item is not in the collection.
+        """
+        items = self._items
+        if isinstance(items, dict):
+            if items.pop(id(item), None) is None:
+                raise ValueError(f'{item!r} is not in the collection')
+        elif isinstance(items, list):
+            for index, each in enumerate(items):
+                if each is item:
+                    del items[index]
+                    break
+            else:
+                raise ValueError(f'{item!r} is not in the collection')
+        elif items is item and items is not None:
+            self._items = None
+        else:
+            raise ValueError(f'{item!r} is not in the collection')
+        self._snapshot = None
+        if self._names is not None:
+            self._names.remove(item)
+
+    @property
+    def names(self) -> NameIndex:
+        """NameIndex: The items of the collection, by name."""
+        if self._names is None:
+            self._names = NameIndex(reversed(self))
+        return self._names
+
+    def _oldest_first(self) -> Iterable[Any]:
+        """ The items, oldest first. """
+        items = self._items
+        if isinstance(items, dict):
+            return items.values()
+        if isinstance(items, list):
+            return items
+        return () if items is None else (items,)
+
+    def __contains__(self, item: Any) -> bool:
+        items = self._items
+        if isinstance(items, dict):
+            return items.get(id(item)) is item
+        return any(each is item for each in self._oldest_first())
+
+    def __iter__(self) -> Iterator[Any]:
+        return reversed(self._oldest_first())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(self._oldest_first())
+
+    def __len__(self) -> int:
+        items = self._items
+        if isinstance(items, (dict, list)):
+            return len(items)
+        return 0 if items is None else 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if self._snapshot is None:
+            self._snapshot = list(self)
+        return self._snapshot[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ItemCollection, list, tuple)):
+            return len(self) == len(other) and all(a is b or a == b
+                                                   for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'ItemCollection({list(self)!r})'
@@ -76,28 +76,28 @@ class ItemFactory:
 
         if item_type == 'project':
             user = kwargs.get('user')
-            if name in [project.name for project in user.projects]:
+            if name in user.project_names:
                 erro_str = "Já existe um projeto com esse nome"
                 raise ItemNameAlreadyExists(erro_str)
             return Project(**kwargs)
 
         if item_type == 'task':
             project = kwargs.get('project')
-            if name in [task.name for task in project.tasks]:
+            if name in project.task_names:
                 erro_str = "Já existe uma tarefa com esse nome nesse projeto"
                 raise ItemNameAlreadyExists(erro_str)
             return Task(**kwargs)
 
         if item_type == 'subtask':
             task = kwargs.get('task')
-            if name in [subtask.name for subtask in task.subtasks]:
+            if name in task.subtask_names:
                 erro_str = "Já existe uma subtarefa com esse nome nessa tarefa"
                 raise ItemNameAlreadyExists(erro_str)
             return Subtask(**kwargs)
 
         if item_type == 'label':
             user = kwargs.get('user')
-            if name in [label.name for label in user.labels]:
+            if name in user.label_names:
                 erro_str = "Já existe uma etiqueta com esse nome"
                 raise ItemNameAlreadyExists(erro_str)
             return Label(**kwargs)
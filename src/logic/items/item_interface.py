@@ -30,6 +30,8 @@ class IItem(ABC):
         update(self, **kwargs): An abstract method that should be implemented to handle the
                                 updating of an item's attributes.
     """
+    __slots__ = ()
+
     @abstractmethod
     def delete(self) -> None:
         """
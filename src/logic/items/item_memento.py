@@ -0,0 +1,82 @@
+"""
+Module Name: Item Memento
+
+Description:
+This module contains the ItemMemento class, the base of the mementos of the items.
+
+A memento used to be a full copy of the editable fields of its item, taken before every
+update or conclusion. ItemMemento only keeps the fields an operation is about to change,
+with their current values: concluding a task saves its status and conclusion date, a
+rename saves the name. Restoring it writes back only those columns.
+
+The names of the saved fields are shared between the mementos saving the same fields,
+so a memento holds its item, a shared tuple of names and a tuple of values.
+
+Classes:
+- ItemMemento: Previous values of the fields changed by an operation on an item.
+"""
+
+from typing import Any, Dict, Tuple
+from src.logic.items.memento_interface import IMemento
+
+_FIELD_NAMES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class ItemMemento(IMemento):
+    """ Previous values of the fields changed by an operation on an item.
+
+    Subclasses list the fields of their item that can be restored in `FIELDS`. The item
+    keeps each of them in the attribute of the same name prefixed by an underscore.
+
+    Attributes:
+        _item (IItem): The item, None once the memento is restored or dropped.
+        _fields (Tuple[str, ...]): The names of the saved fields.
+        _values (Tuple[Any, ...]): Their values before the operation.
+    """
+    __slots__ = ('_item', '_fields', '_values')
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, item: Any, changes: Dict[str, Any] = None) -> None:
+        """ Save the fields of an item an operation is about to change.
+
+        Args:
+            item (IItem): The item.
+            changes (Dict[str, Any], optional): The new values of the operation. Only the
+                fields whose value differs are saved. Defaults to saving every field.
+        """
+        fields = []
+        values = []
+        for field in self.FIELDS:
+            value = getattr(item, f'_{field}')
+            if changes is None or (field in changes and changes[field] != value):
+                fields.append(field)
+                values.append(value)
+        fields = tuple(fields)
+        self._item = item
+        self._fields = _FIELD_NAMES.setdefault(fields, fields)
+        self._values = tuple(values)
+
+    @property
+    def item(self) -> Any:
+        """IItem: The item of the memento, None once it is restored or dropped."""
+        return self._item
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Tuple[str, ...]: The names of the saved fields."""
+        return self._fields
+
+    def detach(self) -> None:
+        """ Mark the memento as restored or dropped. """
+        self._item = None
+
+    def get_state(self) -> Dict[str, Any]:
+        """ Returns the saved fields and their values.
+
+        Returns:
+            Dict[str, Any]: Value of each saved field.
+        """
+        return dict(zip(self._fields, self._values))
+
+    def __len__(self) -> int:
+        return len(self._fields)
@@ -15,15 +15,15 @@ Exceptions:
                            allowed to be modified.
 """
 
-from sqlalchemy.orm import sessionmaker
+from typing import Any
+from sqlalchemy.orm import Session
 from src.logic.items.item_interface import IItem
 from src.logic.users.user_interface import IUser
 from src.logic.execeptions.exceptions_items import  ItemDontHaveThisAttribute,\
                                                     NonChangeableProperty
 from src.logic.orms.orm import LabelORM
-from src.db.database import Database
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.orm import Session
+from src.db.unit_of_work import UnitOfWork
+from src.logic.events.event_bus import Created, Updated, Deleted
 
 class Label(IItem):
     """
@@ -39,8 +39,10 @@ class Label(IItem):
         update: Updates the label's attributes, except for non-changeable properties.
         Various property getters and setters for accessing and modifying label attributes.
     """
+    __slots__ = ('_user', '_name', '_color', '_id_label', '_unit_of_work')
 
-    def __init__(self, user: IUser, name: str,color: str, id_label: int = None, session: Session = None ) -> None:
+    def __init__(self, user: IUser, name: str,color: str, id_label: int = None,
+                 session: Session = None, unit_of_work: UnitOfWork = None) -> None:
         """
         Initialize a new Label object with given parameters.
 
@@ -48,6 +50,8 @@ class Label(IItem):
             User (IUser): The user associated with the label.
             name (str): The name of the label.
             color (str): The color of the label.
+            session (Session, optional): Session to use instead of the user's.
+            unit_of_work (UnitOfWork, optional): Unit of work to use instead of the user's.
         """
         self._user = user
         self._name = name
@@ -56,41 +60,53 @@ class Label(IItem):
 
         self._user.add_label(self)
 
-        if session is not None:
-            self.session_local = session
-        else:
-            self.db = Database()
-            self.session_local = sessionmaker(bind=self.db.engine)()
+        self._unit_of_work = UnitOfWork.resolve(unit_of_work, session,
+                                                getattr(user, 'unit_of_work', None))
 
-        if not self._id_label:
+        if self._id_label:
+            self._user.identity_map.add('label', self._id_label, self)
+        else:
             self.save_to_db()
+            self._unit_of_work.when_written(self._register_created)
 
     def save_to_db(self) -> None:
         """ Save the label to the database.
         """
-        with self.session_local as session:
-
-            new_label_orm = LabelORM(  id_user=self._user.id_user,
-                                        name = self._name,
-                                        color = self._color,
-                                        )
+        def new_label_orm() -> LabelORM:
+            return LabelORM(  id_user=self._user.id_user,
+                              name = self._name,
+                              color = self._color,
+                              )
+
+        def inserted(id_value: int) -> None:
+            self._id_label = id_value
+        self._unit_of_work.insert(self, new_label_orm, inserted)
+
+    def _register_created(self) -> None:
+        """ Register the new label, once saved, and publish its creation.
+        """
+        self._user.identity_map.add('label', self._id_label, self)
+        self._user.events.publish(Created(self))
 
-            session.add(new_label_orm)
-            self._id_label = new_label_orm.id_label
-            session.commit()
+    def _row_id(self) -> Any:
+        """ The id of the label's row, pending while its creation is not written.
+        """
+        return self._unit_of_work.row_id(self, self._id_label)
 
     def delete(self) -> None:
         """
         Delete the label and remove it from the associated user.
         """
         self._user.remove_label(self)
+        self._user.identity_map.remove('label', self._id_label, self)
+        self._unit_of_work.discard(LabelORM, self._id_label)
 
-        with self.session_local as session:
+        with self._unit_of_work.begin() as session:
             label_to_delete = session.query(LabelORM).filter\
                 (LabelORM.id_label == self._id_label).first()
             if label_to_delete:
                 session.delete(label_to_delete)
-                session.commit()
+        self._user.events.publish(Deleted(self))
 
     def update(self, **kwargs) -> None:
         """
@@ -110,18 +126,18 @@ class Label(IItem):
         if "user" in kwargs:
             raise NonChangeableProperty("You requested an update for a non-changeable property.")
 
-        with self.session_local as session:
-            label_to_update = session.query(LabelORM).filter\
-                (LabelORM.id_label == self._id_label).first()
-            if label_to_update:
-                for key, value in kwargs.items():
-                    attr_name = f"_{key}"
-                    if hasattr(self, attr_name):
-                        setattr(self, attr_name, value)
-                        setattr(label_to_update, key, value)
-                    else:
-                        raise ItemDontHaveThisAttribute(f"Label does not have the attribute {key}.")
-            session.commit()
+        old_name = self._name
+        fields = {}
+        for key, value in kwargs.items():
+            attr_name = f"_{key}"
+            if hasattr(self, attr_name):
+                setattr(self, attr_name, value)
+                fields[key] = value
+            else:
+                raise ItemDontHaveThisAttribute(f"Label does not have the attribute {key}.")
+        self._user.label_names.rename(self, old_name)
+        self._unit_of_work.persist(LabelORM, self._row_id(), **fields)
+        self._user.events.publish(Updated(self, tuple(fields)))
 
     @property
     def user(self) -> IUser:
@@ -142,3 +158,8 @@ class Label(IItem):
     def id_label(self) -> int:
         """int: The id of the label."""
         return self._id_label
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """UnitOfWork: The unit of work used to persist the label."""
+        return self._unit_of_work
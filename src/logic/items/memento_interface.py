@@ -11,13 +11,14 @@ for memento classes.
 
 Methods:
 - get_state(): An abstract method that specifies the structure for retrieving the 
-  state of the memento, returning a tuple.
+  state of the memento, returning the saved fields and their values.
 
 The IMemento class acts as a template defining the method required for accessing 
 the internal state of memento objects in various implementing classes.
 """
 
 from abc import ABC, abstractmethod
+from typing import Any, Dict
 
 class IMemento(ABC):
     """ This class represents the interface for a memento.
@@ -25,10 +26,12 @@ class IMemento(ABC):
     Args:
         ABC (ABC): The abstract base class for the memento.
     """
+    __slots__ = ()
+
     @abstractmethod
-    def get_state(self) -> tuple:
+    def get_state(self) -> Dict[str, Any]:
         """ Returns the state of the memento.
 
         Returns:
-            tuple: The state of the memento.
+            Dict[str, Any]: The saved fields and their values.
         """
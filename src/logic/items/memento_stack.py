@@ -0,0 +1,88 @@
+"""
+Module Name: Memento Stack
+
+Description:
+This module contains the MementoStack mixin, which keeps the mementos of an item.
+
+Most items are never edited during a session, so an empty list per item would only
+waste memory: the stack is created by the first memento saved, and released when the
+last one is restored or dropped.
+
+Every memento pushed is also recorded by the undo manager of the item's user, which
+bounds the history and drops the oldest mementos from their items.
+
+Classes:
+- MementoStack: Mixin holding the mementos of an item, allocated lazily.
+"""
+
+from typing import List
+from src.logic.items.memento_interface import IMemento
+
+
+class MementoStack:
+    """ Mixin holding the mementos of an item, allocated lazily.
+
+    Classes using it must set `_memento_stack` to None in their `__init__` and provide
+    an `undo_manager` property.
+
+    Attributes:
+        _memento_stack (List[IMemento]): Saved mementos, None while there are none.
+    """
+    __slots__ = ('_memento_stack',)
+
+    @property
+    def _mementos(self) -> List[IMemento]:
+        """List[IMemento]: The saved mementos, the last one on top."""
+        if self._memento_stack is None:
+            return []
+        return self._memento_stack
+
+    def _push_memento(self, memento: IMemento) -> None:
+        """ Save a memento on top of the stack, unless it holds no field.
+
+        Args:
+            memento (IMemento): The memento to save.
+        """
+        if not memento:
+            return
+        if self._memento_stack is None:
+            self._memento_stack = []
+        self._memento_stack.append(memento)
+        self.undo_manager.record(memento)
+
+    def _pop_memento(self) -> IMemento:
+        """ Take the memento on top of the stack.
+
+        Returns:
+            IMemento: The last memento saved, or None if there is none.
+        """
+        if not self._memento_stack:
+            return None
+        memento = self._memento_stack.pop()
+        if not self._memento_stack:
+            self._memento_stack = None
+        memento.detach()
+        return memento
+
+    def discard_memento(self, memento: IMemento) -> None:
+        """ Drop a memento the undo history no longer keeps.
+
+        Args:
+            memento (IMemento): The memento to drop.
+        """
+        stack = self._memento_stack or []
+        for index, each in enumerate(stack):
+            if each is memento:
+                del stack[index]
+                break
+        if not stack:
+            self._memento_stack = None
+        memento.detach()
+
+    def has_memento(self) -> bool:
+        """ Check if the item has a memento to restore.
+
+        Returns:
+            bool: True if the item has a memento to restore, False otherwise.
+        """
+        return bool(self._memento_stack)
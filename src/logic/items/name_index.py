@@ -0,0 +1,106 @@
+"""
+Module Name: Name Index
+
+Description:
+This module contains the NameIndex class, a dictionary from name to item kept by every
+container of items (the user's projects and labels, a project's tasks, a task's
+subtasks), so that checking if a name is taken and finding an item by its name take
+constant time instead of a walk through the whole list.
+
+Each ItemCollection builds its index on first use and keeps it up to date as items are
+added and removed; the items call `rename` when their name changes.
+
+The database does not forbid two siblings with the same name. When it happens, the
+index returns the most recently added one, like a search of the container's list
+(newest first) would; the others are kept aside and take its place if it is removed.
+
+Classes:
+- NameIndex: Name to item dictionary of a container.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+
+class NameIndex:
+    """ Name to item dictionary of a container.
+
+    Attributes:
+        _items (Dict[str, Any]): The most recently added item of each name.
+        _shadowed (Dict[str, List[Any]]): Older items sharing a name with another,
+            None while there are none.
+    """
+    __slots__ = ('_items', '_shadowed')
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """ Create an index.
+
+        Args:
+            items (Iterable[Any], optional): Items to index, oldest first. Defaults to none.
+        """
+        self._items: Dict[str, Any] = {}
+        self._shadowed: Dict[str, List[Any]] = None
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        """ Index an item under its name.
+
+        Args:
+            item (Any): The item to index.
+        """
+        name = item.name
+        current = self._items.get(name)
+        if current is not None and current is not item:
+            if self._shadowed is None:
+                self._shadowed = {}
+            self._shadowed.setdefault(name, []).append(current)
+        self._items[name] = item
+
+    def remove(self, item: Any, name: str = None) -> None:
+        """ Remove an item from the index.
+
+        Args:
+            item (Any): The item to remove.
+            name (str, optional): The name it is indexed under. Defaults to its name.
+        """
+        name = item.name if name is None else name
+        shadowed = self._shadowed.get(name) if self._shadowed else None
+        if self._items.get(name) is item:
+            if shadowed:
+                self._items[name] = shadowed.pop()
+            else:
+                del self._items[name]
+        elif shadowed and item in shadowed:
+            shadowed.remove(item)
+        if self._shadowed and not shadowed and name in self._shadowed:
+            del self._shadowed[name]
+
+    def rename(self, item: Any, old_name: str) -> None:
+        """ Move an item from its former name to its current one.
+
+        Args:
+            item (Any): The renamed item.
+            old_name (str): The name it had.
+        """
+        if old_name != item.name:
+            self.remove(item, old_name)
+            self.add(item)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """ Return the item with a name.
+
+        Args:
+            name (str): The name.
+            default (Any, optional): Returned when no item has the name. Defaults to None.
+
+        Returns:
+            Any: The item, or `default`.
+        """
+        return self._items.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
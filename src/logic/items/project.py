@@ -16,22 +16,27 @@ Exceptions:
 """
 
 from datetime import date
-from typing import List, Any
-from sqlalchemy.orm import sessionmaker
+from typing import Any, Dict
 from sqlalchemy.orm import Session
 
 from src.logic.items.item_interface import IItem
+from src.logic.items.item_collection import ItemCollection
+from src.logic.items.memento_stack import MementoStack
+from src.logic.items.undo_manager import UndoManager
+from src.logic.items.name_index import NameIndex
+from src.logic.users.identity_map import IdentityMap
 from src.logic.users.user_interface import IUser
 from src.logic.execeptions.exceptions_items import  ItemDontHaveThisAttribute,\
                                                     NonChangeableProperty,\
                                                     ItemNameAlreadyExists,\
                                                     ItemNameBlank
 from src.logic.items.project_memento import ProjectMemento
+from src.logic.events.event_bus import EventBus, Created, Updated, Moved, Deleted
 from src.logic.orms.orm import ProjectORM
-from src.db.database import Database
+from src.db.unit_of_work import UnitOfWork, written_id
 
 
-class Project(IItem):
+class Project(MementoStack, IItem):
     """
     A class to represent a project, implementing the IItem interface.
 
@@ -45,7 +50,9 @@ class Project(IItem):
         _conclusion_date (date): The date when the project was concluded. Default is None.
         _status (bool): The status of the project, indicating whether it is concluded.
                         Default is False.
-        _tasks (List[IItem]): A list of tasks associated with the project.
+        _tasks (ItemCollection): The tasks associated with the project, newest first.
+        _tasks_loader (TaskLoader): Loader of the tasks while they are still in the database,
+                                    None once they are loaded.
 
     Methods:
         delete: Deletes the project and its associated tasks.
@@ -56,11 +63,14 @@ class Project(IItem):
         unconclusion: Reverts the project's status to unconcluded.
         Various property getters for accessing project attributes.
     """
+    __slots__ = ('_user', '_name', '_id_label', '_label', '_end_date', '_description',
+                 '_creation_date', '_conclusion_date', '_status', '_id_project', '_tasks',
+                 '_tasks_loader', '_unit_of_work')
 
     def __init__(self, user: IUser ,name: str, id_project: int = None, label: IItem = None,
                  end_date: date = None, description: str = None, conclusion_date: date = None,
                  status: bool = False, creation_date: date = None, id_label: int = None,
-                 session:Session = None) -> None:
+                 session:Session = None, unit_of_work: UnitOfWork = None) -> None:
         """
         Initialize a new Project object with given parameters.
 
@@ -70,6 +80,9 @@ class Project(IItem):
             label (IItem, optional): A label associated with the project. Defaults to None.
             end_date (date, optional): The anticipated end date of the project. Defaults to None.
             description (str, optional): A brief description of the project. Defaults to None.
+            session (Session, optional): Session to use instead of the user's. Defaults to None.
+            unit_of_work (UnitOfWork, optional): Unit of work to use instead of the user's.
+                                                 Defaults to None.
         """
         self._user = user
         self._name = name
@@ -82,54 +95,69 @@ class Project(IItem):
         self._status = status
         self._id_project = id_project
 
-        self._tasks: List[IItem] = []
-        self._mementos = []
+        self._tasks = ItemCollection()
+        self._tasks_loader = None
+        self._memento_stack = None
         self._user.add_project(self)
 
-        if session is not None:
-            self.session_local = session
-        else:
-            self.db = Database()
-            self.session_local = sessionmaker(bind=self.db.engine)()
+        self._unit_of_work = UnitOfWork.resolve(unit_of_work, session,
+                                                getattr(user, 'unit_of_work', None))
 
-        if not self._id_project:
+        if self._id_project:
+            self._user.identity_map.add('project', self._id_project, self)
+        else:
             self.save_to_db()
+            self._unit_of_work.when_written(self._register_created)
 
 
     def save_to_db(self) -> None:
         """ Save the project to the database.
         """
-        print(self.label)
-        with self.session_local as session:
-            new_project_orm = ProjectORM(id_user=self._user.id_user,
-                                        id_label = self._label.id_label if self.label else None,
-                                        name = self._name,
-                                        status = self._status,
-                                        creation_date = self._creation_date,
-                                        end_date = self._end_date ,
-                                        description = self._description
-                                        )
-
-            session.add(new_project_orm)
-            session.commit()
-            self._id_project = new_project_orm.id_project
+        label = self._unit_of_work.row_id(self._label, self._label.id_label) \
+            if self._label else None
+
+        def new_project_orm() -> ProjectORM:
+            return ProjectORM(id_user=self._user.id_user,
+                              id_label = written_id(label),
+                              name = self._name,
+                              status = self._status,
+                              creation_date = self._creation_date,
+                              end_date = self._end_date ,
+                              description = self._description
+                              )
+
+        def inserted(id_value: int) -> None:
+            self._id_project = id_value
+        self._unit_of_work.insert(self, new_project_orm, inserted)
+
+    def _register_created(self) -> None:
+        """ Register the new project, once saved, and publish its creation.
+        """
+        self._user.identity_map.add('project', self._id_project, self)
+        self.events.publish(Created(self))
 
+    def _row_id(self) -> Any:
+        """ The id of the project's row, pending while its creation is not written.
+        """
+        return self._unit_of_work.row_id(self, self._id_project)
 
     def delete(self):
         """
         Delete the project and its associated tasks. Also, removes the project from the
         associated user.
         """
-        for task in self._tasks[:]:
+        for task in self.tasks[:]:
             task.delete()
 
         self._user.remove_project(self)
-        with self.session_local as session:
+        self._user.identity_map.remove('project', self._id_project, self)
+        self._unit_of_work.discard(ProjectORM, self._id_project)
+        with self._unit_of_work.begin() as session:
             project_to_delete = session.query(ProjectORM).filter\
                 (ProjectORM.id_project == self._id_project).first()
             if project_to_delete:
                 session.delete(project_to_delete)
-                session.commit()
+        self.events.publish(Deleted(self))
 
     def update(self, **kwargs: Any) -> None:
         """
@@ -159,7 +187,7 @@ class Project(IItem):
             raise NonChangeableProperty("You requested an update for a non-changeable property.")
 
         name = kwargs.get('name')
-        if name in [project.name for project in self._user.projects] and name != self._name:
+        if name in self._user.project_names and name != self._name:
             erro_str = "Já existe um projeto com esse nome"
             raise ItemNameAlreadyExists(erro_str)
         if name is None or name == '':
@@ -168,23 +196,26 @@ class Project(IItem):
 
         label = kwargs.get("label")
         self._id_label = label.id_label if label else None
-        self.save_to_memento()
-        with self.session_local as session:
-            project_to_update = session.query(ProjectORM).filter\
-                (ProjectORM.id_project == self._id_project).first()
-            if label:
-                project_to_update.id_label = label.id_label
-            if project_to_update:
-                for key, value in kwargs.items():
-                    attr_name = f"_{key}"
-                    if hasattr(self, attr_name):
-                        setattr(self, attr_name, value)
-                        setattr(project_to_update, key, value)
-                    else:
-                        raise ItemDontHaveThisAttribute(f"Project does not have the\
-                             attribute {key}.")
-
-            session.commit()
+        memento = self.save_to_memento(kwargs)
+        old_name = self._name
+        old_label = self._label
+        fields = {}
+        for key, value in kwargs.items():
+            attr_name = f"_{key}"
+            if hasattr(self, attr_name):
+                setattr(self, attr_name, value)
+                if key == 'label':
+                    fields['id_label'] = self._unit_of_work.row_id(label, self._id_label)
+                else:
+                    fields[key] = value
+            else:
+                raise ItemDontHaveThisAttribute(f"Project does not have the\
+                     attribute {key}.")
+        self._user.project_names.rename(self, old_name)
+        self._unit_of_work.persist(ProjectORM, self._row_id(), **fields)
+        if memento:
+            self._publish_update(memento.fields, old_label)
+
 
     def add_task(self, task: IItem) -> None:
         """
@@ -193,7 +224,8 @@ class Project(IItem):
         Parameters:
             task (IItem): The task item to be added to the project.
         """
-        self._tasks.insert(0, task)
+        self._load_tasks()
+        self._tasks.add(task)
 
     def remove_task(self, task: IItem) -> None:
         """
@@ -202,88 +234,103 @@ class Project(IItem):
         Parameters:
             task (IItem): The task item to be removed from the project.
         """
+        self._load_tasks()
         self._tasks.remove(task)
 
     def conclusion(self) -> None:
         """
         Mark the project as concluded and set the current date as the conclusion date.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': True, 'conclusion_date': date.today()})
         self._status = True
         self._conclusion_date = date.today()
-        with self.session_local as session:
-            project_to_update = session.query(ProjectORM).filter\
-                (ProjectORM.id_project == self._id_project).first()
-            if project_to_update:
-                project_to_update.status = self._status
-                project_to_update.conclusion_date = self._conclusion_date
-                session.commit()
+        self._unit_of_work.persist(ProjectORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
 
     def unconclusion(self) -> None:
         """
         Revert the project's status to unconcluded and reset the conclusion date to None.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': False, 'conclusion_date': None})
         self._status = False
         self._conclusion_date = None
-        with self.session_local as session:
-            project_to_update = session.query(ProjectORM).filter\
-                (ProjectORM.id_project == self._id_project).first()
-            if project_to_update:
-                project_to_update.status = self._status
-                project_to_update.conclusion_date = self._conclusion_date
-                session.commit()
+        self._unit_of_work.persist(ProjectORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
 
-    def save_to_memento(self) -> None:
-        """ Save the project's attributes to the memento.
-        """
-        memento = ProjectMemento(
-            self._name,
-            self._label,
-            self._end_date,
-            self._description,
-            self._status,
-            self._conclusion_date
-        )
-        self._mementos.append(memento)
-
-    def has_memento(self) -> bool:
-        """ Check if the project has mementos to restore.
+    def save_to_memento(self, changes: Dict[str, Any] = None) -> ProjectMemento:
+        """ Save the project's attributes an operation is about to change to the memento.
+
+        Args:
+            changes (Dict[str, Any], optional): The new values of the operation. Defaults
+                to saving every attribute.
 
         Returns:
-            bool: True if the project has mementos to restore, False otherwise.
+            ProjectMemento: The memento, holding the attributes the operation changes.
         """
-        return bool(len(self._mementos) > 0)
+        memento = ProjectMemento(self, changes)
+        self._push_memento(memento)
+        return memento
 
     def restore_from_memento(self) -> None:
         """ Restore the project's attributes from the memento.
         """
-        if self._mementos:
-            memento = self._mementos.pop()
+        memento = self._pop_memento()
+        if memento:
             state = memento.get_state()
-
-            self._name, self._label, self._end_date, \
-            self._description, self._status, self._conclusion_date = state
-
-            with self.session_local as session:
-                project_to_update = session.query(ProjectORM).filter\
-                    (ProjectORM.id_project == self._id_project).first()
-                if project_to_update:
-                    project_to_update.name = self._name
-                    project_to_update.label = self._label
-                    project_to_update.end_date = self._end_date
-                    project_to_update.description = self._description
-                    project_to_update.status = self._status
-                    project_to_update.conclusion_date = self._conclusion_date
-                    session.commit()
+            old_name = self._name
+            old_label = self._label
+            for field, value in state.items():
+                setattr(self, f'_{field}', value)
+
+            if 'label' in state:
+                self._id_label = self._label.id_label if self._label else None
+                state['id_label'] = self._unit_of_work.row_id(self._label, self._id_label)
+                del state['label']
+            self._user.project_names.rename(self, old_name)
+            self._unit_of_work.persist(ProjectORM, self._row_id(), **state)
+            self._publish_update(memento.fields, old_label)
         else:
             print("Sem mementos para restaurar")
 
     @property
-    def tasks(self) -> List[IItem]:
-        """List[IItem]: The list of tasks associated with this project."""
+    def task_names(self) -> NameIndex:
+        """NameIndex: The tasks of the project, by name."""
+        return self.tasks.names
+
+    @property
+    def tasks(self) -> ItemCollection:
+        """ItemCollection: The tasks associated with this project, newest first."""
+        self._load_tasks()
         return self._tasks
 
+    def defer_tasks(self, loader: Any) -> None:
+        """ Leave the tasks of the project in the database until they are first needed.
+
+        Parameters:
+            loader (TaskLoader): Loader called with the project on the first access to
+                                 its tasks. None marks the tasks as loaded.
+        """
+        self._tasks_loader = loader
+
+    @property
+    def deferred_tasks(self) -> Any:
+        """TaskLoader: The loader of the project's tasks, None once they are loaded."""
+        return self._tasks_loader
+
+    def _publish_update(self, fields: tuple, old_label: IItem) -> None:
+        if self._label is not old_label:
+            self.events.publish(Moved(self, fields, old_label, self._label))
+        else:
+            self.events.publish(Updated(self, fields))
+
+    def _load_tasks(self) -> None:
+        if self._tasks_loader is not None:
+            self._tasks_loader.load(self)
+
     @property
     def name(self) -> str:
         """str: The name of the project."""
@@ -323,3 +370,23 @@ class Project(IItem):
     def id_project(self) -> int:
         """int: The id of the project."""
         return self._id_project
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """UnitOfWork: The unit of work shared with the project's tasks."""
+        return self._unit_of_work
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """IdentityMap: The identity map of the project's user."""
+        return self._user.identity_map
+
+    @property
+    def events(self) -> EventBus:
+        """EventBus: The change events of the project's user."""
+        return self._user.events
+
+    @property
+    def undo_manager(self) -> UndoManager:
+        """UndoManager: The undo history of the project's user."""
+        return self._user.undo_manager
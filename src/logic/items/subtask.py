@@ -14,19 +14,22 @@ Exceptions:
 """
 
 from datetime import date
-from sqlalchemy.orm import sessionmaker
+from typing import Any, Dict
 from sqlalchemy.orm import Session
 
 from src.logic.items.item_interface import IItem
 from src.logic.items.subtask_memento import SubtaskMemento
+from src.logic.items.memento_stack import MementoStack
+from src.logic.items.undo_manager import UndoManager
+from src.logic.events.event_bus import EventBus, Created, Updated, Deleted
 from src.logic.execeptions.exceptions_items import  ItemDontHaveThisAttribute,\
                                                     NonChangeableProperty,\
                                                     ItemNameBlank,\
                                                     ItemNameAlreadyExists
 from src.logic.orms.orm import SubtaskORM
-from src.db.database import Database
+from src.db.unit_of_work import UnitOfWork, written_id
 
-class Subtask(IItem):
+class Subtask(MementoStack, IItem):
     """
     Class for creating and managing subtasks.
 
@@ -41,56 +44,77 @@ class Subtask(IItem):
         conclusion(): Mark the subtask as completed.
         unconclusion(): Mark the subtask as not completed.
     """
+    __slots__ = ('_task', '_name', '_id_subtask', '_status', '_conclusion_date',
+                 '_unit_of_work')
 
     def __init__(self, task: IItem ,name: str, id_subtask: int = None,
                  status: bool = False, conclusion_date:date = None,
-                 session: Session = None) -> None:
+                 session: Session = None, unit_of_work: UnitOfWork = None) -> None:
         """
         Initialize a Subtask instance.
 
         Args:
             task (IItem): The parent task to which the subtask belongs.
             name (str): The name of the subtask.
+            session (Session, optional): Session to use instead of the task's.
+            unit_of_work (UnitOfWork, optional): Unit of work to use instead of the task's.
         """
         self._task = task
         self._name = name
         self._id_subtask = id_subtask
         self._status = status
         self._conclusion_date = conclusion_date
-        self._mementos = []
+        self._memento_stack = None
 
         self._task.add_subtask(self)
 
-        if session is not None:
-            self.session_local = session
-        else:
-            self.db = Database()
-            self.session_local = sessionmaker(bind=self.db.engine)()
+        self._unit_of_work = UnitOfWork.resolve(unit_of_work, session,
+                                                getattr(task, 'unit_of_work', None))
 
-        if self._id_subtask is None:
+        if self._id_subtask is not None:
+            self._task.identity_map.add('subtask', self._id_subtask, self)
+        else:
             self.save_to_db()
+            self._unit_of_work.when_written(self._register_created)
 
     def save_to_db(self) -> None:
         """ Save the subtask to the database.
         """
-        with self.session_local as session:
-            new_subtask_orm = SubtaskORM(id_task=self._task.id_task,
-                                         name = self._name,
-                                         status = self._status)
-            session.add(new_subtask_orm)
-            session.commit()
-            self._id_subtask = new_subtask_orm.id_subtask
+        # pylint: disable=protected-access
+        task = self._task._row_id()
+
+        def new_subtask_orm() -> SubtaskORM:
+            return SubtaskORM(id_task=written_id(task),
+                              name = self._name,
+                              status = self._status)
+
+        def inserted(id_value: int) -> None:
+            self._id_subtask = id_value
+        self._unit_of_work.insert(self, new_subtask_orm, inserted)
+
+    def _register_created(self) -> None:
+        """ Register the new subtask, once saved, and publish its creation.
+        """
+        self._task.identity_map.add('subtask', self._id_subtask, self)
+        self.events.publish(Created(self))
+
+    def _row_id(self) -> Any:
+        """ The id of the subtask's row, pending while its creation is not written.
+        """
+        return self._unit_of_work.row_id(self, self._id_subtask)
 
     def delete(self) -> None:
         """Remove the subtask from its parent task.
         """
         self._task.remove_subtask(self)
-        with self.session_local as session:
+        self._task.identity_map.remove('subtask', self._id_subtask, self)
+        self._unit_of_work.discard(SubtaskORM, self._id_subtask)
+        with self._unit_of_work.begin() as session:
             subtask_to_delete = session.query(SubtaskORM).filter(SubtaskORM.id_subtask\
                          == self._id_subtask).first()
             if subtask_to_delete:
                 session.delete(subtask_to_delete)
-                session.commit()
+        self.events.publish(Deleted(self))
 
     def update(self, **kwargs) -> None:
         """
@@ -110,88 +134,79 @@ class Subtask(IItem):
             raise NonChangeableProperty("You requested an update for a non-changeable property.")
 
         name = kwargs.get('name')
-        if name in [subtask.name for subtask in self._task.subtasks] and name != self._name:
+        if name in self._task.subtask_names and name != self._name:
             erro_str = "Já existe uma subtask com esse nome"
             raise ItemNameAlreadyExists(erro_str)
         if name is None or name == '':
             erro_str = "Campo 'nome' é obrigatório"
             raise ItemNameBlank(erro_str)
-        self.save_to_memento()
-
-        with self.session_local as session:
-            subtask_to_update = session.query(SubtaskORM).filter(SubtaskORM.id_subtask\
-                     == self._id_subtask).first()
-            if subtask_to_update:
-                for key, value in kwargs.items():
-                    attr_name = f"_{key}"
-                    if hasattr(self, attr_name):
-                        setattr(self, attr_name, value)
-                        setattr(subtask_to_update, key, value)
-                    else:
-                        raise ItemDontHaveThisAttribute(f"Subtask does\
-                             not have the attribute {key}.")
-                session.commit()
+        memento = self.save_to_memento(kwargs)
+
+        old_name = self._name
+        fields = {}
+        for key, value in kwargs.items():
+            attr_name = f"_{key}"
+            if hasattr(self, attr_name):
+                setattr(self, attr_name, value)
+                fields[key] = value
+            else:
+                raise ItemDontHaveThisAttribute(f"Subtask does\
+                     not have the attribute {key}.")
+        self._task.subtask_names.rename(self, old_name)
+        self._unit_of_work.persist(SubtaskORM, self._row_id(), **fields)
+        if memento:
+            self.events.publish(Updated(self, memento.fields))
 
     def conclusion(self) -> None:
         """ Mark the subtask as completed.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': True, 'conclusion_date': date.today()})
 
         self._status = True
         self._conclusion_date = date.today()
-        with self.session_local as session:
-            subtask_to_update = session.query(SubtaskORM).filter\
-                (SubtaskORM.id_subtask == self._id_subtask).first()
-            if subtask_to_update:
-                subtask_to_update.status = self._status
-                subtask_to_update.conclusion_date = self._conclusion_date
-                session.commit()
+        self._unit_of_work.persist(SubtaskORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
 
     def unconclusion(self) -> None:
         """ Mark the subtask as not completed.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': False, 'conclusion_date': None})
 
         self._status = False
         self._conclusion_date = None
-        with self.session_local as session:
-            subtask_to_update = session.query(SubtaskORM).filter\
-                (SubtaskORM.id_subtask == self._id_subtask).first()
-            if subtask_to_update:
-                subtask_to_update.status = self._status
-                subtask_to_update.conclusion_date = self._conclusion_date
-                session.commit()
+        self._unit_of_work.persist(SubtaskORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
 
-    def save_to_memento(self) -> None:
-        """ Save the current state of the subtask to a memento.
-        """
-        memento = SubtaskMemento(self._name, self._status, self._conclusion_date)
-        self._mementos.append(memento)
+    def save_to_memento(self, changes: Dict[str, Any] = None) -> SubtaskMemento:
+        """ Save the fields of the subtask an operation is about to change to a memento.
 
-    def has_memento(self) -> bool:
-        """ Check if the subtask has mementos to restore.
+        Args:
+            changes (Dict[str, Any], optional): The new values of the operation. Defaults
+                to saving every field.
 
         Returns:
-            bool: True if the subtask has mementos, False otherwise.
+            SubtaskMemento: The memento, holding the fields the operation changes.
         """
-        return bool(len(self._mementos) > 0)
+        memento = SubtaskMemento(self, changes)
+        self._push_memento(memento)
+        return memento
 
     def restore_from_memento(self) -> None:
         """ Restore the subtask to its previous state.
         """
-        if self._mementos:
-            name, status, conclusion_date = self._mementos.pop().get_state()
-            self._name = name
-            self._status = status
-            self._conclusion_date = conclusion_date
-            with self.session_local as session:
-                subtask_to_update = session.query(SubtaskORM).filter\
-                    (SubtaskORM.id_subtask == self._id_subtask).first()
-                if subtask_to_update:
-                    subtask_to_update.name = self._name
-                    subtask_to_update.status = self._status
-                    subtask_to_update.conclusion_date = self._conclusion_date
-                    session.commit()
+        memento = self._pop_memento()
+        if memento:
+            state = memento.get_state()
+            old_name = self._name
+            for field, value in state.items():
+                setattr(self, f'_{field}', value)
+            self._task.subtask_names.rename(self, old_name)
+            self._unit_of_work.persist(SubtaskORM, self._row_id(), **state)
+            self.events.publish(Updated(self, tuple(state)))
         else:
             print("Sem mementos para restaurar")
 
@@ -239,3 +254,18 @@ class Subtask(IItem):
             int: The id of the subtask.
         """
         return self._id_subtask
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """UnitOfWork: The unit of work used to persist the subtask."""
+        return self._unit_of_work
+
+    @property
+    def undo_manager(self) -> UndoManager:
+        """UndoManager: The undo history of the subtask's user."""
+        return self._task.undo_manager
+
+    @property
+    def events(self) -> EventBus:
+        """EventBus: The change events of the subtask's user."""
+        return self._task.events
@@ -14,21 +14,30 @@ Exceptions:
     NonChangeableProperty: Exception for unmodifiable task properties.
 """
 
-from typing import List, Any
+from typing import Any, Dict
 from datetime import date
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import Session
 
 from src.logic.items.item_interface import IItem
+from src.logic.items.item_collection import ItemCollection
+from src.logic.items.memento_stack import MementoStack
+from src.logic.items.undo_manager import UndoManager
+from src.logic.items.name_index import NameIndex
 from src.logic.execeptions.exceptions_items import  ItemDontHaveThisAttribute,\
                                                     NonChangeableProperty,\
                                                     ItemNameAlreadyExists,\
                                                     ItemNameBlank
 from src.logic.items.task_memento import TaskMemento
+from src.logic.events.event_bus import EventBus, Created, Updated, Deleted
 from src.logic.orms.orm import TaskORM
-from src.db.database import Database
+from src.logic.users.identity_map import IdentityMap
+from src.db.unit_of_work import UnitOfWork, written_id
 
-class Task(IItem):
+# Shared by the tasks without subtasks, most of them; never added to.
+_NO_SUBTASKS = ItemCollection()
+
+
+class Task(MementoStack, IItem):
     """
     Represents a task in a project management system.
 
@@ -48,7 +57,8 @@ class Task(IItem):
         _conclusion_date (date, optional): The date the task was concluded. Defaults to None.
         _status (bool): The status of the task, where False indicates incomplete and
                         Trueindicates complete.
-        _subtasks (List[IItem]): A list of subtasks under this task.
+        _subtasks (ItemCollection): The subtasks under this task, newest first. None until
+                                    the first subtask is added.
 
     Methods:
         delete: Deletes the task and its subtasks from the project.
@@ -58,12 +68,18 @@ class Task(IItem):
         conclusion: Marks the task as concluded.
         unconclusion: Reverts the task to an unconcluded state.
         Various property getters for accessing task attributes.
+
+    Tasks are slotted: an account may hold many thousands of them, and a per-instance
+    `__dict__` would cost more than the task's own data.
     """
+    __slots__ = ('_project', '_name', '_priority', '_description', '_end_date',
+                 '_notification_date', '_id_task', '_creation_date', '_conclusion_date',
+                 '_status', '_subtasks', '_unit_of_work')
 
     def __init__(self,  project: IItem, name: str, id_task: int = None, priority: str = None,
                  end_date: date = None, notification_date: date = None, description: str = None,
                  conclusion_date:date = None, status: bool = False, creation_date: date = None,
-                 session: Session = None) -> None:
+                 session: Session = None, unit_of_work: UnitOfWork = None) -> None:
         """
         Initializes a new Task object with given parameters.
 
@@ -75,6 +91,10 @@ class Task(IItem):
             notification_date (date, optional): The date for sending a notification about the task.
                                                 Defaults to None.
             description (str, optional): A description of the task. Defaults to None.
+            session (Session, optional): Session to use instead of the project's.
+                                         Defaults to None.
+            unit_of_work (UnitOfWork, optional): Unit of work to use instead of the project's.
+                                                 Defaults to None.
         """
         self._project = project
         self._name = name
@@ -86,37 +106,51 @@ class Task(IItem):
         self._creation_date = creation_date if creation_date else date.today()
         self._conclusion_date = conclusion_date
         self._status = status
-        self._subtasks: List[IItem] = []
-        self._mementos: List[TaskMemento] = []
+        self._subtasks: ItemCollection = None
+        self._memento_stack = None
 
         self._project.add_task(self)
 
-        if session is not None:
-            self.session_local = session
-        else:
-            self.db = Database()
-            self.session_local = sessionmaker(bind=self.db.engine)()
+        self._unit_of_work = UnitOfWork.resolve(unit_of_work, session,
+                                                getattr(project, 'unit_of_work', None))
 
-        if not self._id_task:
+        if self._id_task:
+            self._project.identity_map.add('task', self._id_task, self)
+        else:
             self.save_to_db()
+            self._unit_of_work.when_written(self._register_created)
 
     def save_to_db(self) -> None:
         """ Saves the task to the database.
         """
-        with self.session_local as session:
-            new_task_orm = TaskORM( id_project=self._project.id_project,
-                                    name = self._name,
-                                    status = self._status,
-                                    creation_date = self._creation_date,
-                                    priority = self._priority,
-                                    end_date = self._end_date,
-                                    notification_date = self._notification_date,
-                                    description = self._description
-                                    )
-
-            session.add(new_task_orm)
-            session.commit()
-            self._id_task = new_task_orm.id_task
+        # pylint: disable=protected-access
+        project = self._project._row_id()
+
+        def new_task_orm() -> TaskORM:
+            return TaskORM( id_project=written_id(project),
+                            name = self._name,
+                            status = self._status,
+                            creation_date = self._creation_date,
+                            priority = self._priority,
+                            end_date = self._end_date,
+                            notification_date = self._notification_date,
+                            description = self._description
+                            )
+
+        def inserted(id_value: int) -> None:
+            self._id_task = id_value
+        self._unit_of_work.insert(self, new_task_orm, inserted)
+
+    def _register_created(self) -> None:
+        """ Registers the new task, once saved, and publishes its creation.
+        """
+        self._project.identity_map.add('task', self._id_task, self)
+        self.events.publish(Created(self))
+
+    def _row_id(self) -> Any:
+        """ The id of the task's row, pending while its creation is not written.
+        """
+        return self._unit_of_work.row_id(self, self._id_task)
 
     # pylint: disable=pointless-string-statement
     """
@@ -155,14 +189,16 @@ class Task(IItem):
         """
         Deletes the task and its subtasks from the project.
         """
-        for subtask in self._subtasks[:]:
+        for subtask in self.subtasks[:]:
             subtask.delete()
         self._project.remove_task(self)
-        with self.session_local as session:
+        self._project.identity_map.remove('task', self._id_task, self)
+        self._unit_of_work.discard(TaskORM, self._id_task)
+        with self._unit_of_work.begin() as session:
             task_to_delete = session.query(TaskORM).filter(TaskORM.id_task == self._id_task).first()
             if task_to_delete:
                 session.delete(task_to_delete)
-                session.commit()
+        self.events.publish(Deleted(self))
 
     # pylint: disable=pointless-string-statement
     """
@@ -229,25 +265,27 @@ class Task(IItem):
             raise NonChangeableProperty('You requested an update for a non-changeable property.')
 
         name = kwargs.get('name')
-        if name in [task.name for task in self._project.tasks] and name != self._name:
+        if name in self._project.task_names and name != self._name:
             erro_str = "Já existe uma task com esse nome"
             raise ItemNameAlreadyExists(erro_str)
         if name is None or name == '':
             erro_str = "Campo 'nome' é obrigatório"
             raise ItemNameBlank(erro_str)
 
-        self.save_to_memento()
-        with self.session_local as session:
-            task_to_update = session.query(TaskORM).filter(TaskORM.id_task == self._id_task).first()
-            if task_to_update:
-                for key, value in kwargs.items():
-                    attr_name = f"_{key}"
-                    if hasattr(self, attr_name):
-                        setattr(self, attr_name, value)
-                        setattr(task_to_update, key, value)
-                    else:
-                        raise ItemDontHaveThisAttribute(f"Task does not have the attribute {key}.")
-            session.commit()
+        memento = self.save_to_memento(kwargs)
+        old_name = self._name
+        fields = {}
+        for key, value in kwargs.items():
+            attr_name = f"_{key}"
+            if hasattr(self, attr_name):
+                setattr(self, attr_name, value)
+                fields[key] = value
+            else:
+                raise ItemDontHaveThisAttribute(f"Task does not have the attribute {key}.")
+        self._project.task_names.rename(self, old_name)
+        self._unit_of_work.persist(TaskORM, self._row_id(), **fields)
+        if memento:
+            self.events.publish(Updated(self, memento.fields))
 
     def add_subtask(self, subtask: IItem) -> None:
         """
@@ -256,7 +294,9 @@ class Task(IItem):
         Args:
             subtask (IItem): The subtask to be added.
         """
-        self._subtasks.insert(0, subtask)
+        if self._subtasks is None:
+            self._subtasks = ItemCollection()
+        self._subtasks.add(subtask)
 
     def remove_subtask(self, subtask: IItem) -> None:
         """
@@ -265,7 +305,7 @@ class Task(IItem):
         Args:
             subtask (IItem): The subtask to be removed.
         """
-        self._subtasks.remove(subtask)
+        self.subtasks.remove(subtask)
 
     def conclusion(self) -> None:
         """
@@ -273,15 +313,13 @@ class Task(IItem):
 
         Sets the task's status to True and records the conclusion date.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': True, 'conclusion_date': date.today()})
         self._status = True
         self._conclusion_date = date.today()
-        with self.session_local as session:
-            task_to_update = session.query(TaskORM).filter(TaskORM.id_task == self._id_task).first()
-            if task_to_update:
-                task_to_update.status = self._status
-                task_to_update.conclusion_date = self._conclusion_date
-                session.commit()
+        self._unit_of_work.persist(TaskORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
 
     def unconclusion(self) -> None:
         """
@@ -289,66 +327,53 @@ class Task(IItem):
 
         Sets the task's status to False and resets the conclusion date.
         """
-        self.save_to_memento()
+        self.save_to_memento({'status': False, 'conclusion_date': None})
         self._status = False
         self._conclusion_date = None
-        with self.session_local as session:
-            task_to_update = session.query(TaskORM).filter(TaskORM.id_task == self._id_task).first()
-            if task_to_update:
-                task_to_update.status = self._status
-                task_to_update.conclusion_date = self._conclusion_date
-                session.commit()
-
-    def save_to_memento(self) -> None:
-        """ Saves the current state of the task to a memento.
-        """
-        memento = TaskMemento(
-            self._name,
-            self._priority,
-            self._end_date,
-            self._notification_date,
-            self._description,
-            self._status,
-            self._conclusion_date
-        )
-        self._mementos.append(memento)
-
-    def has_memento(self) -> bool:
-        """ Checks if the task has a memento to restore.
+        self._unit_of_work.persist(TaskORM, self._row_id(),
+                                   status=self._status,
+                                   conclusion_date=self._conclusion_date)
+        self.events.publish(Updated(self, ('status', 'conclusion_date')))
+
+    def save_to_memento(self, changes: Dict[str, Any] = None) -> TaskMemento:
+        """ Saves the fields of the task an operation is about to change to a memento.
+
+        Args:
+            changes (Dict[str, Any], optional): The new values of the operation. Defaults
+                to saving every field.
 
         Returns:
-            bool: True if the task has a memento to restore, False otherwise.
+            TaskMemento: The memento, holding the fields the operation changes.
         """
-        return bool(len(self._mementos) > 0)
+        memento = TaskMemento(self, changes)
+        self._push_memento(memento)
+        return memento
 
     def restore_from_memento(self) -> None:
         """ Restores the task's state from a memento.
         """
-        memento = self._mementos.pop()
-        state = memento.get_state()
-
-        self._name, self._priority, self._end_date, \
-        self._notification_date, self._description, \
-        self._status, self._conclusion_date = state
-
-        with self.session_local as session:
-            if self._mementos:
-                task_to_update = session.query(TaskORM).filter(TaskORM.id_task\
-                                 == self._id_task).first()
-                if task_to_update:
-                    task_to_update.name = self._name
-                    task_to_update.priority = self._priority
-                    task_to_update.end_date = self._end_date
-                    task_to_update.notification_date = self._notification_date
-                    task_to_update.description = self._description
-                    task_to_update.status = self._status
-                    task_to_update.conclusion_date = self._conclusion_date
-                    session.commit()
-            else:
-                print("Sem mementos para restaurar")
+        memento = self._pop_memento()
+        if memento:
+            state = memento.get_state()
+            old_name = self._name
+            for field, value in state.items():
+                setattr(self, f'_{field}', value)
+
+            self._project.task_names.rename(self, old_name)
+            self._unit_of_work.persist(TaskORM, self._row_id(), **state)
+            self.events.publish(Updated(self, tuple(state)))
+        else:
+            print("Sem mementos para restaurar")
     @property
-    def subtasks(self) -> List[IItem]:
-        """List[IItem]: The list of subtasks associated with this task."""
+    def subtask_names(self) -> NameIndex:
+        """NameIndex: The subtasks of the task, by name."""
+        return self.subtasks.names
+
+    @property
+    def subtasks(self) -> ItemCollection:
+        """ItemCollection: The subtasks associated with this task, newest first."""
+        if self._subtasks is None:
+            return _NO_SUBTASKS
         return self._subtasks
 
     @property
@@ -401,3 +426,23 @@ class Task(IItem):
         """int: The id of the task.
         """
         return self._id_task
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """UnitOfWork: The unit of work shared with the task's subtasks."""
+        return self._unit_of_work
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """IdentityMap: The identity map of the task's user."""
+        return self._project.identity_map
+
+    @property
+    def undo_manager(self) -> UndoManager:
+        """UndoManager: The undo history of the task's user."""
+        return self._project.undo_manager
+
+    @property
+    def events(self) -> EventBus:
+        """EventBus: The change events of the task's user."""
+        return self._project.events
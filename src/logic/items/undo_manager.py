@@ -0,0 +1,178 @@
+"""
+Module Name: Undo Manager
+
+Description:
+This module contains the UndoManager class, the undo history shared by the items of a
+user.
+
+Every memento saved by an item is also recorded by the undo manager of its user, as one
+undo step, or as part of the current step inside a `group()` block. The history keeps
+at most `depth` steps: when a new step goes over the limit, the oldest one is dropped
+and its mementos are removed from their items, so a long session does not keep every
+change it ever made.
+
+`undo()` restores the items of the last step, newest change first, inside one
+transaction of each unit of work involved (a single one in the application).
+`undo(item)` does the same with the last step of an item, which is what the undo
+button of an item's page calls; the operations of the pages are recorded in groups,
+so an operation changing several items is undone at once.
+
+An item can still restore its own last memento (`restore_from_memento`); the manager
+then skips that memento when it reaches its step.
+
+Classes:
+- UndoManager: Bounded history of the changes made to the items of a user.
+"""
+
+import threading
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from typing import Deque, Iterator, List
+from src.logic.items.item_memento import ItemMemento
+
+
+class UndoManager:
+    """ Bounded history of the changes made to the items of a user.
+
+    Attributes:
+        _depth (int): Maximum number of undo steps kept.
+        _steps (Deque[List[ItemMemento]]): The undo steps, oldest first.
+        _lock (threading.Lock): Guards the steps.
+        _local (threading.local): The step being grouped by each thread, if any.
+    """
+    def __init__(self, depth: int = 50) -> None:
+        """ Create an empty history.
+
+        Args:
+            depth (int, optional): Maximum number of undo steps kept. Defaults to 50.
+        """
+        self._depth = depth
+        self._steps: Deque[List[ItemMemento]] = deque()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def depth(self) -> int:
+        """int: Maximum number of undo steps kept."""
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth: int) -> None:
+        with self._lock:
+            self._depth = depth
+            self._trim()
+
+    def record(self, memento: ItemMemento) -> None:
+        """ Record a memento saved by an item.
+
+        Args:
+            memento (ItemMemento): The memento.
+        """
+        group = getattr(self._local, 'group', None)
+        if group is not None:
+            group.append(memento)
+            return
+        self._push([memento])
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        """ Record the mementos saved in the block as a single undo step.
+
+        Nested groups are part of the outermost one.
+        """
+        if getattr(self._local, 'group', None) is not None:
+            yield
+            return
+        self._local.group = []
+        try:
+            yield
+        finally:
+            step, self._local.group = self._local.group, None
+            if step:
+                self._push(step)
+
+    def can_undo(self) -> bool:
+        """ Check if there is a change to undo.
+
+        Returns:
+            bool: True if a step still has a memento to restore.
+        """
+        with self._lock:
+            return any(memento.item is not None for step in self._steps for memento in step)
+
+    def undo(self, item: object = None) -> bool:
+        """ Restore the items of the last undo step, or of the last step of an item.
+
+        The step of an item can be undone only while none of its items was changed
+        again by a later step: each memento restored must be the last of its item.
+
+        Args:
+            item (object, optional): The item whose last step is undone. Defaults to the
+                last step of any item.
+
+        Returns:
+            bool: True if a step was undone, False if there was nothing to undo.
+        """
+        with self._lock:
+            step = self._pop_step(item)
+        if not step:
+            return False
+
+        units = {id(memento.item.unit_of_work): memento.item.unit_of_work for memento in step}
+        with ExitStack() as transactions:
+            for unit_of_work in units.values():
+                transactions.enter_context(unit_of_work.begin())
+            for memento in reversed(step):
+                memento.item.restore_from_memento()
+        return True
+
+    def clear(self) -> None:
+        """ Drop the whole history.
+        """
+        with self._lock:
+            while self._steps:
+                self._drop(self._steps.popleft())
+
+    def _push(self, step: List[ItemMemento]) -> None:
+        with self._lock:
+            self._steps.append(step)
+            self._trim()
+
+    def _trim(self) -> None:
+        while len(self._steps) > self._depth:
+            self._drop(self._steps.popleft())
+
+    def _pop_step(self, item: object = None) -> List[ItemMemento]:
+        for index in range(len(self._steps) - 1, -1, -1):
+            step = [memento for memento in self._steps[index] if memento.item is not None]
+            if not step:
+                del self._steps[index]
+            elif item is None or any(memento.item is item for memento in step):
+                if not self._on_top(step):
+                    return None
+                del self._steps[index]
+                return step
+        return None
+
+    @staticmethod
+    def _on_top(step: List[ItemMemento]) -> bool:
+        """ Check that the mementos of a step are the last ones of their items. """
+        items = {}
+        for memento in step:
+            items.setdefault(id(memento.item), (memento.item, []))[1].append(memento)
+        for each, mementos in items.values():
+            # pylint: disable=protected-access
+            stack = each._mementos
+            if len(stack) < len(mementos) or any(
+                    a is not b for a, b in zip(stack[-len(mementos):], mementos)):
+                return False
+        return True
+
+    @staticmethod
+    def _drop(step: List[ItemMemento]) -> None:
+        for memento in step:
+            if memento.item is not None:
+                memento.item.discard_memento(memento)
+
+    def __len__(self) -> int:
+        return len(self._steps)
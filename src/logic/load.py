@@ -2,6 +2,11 @@
 
 This module provides a 'Load' class for loading data from JSON files and populating the application.
 
+The whole document is validated before anything is written. By default the items are then
+inserted in bulk: one batched INSERT per level (projects, tasks, subtasks) inside a single
+transaction, after which the in-memory objects are built from the returned ids. Nothing is
+written, and no object is created, if any step fails.
+
 Classes:
     Load: Contains methods to read and process data from JSON files.
 
@@ -13,7 +18,8 @@ Raises:
     InvalidFileEstucture: Raised for invalid file structure.
     FileNotFoundError: Raised when the selected file is not found.
     ItemNameAlreadyExists: Raised if a project name already exists in the user's projects.
-    ItemNameBlank: Raised if a project or task name is blank.
+    ItemNameAlreadyExists: Raised if a name is repeated inside the file.
+    ItemNameBlank: Raised if a project, task or subtask name is blank.
 
 Example Usage:
     # Example usage of json_reader method
@@ -23,10 +29,17 @@ Example Usage:
 import json
 import os
 from typing import List
-from datetime import datetime
+from datetime import datetime, date
 from src.logic.users.user_interface import IUser
 from src.logic.users.user import User
 from src.logic.items.item_factory import ItemFactory
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+from src.logic.items.subtask import Subtask
+from src.logic.events.event_bus import Created
+from src.logic.orms.orm import ProjectORM, TaskORM, SubtaskORM
+from src.db.repository import Repository
+from src.db.unit_of_work import UnitOfWork
 # pylint: disable=redefined-builtin
 from src.logic.execeptions.exceptions_items import ItemNameBlank,\
                                                     ItemNameAlreadyExists, \
@@ -61,12 +74,18 @@ class Load:
 
 
     @staticmethod
-    def json_reader(usr: IUser,file_path: str) -> None:
+    def json_reader(usr: IUser,file_path: str, unit_of_work: UnitOfWork = None,
+                    bulk: bool = True) -> None:
         """
         Reads a JSON file and loads the data into the application.
 
+        The whole import runs in a single transaction of the user's unit of work: either
+        every project, task and subtask of the file is saved, or none is.
+
         :param usr: IUser object representing the current usr.
         :param file_path: Path to the JSON file.
+        :param unit_of_work: Unit of work to use instead of the user's.
+        :param bulk: Insert the rows in batches (default) instead of item by item.
         :raises FileNotFoundError, InvalidFileFormat, InvalidFileStructure,
         ItemNameBlank, ItemNameAlreadyExists
         """
@@ -80,38 +99,135 @@ class Load:
             except json.JSONDecodeError as exc:
                 raise InvalidFileFormat("Invalid content in JSON file.") from exc
 
+        Load.validate(usr, data)
+
+        unit_of_work = unit_of_work or usr.unit_of_work
+        if bulk:
+            Load.bulk_insert(usr, data, unit_of_work)
+        else:
+            Load.item_insert(usr, data, unit_of_work)
+
+    @staticmethod
+    def validate(usr: IUser, data: List) -> None:
+        """ Runs every check on a document before anything is written.
+
+        :raises InvalidFileStructure, ItemNameBlank, ItemNameAlreadyExists
+        """
         Load.check_file_structure(data)
         Load.check_project_name_blank(data)
         Load.check_task_name_blank(data)
+        Load.check_subtask_name_blank(data)
         Load.check_duplicate_project_name(usr, data)
+        Load.check_duplicate_names_in_file(data)
+        Load.check_dates(data)
 
+    @staticmethod
+    def bulk_insert(usr: IUser, data: List, unit_of_work: UnitOfWork) -> None:
+        """ Inserts a validated document with one batched INSERT per level.
+
+        The rows are written in a single transaction. The projects, tasks and subtasks
+        of the user are only created once it succeeded, with the ids returned by the
+        database, so a failure leaves both the database and the user untouched. Each
+        task and subtask finds its parent by id in the user's identity map. Items built
+        with an id publish no event, so their creation is published here, once all of
+        them exist.
+        """
+        today = date.today()
+        with unit_of_work.begin() as session:
+            repository = Repository(session)
+            project_ids = repository.insert_many(ProjectORM, [
+                {'id_user': usr.id_user,
+                 'name': each_project['project'],
+                 'status': False,
+                 'creation_date': today,
+                 'end_date': Load.date_converter(each_project['end_date']),
+                 'description': each_project['description']}
+                for each_project in data], key=('id_user', 'name'))
+
+            tasks = [(id_project, each_task)
+                     for id_project, each_project in zip(project_ids, data)
+                     for each_task in each_project['tasks']]
+            task_ids = repository.insert_many(TaskORM, [
+                {'id_project': id_project,
+                 'name': each_task['task'],
+                 'status': False,
+                 'creation_date': today,
+                 'priority': each_task['priority'],
+                 'end_date': Load.date_converter(each_task['end_date']),
+                 'notification_date': Load.date_converter(each_task['notification_date']),
+                 'description': each_task['description']}
+                for id_project, each_task in tasks], key=('id_project', 'name'))
+
+            subtasks = [(id_task, each_subtask)
+                        for id_task, (_, each_task) in zip(task_ids, tasks)
+                        for each_subtask in each_task['subtasks']]
+            subtask_ids = repository.insert_many(SubtaskORM, [
+                {'id_task': id_task,
+                 'name': each_subtask['subtask'],
+                 'status': False}
+                for id_task, each_subtask in subtasks], key=('id_task', 'name'))
+
+        created = []
+        for id_project, each_project in zip(project_ids, data):
+            created.append(Project(user=usr,
+                                   name=each_project['project'],
+                                   id_project=id_project,
+                                   end_date=Load.date_converter(each_project['end_date']),
+                                   description=each_project['description'],
+                                   creation_date=today,
+                                   unit_of_work=unit_of_work))
+
+        identity_map = usr.identity_map
+        for id_task, (id_project, each_task) in zip(task_ids, tasks):
+            created.append(Task(project=identity_map.get_project(id_project),
+                                name=each_task['task'],
+                                id_task=id_task,
+                                priority=each_task['priority'],
+                                end_date=Load.date_converter(each_task['end_date']),
+                                notification_date=Load.date_converter(
+                                    each_task['notification_date']),
+                                description=each_task['description'],
+                                creation_date=today))
+
+        for id_subtask, (id_task, each_subtask) in zip(subtask_ids, subtasks):
+            created.append(Subtask(task=identity_map.get_task(id_task),
+                                   name=each_subtask['subtask'],
+                                   id_subtask=id_subtask))
+
+        events = usr.events
+        for item in created:
+            events.publish(Created(item))
 
-
-        for each_project in data:
-            project_end_date = Load.date_converter(each_project['end_date'])
-            projet = ItemFactory.create_item(item_type='project',
-                                            user=usr,
-                                            name=each_project['project'],
-                                            end_date=project_end_date,
-                                            description=each_project['description'])
-
-            for each_task in each_project['tasks']:
-                task_end_date = Load.date_converter(each_task['end_date'])
-                notification_date = Load.date_converter(each_task['notification_date'])
-                task = ItemFactory.create_item(item_type='task',
-                                            project=projet,
-                                            name=each_task['task'],
-                                            priority=each_task['priority'],
-                                            end_date=task_end_date,
-                                            notification_date=notification_date,
-                                            description=each_task['description'])
-
-                for each_subtask in each_task['subtasks']:
-                    print(task)
-                    # pylint: disable=unused-variable
-                    subtask = ItemFactory.create_item(item_type = 'subtask',
-                                           task = task,
-                                           name = each_subtask['subtask'])
+    @staticmethod
+    def item_insert(usr: IUser, data: List, unit_of_work: UnitOfWork) -> None:
+        """ Inserts a validated document item by item, through the ItemFactory.
+        """
+        with unit_of_work.begin():
+            for each_project in data:
+                project_end_date = Load.date_converter(each_project['end_date'])
+                projet = ItemFactory.create_item(item_type='project',
+                                                user=usr,
+                                                name=each_project['project'],
+                                                end_date=project_end_date,
+                                                description=each_project['description'],
+                                                unit_of_work=unit_of_work)
+
+                for each_task in each_project['tasks']:
+                    task_end_date = Load.date_converter(each_task['end_date'])
+                    notification_date = Load.date_converter(each_task['notification_date'])
+                    task = ItemFactory.create_item(item_type='task',
+                                                project=projet,
+                                                name=each_task['task'],
+                                                priority=each_task['priority'],
+                                                end_date=task_end_date,
+                                                notification_date=notification_date,
+                                                description=each_task['description'])
+
+                    for each_subtask in each_task['subtasks']:
+                        # pylint: disable=unused-variable
+                        subtask = ItemFactory.create_item(item_type = 'subtask',
+                                               task = task,
+                                               name = each_subtask['subtask'])
 
     @staticmethod
     def check_formart(file_path: str) -> None:
@@ -156,7 +272,7 @@ class Load:
         """ Checks if the name of some project to import already exists in the user's projects.
         """
         for each_project in data:
-            if each_project['project'] in [project.name for project in usr.projects]:
+            if each_project['project'] in usr.project_names:
                 error_str = f"You already have a project named: {each_project['project']}."
                 error_str += "\nPlease change the project name and try again."
                 raise ItemNameAlreadyExists(error_str)
@@ -179,3 +295,56 @@ class Load:
                 if each_task['task'] == '':
                     error_str = "The name of some task to import is blank."
                     raise ItemNameBlank(error_str)
+
+    @staticmethod
+    def check_subtask_name_blank(data: List) -> None:
+        """ Checks if the name of some subtask to import is blank.
+        """
+        for each_project in data:
+            for each_task in each_project['tasks']:
+                for each_subtask in each_task['subtasks']:
+                    if not isinstance(each_subtask, dict) or 'subtask' not in each_subtask:
+                        raise InvalidFileEstucture("Invalid subtask format.")
+                    if each_subtask['subtask'] == '':
+                        error_str = "The name of some subtask to import is blank."
+                        raise ItemNameBlank(error_str)
+
+    @staticmethod
+    def check_duplicate_names_in_file(data: List) -> None:
+        """ Checks if a project, task or subtask name is repeated inside the file.
+        """
+        project_names = set()
+        for each_project in data:
+            if each_project['project'] in project_names:
+                error_str = f"The project {each_project['project']} appears more than once."
+                raise ItemNameAlreadyExists(error_str)
+            project_names.add(each_project['project'])
+
+            task_names = set()
+            for each_task in each_project['tasks']:
+                if each_task['task'] in task_names:
+                    error_str = f"The task {each_task['task']} appears more than once "
+                    error_str += f"in the project {each_project['project']}."
+                    raise ItemNameAlreadyExists(error_str)
+                task_names.add(each_task['task'])
+
+                subtask_names = set()
+                for each_subtask in each_task['subtasks']:
+                    if each_subtask['subtask'] in subtask_names:
+                        error_str = f"The subtask {each_subtask['subtask']} appears more than "
+                        error_str += f"once in the task {each_task['task']}."
+                        raise ItemNameAlreadyExists(error_str)
+                    subtask_names.add(each_subtask['subtask'])
+
+    @staticmethod
+    def check_dates(data: List) -> None:
+        """ Checks if every date of the file can be read.
+        """
+        try:
+            for each_project in data:
+                Load.date_converter(each_project['end_date'])
+                for each_task in each_project['tasks']:
+                    Load.date_converter(each_task['end_date'])
+                    Load.date_converter(each_task['notification_date'])
+        except (ValueError, TypeError) as exc:
+            raise InvalidFileEstucture(f"Invalid date: {exc}") from exc
@@ -23,6 +23,9 @@ Methods:
   due_date_tasks.
 - check_passed_due_date(today): Identifies tasks overdue before the current day 
   and adds them to due_date_tasks.
+- tasks_between(field, lower, upper, priority): Selects the tasks with a date in a
+  range, and a priority, with the vectorized predicates of the user's task snapshot,
+  instead of scanning every task.
 - check_priority(task): Checks if a task has high priority and adds it to the 
   urgent_tasks set.
 - add_notification_date_task(task): Adds tasks with notification dates to 
@@ -83,10 +86,8 @@ class Notification:
         """ This method will be used to check the notification date of the tasks
         """
         today = datetime.date.today()
-        for each_project in self.usr.projects:
-            for each_task in each_project.tasks:
-                if each_task.notification_date == today:
-                    self.add_notification_date_task(each_task)
+        for each_task in self.tasks_between('notification_date', today, today):
+            self.add_notification_date_task(each_task)
 
     #pylint: disable=pointless-string-statement
     """
@@ -113,10 +114,8 @@ class Notification:
     # step 5:
     def check_due_date(self) -> None:
         today = datetime.date.today()
-        for each_project in self.usr.projects:
-            for each_task in each_project.tasks:
-                if each_task.end_date == today:
-                    self.add_due_date_task(each_task)
+        for each_task in self.tasks_between('end_date', today, today):
+            self.add_due_date_task(each_task)
     """
 
     def check_due_date(self) -> None:
@@ -131,28 +130,47 @@ class Notification:
     def check_tomorrows_due_date(self, today: datetime.date) -> None:
         """ Check for tasks due tomorrow and handle accordingly
         """
-        for each_project in self.usr.projects:
-            for each_task in each_project.tasks:
-                if each_task.end_date == today + datetime.timedelta(days=1):
-                    self.check_priority(each_task)
+        tomorrow = today + datetime.timedelta(days=1)
+        for each_task in self.tasks_between('end_date', tomorrow, tomorrow, priority='Alta'):
+            self.add_urgent_task(each_task)
 
     def check_todays_due_date(self, today: datetime.date) -> None:
         """ Check for tasks due today and handle accordingly
         """
-        for each_project in self.usr.projects:
-            for each_task in each_project.tasks:
-                if each_task.end_date == today:
-                    self.add_due_date_task(each_task)
+        for each_task in self.tasks_between('end_date', today, today):
+            self.add_due_date_task(each_task)
 
     def check_passed_due_date(self, today: datetime.date) -> None:
         """ Check for tasks due before today and handle accordingly
         """
-        for each_project in self.usr.projects:
-            for each_task in each_project.tasks:
-                task_due_date = each_task.end_date.date() if \
-                      isinstance(each_task.end_date, datetime.datetime) else each_task.end_date
-                if task_due_date is not None and task_due_date < today:
-                    self.add_due_date_task(each_task)
+        yesterday = today - datetime.timedelta(days=1)
+        for each_task in self.tasks_between('end_date', datetime.date.min, yesterday):
+            self.add_due_date_task(each_task)
+
+    def tasks_between(self, field: str, lower: datetime.date,
+                      upper: datetime.date, priority: str = None) -> list:
+        """ Select the tasks with a date in a range with the vectorized predicates of
+        the user's task snapshot, or read them from the user's result cache while the
+        user's data is unchanged
+
+        Args:
+            field (str): 'end_date' or 'notification_date'
+            lower (datetime.date): Lower limit
+            upper (datetime.date): Upper limit
+            priority (str, optional): Keep only the tasks of this priority. Defaults to
+                any.
+
+        Returns:
+            list: The tasks of every project of the user
+        """
+        def read() -> list:
+            snapshot = self.usr.views.task_snapshot
+            mask = snapshot.between(field, lower, upper)
+            if priority is not None:
+                mask &= snapshot.where(priority=priority)
+            return snapshot.tasks(mask)
+        key = ('tasks_between', field, lower, upper, priority)
+        return list(self.usr.views.result_cache.get(key, read))
 
     def check_priority(self, task: IItem) -> None:
         """ This method will be used to check the priority of the tasks
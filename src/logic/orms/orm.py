@@ -32,6 +32,9 @@ from the 'Task' table.
 Note:
 - These classes define the database schema and relationships using SQLAlchemy ORM,
 reflecting the structure of the underlying database tables and their connections.
+- The columns the application looks rows up by (foreign keys, the login name and the
+task dates) are indexed. Existing databases get the indexes from the migrations of
+`src.db.migrations`.
 """
 
 
@@ -54,7 +57,7 @@ class UserORM(Base):
     __tablename__ = 'User'
 
     id_user = Column(Integer, primary_key=True)
-    name = Column(String(50), nullable=False)
+    name = Column(String(50), nullable=False, index=True)
     email = Column(String(50), nullable=False)
     password = Column(String(25), nullable=False)
 
@@ -81,7 +84,7 @@ class LabelORM(Base):
     __tablename__ = 'Label'
 
     id_label = Column(Integer, primary_key=True)
-    id_user = Column(Integer, ForeignKey('User.id_user'), nullable=False)
+    id_user = Column(Integer, ForeignKey('User.id_user'), nullable=False, index=True)
     name = Column(String(50), nullable=False)
     color = Column(String(25), nullable=False)
 
@@ -97,7 +100,7 @@ class ProjectORM(Base):
     __tablename__ = 'Project'
 
     id_project = Column(Integer, primary_key=True)
-    id_user = Column(Integer, ForeignKey('User.id_user'), nullable=False)
+    id_user = Column(Integer, ForeignKey('User.id_user'), nullable=False, index=True)
     id_label = Column(Integer, ForeignKey('Label.id_label'))
     name = Column(String(50), nullable=False)
     status = Column(Boolean, nullable=False)
@@ -127,13 +130,13 @@ class TaskORM(Base):
     __tablename__ = 'Task'
 
     id_task = Column(Integer, primary_key=True)
-    id_project = Column(Integer, ForeignKey('Project.id_project'), nullable=False)
+    id_project = Column(Integer, ForeignKey('Project.id_project'), nullable=False, index=True)
     name = Column(String(50), nullable=False)
     status = Column(Boolean, nullable=False)
     creation_date = Column(Date, nullable=False)
-    end_date = Column(Date)
+    end_date = Column(Date, index=True)
     conclusion_date = Column(Date)
-    notification_date = Column(Date)
+    notification_date = Column(Date, index=True)
     priority = Column(String(25))
     description = Column(String(300))
 
@@ -160,7 +163,7 @@ class SubtaskORM(Base):
     __tablename__ = 'Subtask'
 
     id_subtask = Column(Integer, primary_key=True)
-    id_task = Column(Integer, ForeignKey('Task.id_task'), nullable=False)
+    id_task = Column(Integer, ForeignKey('Task.id_task'), nullable=False, index=True)
     name = Column(String(150), nullable=False)
     status = Column(Boolean, nullable=False)
     conclusion_date = Column(Date)
@@ -0,0 +1,85 @@
+"""
+Module Name: Identity Map
+
+Description:
+This module contains the IdentityMap class, the registry of the items of a user by
+their database id.
+
+Every label, project, task and subtask registers itself in the identity map of its
+user once it has an id (read from the database or returned by its INSERT), and leaves
+it when it is deleted. Code that holds ids, such as the hydration wiring projects to
+their labels or an import wiring tasks to their projects, finds the item in constant
+time instead of walking the user's graph.
+
+Classes:
+- IdentityMap: Items of a user by kind and database id.
+"""
+
+from typing import Any, Dict
+
+
+class IdentityMap:
+    """ Items of a user by kind ('label', 'project', 'task', 'subtask') and database id.
+
+    Attributes:
+        _items (Dict[str, Dict[int, Any]]): The items of each kind, by id.
+    """
+    __slots__ = ('_items',)
+
+    def __init__(self) -> None:
+        self._items: Dict[str, Dict[int, Any]] = {}
+
+    def add(self, kind: str, id_value: int, item: Any) -> None:
+        """ Register an item under its id. Items without an id yet are ignored.
+
+        Args:
+            kind (str): The kind of the item.
+            id_value (int): The database id of the item.
+            item (Any): The item.
+        """
+        if id_value is not None:
+            self._items.setdefault(kind, {})[id_value] = item
+
+    def remove(self, kind: str, id_value: int, item: Any) -> None:
+        """ Unregister an item, if it is the one registered under its id.
+
+        Args:
+            kind (str): The kind of the item.
+            id_value (int): The database id of the item.
+            item (Any): The item.
+        """
+        items = self._items.get(kind)
+        if items is not None and items.get(id_value) is item:
+            del items[id_value]
+
+    def get(self, kind: str, id_value: int, default: Any = None) -> Any:
+        """ Return the item of a kind with an id.
+
+        Args:
+            kind (str): The kind of the item.
+            id_value (int): The database id of the item.
+            default (Any, optional): Returned when no item has the id. Defaults to None.
+
+        Returns:
+            Any: The item, or `default`.
+        """
+        return self._items.get(kind, {}).get(id_value, default)
+
+    def get_label(self, id_label: int) -> Any:
+        """ Return the label with an id, or None. """
+        return self.get('label', id_label)
+
+    def get_project(self, id_project: int) -> Any:
+        """ Return the project with an id, or None. """
+        return self.get('project', id_project)
+
+    def get_task(self, id_task: int) -> Any:
+        """ Return the task with an id, or None. """
+        return self.get('task', id_task)
+
+    def get_subtask(self, id_subtask: int) -> Any:
+        """ Return the subtask with an id, or None. """
+        return self.get('subtask', id_subtask)
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._items.values())
@@ -0,0 +1,125 @@
+"""
+Module providing ResultCache, the memoized views of a user's data.
+
+The screens compute the same views again and again (filters, dashboard numbers, the
+tasks of the calendar and of the notifications) while the data is unchanged. The
+cache keeps their results under a key and the version of the user's data: every
+change event of the user's items (creation, update, move, deletion, undo) bumps the
+version, so a result computed before a change is never returned after it, and a
+result computed since is returned without work. Loading the tasks of a deferred project
+(lazy hydration) is not a change and publishes no event, but the views computed before
+it may have left those tasks out: the task loader bumps the version too.
+
+The cache is bounded: past `size` results, the least recently used one is dropped,
+stale results first since they are never read again. The numbers of hits and misses
+are counted, to see what the cache saves.
+
+Usage:
+    - Decorate the methods of a view over the user's data with `cached`.
+
+Example:
+    tasks = user.views.result_cache.get(('late', today), lambda: compute_late_tasks(user))
+"""
+
+import copy
+import datetime
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from src.logic.events.event_bus import ChangeEvent, EventBus
+
+DEFAULT_SIZE = 256
+
+
+class ResultCache:
+    """ A bounded LRU cache of results, keyed by the version of the user's data
+
+    Attributes:
+        size (int): Maximum number of results kept.
+        version (int): Version of the user's data, bumped by every change event.
+        hits (int): Number of results returned from the cache.
+        misses (int): Number of results computed.
+    """
+    def __init__(self, events: EventBus, size: int = DEFAULT_SIZE) -> None:
+        """ Initialize the class and follow the changes of the user's items
+
+        Args:
+            events (EventBus): The change events of the user's items
+            size (int, optional): Maximum number of results kept. Defaults to
+                DEFAULT_SIZE.
+        """
+        self.size = size
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        events.subscribe(self.on_change)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """ The result of a key for the current data, computed if it is not cached
+
+        Args:
+            key (Hashable): Key of the result, without the version
+            compute (Callable[[], Any]): Computes the result
+
+        Returns:
+            Any: The result, shared with the other readers of the key: do not modify it
+        """
+        versioned = (key, self.version)
+        if versioned in self._results:
+            self.hits += 1
+            self._results.move_to_end(versioned)
+            return self._results[versioned]
+        self.misses += 1
+        result = compute()
+        # Computing may load deferred tasks: the result holds them.
+        self._results[(key, self.version)] = result
+        if len(self._results) > self.size:
+            self._results.popitem(last=False)
+        return result
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """ Bump the version of the data, so that the results cached are not read again
+
+        Args:
+            event (ChangeEvent): The change event
+        """
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """ Bump the version of the data without a change event, as when deferred tasks
+        are loaded
+        """
+        self.version += 1
+
+    def clear(self) -> None:
+        """ Forget every result and reset the counters
+        """
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def cached(method: Callable) -> Callable:
+    """ Memoize a method of a view over the user's data in the user's result cache
+
+    The view needs `user` and `cache_scope`, the state that selects its data (such as
+    the project shown). The key also holds the class, the method, its arguments and
+    today's date, since views such as late tasks change at midnight. Lists, sets and
+    dictionaries are returned as shallow copies, which the caller may modify.
+
+    Args:
+        method (Callable): Method of the view
+
+    Returns:
+        Callable: The memoized method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args: Any) -> Any:
+        key = (type(self).__name__, method.__name__, args, self.cache_scope,
+               datetime.date.today())
+        return copy.copy(self.user.views.result_cache.get(key, lambda: method(self, *args)))
+    return wrapper
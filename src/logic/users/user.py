@@ -1,109 +1,99 @@
 """
 This module defines the User class, which is an implementation of the IUser interface.
-The User class is designed as a singleton, ensuring that only one instance of the user
-exists within the application context. It provides methods for managing labels and
-projects associated with the user, as well as properties to access the user's attributes.
+It provides methods for managing labels and projects associated with the user, as well as
+properties to access the user's attributes.
 
 Classes:
-    User (IUser): A singleton class that implements the IUser interface. It provides
-    functionality to manage user-specific data such as labels and projects. The User
-    class allows adding and removing labels and projects, and provides access to the
-    user's name, labels, and projects.
+    User (IUser): A class that implements the IUser interface. It provides functionality
+    to manage user-specific data such as labels and projects. The User class allows adding
+    and removing labels and projects, and provides access to the user's name, labels, and
+    projects.
 
 Note:
-    The User class follows the Singleton design pattern to ensure that only a single
-    instance of the User exists in the application.
+    A process can hold several users at once: each User owns its own object graph,
+    identity map, undo history, change events, history of completed tasks and views,
+    and only the engine and connection pool of the `Database` are shared (see
+    `UserContext`).
 """
 
-from typing import List
 from src.logic.items.item_interface import IItem
+from src.logic.items.item_collection import ItemCollection
+from src.logic.items.name_index import NameIndex
+from src.logic.items.undo_manager import UndoManager
+from src.logic.history.task_history import TaskHistory
+from src.logic.events.event_bus import EventBus, Updated, Deleted
+from src.logic.users.identity_map import IdentityMap
 from src.logic.users.user_interface import IUser
+from src.logic.users.user_views import UserViews
 from src.logic.orms.orm import UserORM
-from src.db.database import Database
-from sqlalchemy.orm import sessionmaker
+from src.db.unit_of_work import UnitOfWork
 from sqlalchemy.orm import Session
 
 class User(IUser):
     """
-    A singleton class that implements the IUser interface, representing a user in the application.
+    A class that implements the IUser interface, representing a user in the application.
 
-    This class ensures that only one instance of a user exists within the application context.
     It provides methods for managing labels and projects associated with the user, as well as
-    properties to access the user's name, labels, and projects. The class is designed to be
-    initialized only once; subsequent attempts to instantiate it will return the existing instance.
+    properties to access the user's name, labels, and projects. Every instance is independent:
+    the items, identity map and histories of one user are never seen by another.
 
     Attributes:
-        _instance (User): A class-level attribute that holds the singleton instance of the User.
         _name (str): The name of the user.
-        _labels (List[IItem]): A list of labels associated with the user.
-        _projects (List[IItem]): A list of projects associated with the user.
+        _labels (ItemCollection): The labels associated with the user, newest first.
+        _projects (ItemCollection): The projects associated with the user, newest first.
+        _identity_map (IdentityMap): The items of the user, by database id.
+        _undo_manager (UndoManager): The undo history of the user's items.
+        _history (TaskHistory): The history of the user's completed tasks, kept up to date
+                                from the change events.
+        _events (EventBus): The change events of the user's items.
+        _views (UserViews): The views derived from the user's items (indexes, caches,
+                            snapshots), built on first use.
 
     Methods:
-        __new__: A class method to control the instantiation of the User class, ensuring it follows
-                 the singleton pattern.
-        __init__: Initializes the User instance with a name, labels, and projects. This method is
-                  designed to run only once.
+        __init__: Initializes the User instance with a name, labels, and projects.
         add_label: Adds a label to the user's collection of labels.
         remove_label: Removes a label from the user's collection of labels.
         add_project: Adds a project to the user's collection of projects.
         remove_project: Removes a project from the user's collection of projects.
         Various property getters for accessing user attributes.
     """
-    _instance = None
-
-    def __new__(cls, name: str, id_user: int=None, session: Session = None) -> IUser:
-        """
-        Control the instantiation of the User class, ensuring it follows the singleton pattern.
-
-        This method checks if an instance of the class already exists. If not, it creates a new
-        instance. If an instance already exists, it returns the existing instance, ignoring
-        further initialization attempts.
-
-        Parameters:
-            name (str): The name of the user. Used during the first initialization of the instance.
-
-        Returns:
-            User: The singleton instance of the User class.
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self, name: str, id_user: int = None, session: Session = None) -> None:
+    def __init__(self, name: str, id_user: int = None, session: Session = None,
+                 unit_of_work: UnitOfWork = None) -> None:
         """
         Initialize the User instance.
 
-        This method is designed to run only once. It sets up the user's name, labels, and projects.
-        Subsequent attempts to initialize an instance of this class will not reinitialize these
-        attributes.
+        It sets up the user's name, labels, and projects, and saves the user to the database
+        when no id is given.
 
         Parameters:
             name (str): The name of the user.
-        """
-        if not self._initialized:
-            super().__init__(name)
-            self._name = name
-            self._labels: List[IItem] = []
-            self._projects: List[IItem] = []
-            self._initialized = True
-            self._id_user = id_user
-
-            if session is not None:
-                self.SessionLocal = session
-            else:
-                self.db = Database()
-                self.SessionLocal = sessionmaker(bind=self.db.engine)()
-
-            if not self._id_user:
-                self.seve_to_db()
+            id_user (int, optional): Database id of the user.
+            session (Session, optional): Session shared by the user's items.
+            unit_of_work (UnitOfWork, optional): Unit of work shared by the user's items.
+        """
+        super().__init__(name)
+        self._name = name
+        self._labels = ItemCollection()
+        self._projects = ItemCollection()
+        self._identity_map = IdentityMap()
+        self._undo_manager = UndoManager()
+        self._history = TaskHistory()
+        self._events = EventBus()
+        self._events.subscribe(self._history.on_change, Updated, Deleted)
+        self._views = UserViews(self)
+        self._id_user = id_user
+
+        self._unit_of_work = UnitOfWork.resolve(unit_of_work, session)
+
+        if not self._id_user:
+            self.seve_to_db()
 
     def seve_to_db(self):
-        with self.SessionLocal as session:
+        with self._unit_of_work.begin() as session:
             new_user_orm = UserORM(name=self._name)
             session.add(new_user_orm)
+            session.flush()
             self._id_user = new_user_orm.id_user
-            session.commit()
 
 
     def add_label(self, label: IItem) -> None:
@@ -113,7 +103,7 @@ class User(IUser):
         Parameters:
             label (IItem): The label to be added to the user's collection.
         """
-        self._labels.insert(0, label)
+        self._labels.add(label)
         # adicionar no banco de dados
 
     def remove_label(self, label: IItem) -> None:
@@ -132,7 +122,7 @@ class User(IUser):
         Parameters:
             project (IItem): The project to be added to the user's collection.
         """
-        self._projects.insert(0,project)
+        self._projects.add(project)
 
     def remove_project(self, project: IItem) -> None:
         """
@@ -154,25 +144,105 @@ class User(IUser):
         return self._name
 
     @property
-    def labels(self) -> List[IItem]:
+    def labels(self) -> ItemCollection:
         """
-        Return the list of labels associated with the user.
+        Return the labels associated with the user.
 
         Returns:
-            List[IItem]: A list of labels associated with the user.
+            ItemCollection: The labels associated with the user, newest first.
         """
         return self._labels
 
     @property
-    def projects(self) -> List[IItem]:
+    def projects(self) -> ItemCollection:
         """
-        Return the list of projects associated with the user.
+        Return the projects associated with the user.
 
         Returns:
-            List[IItem]: A list of projects associated with the user.
+            ItemCollection: The projects associated with the user, newest first.
         """
         return self._projects
-    
+
+    @property
+    def label_names(self) -> NameIndex:
+        """
+        Return the index of the user's labels by name.
+
+        Returns:
+            NameIndex: The labels of the user, by name.
+        """
+        return self._labels.names
+
+    @property
+    def project_names(self) -> NameIndex:
+        """
+        Return the index of the user's projects by name.
+
+        Returns:
+            NameIndex: The projects of the user, by name.
+        """
+        return self._projects.names
+
     @property
     def id_user(self) -> int:
         return self._id_user
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Return the unit of work shared by the user's labels and projects.
+
+        Returns:
+            UnitOfWork: The user's unit of work.
+        """
+        return self._unit_of_work
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """
+        Return the registry of the user's items by database id.
+
+        Returns:
+            IdentityMap: The labels, projects, tasks and subtasks of the user, by id.
+        """
+        return self._identity_map
+
+    @property
+    def undo_manager(self) -> UndoManager:
+        """
+        Return the undo history shared by the user's items.
+
+        Returns:
+            UndoManager: The bounded history of the changes made to the user's items.
+        """
+        return self._undo_manager
+
+    @property
+    def history(self) -> TaskHistory:
+        """
+        Return the history of the user's completed tasks.
+
+        Returns:
+            TaskHistory: The completed tasks of the user.
+        """
+        return self._history
+
+    @property
+    def views(self) -> UserViews:
+        """
+        Return the views derived from the user's items.
+
+        Returns:
+            UserViews: The indexes, caches and snapshots of the user, built on first use.
+        """
+        return self._views
+
+    @property
+    def events(self) -> EventBus:
+        """
+        Return the bus of the change events of the user's items.
+
+        Returns:
+            EventBus: The bus views, caches and indexes subscribe to.
+        """
+        return self._events
@@ -0,0 +1,219 @@
+"""
+Module Name: User Context
+
+Description:
+This module contains the UserContext class, the session of one user in a process that
+can serve many, and the UserContexts registry of the sessions open in a process.
+
+A context owns everything that belongs to its user: the object graph (labels,
+projects, tasks and subtasks), the identity map, the undo history, the change events,
+the history of completed tasks, the views derived from the items and the unit of
+work. Contexts share nothing but the engine and connection pool of the process: their
+units of work create their sessions from the same session factory, by default the one
+of `Database`. Opening a second user is then a hydration on a warm pool, not a new
+interpreter with a cold engine.
+
+Classes:
+- UserContext: The session of one user: its object graph and per-user state.
+- UserContexts: Thread-safe registry of the contexts open in a process, by user id.
+"""
+
+import threading
+from typing import Dict, Optional
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.db.database import Database
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.events.event_bus import EventBus
+from src.logic.history.task_history import TaskHistory
+from src.logic.items.undo_manager import UndoManager
+from src.logic.orms.orm import UserORM
+from src.logic.users.identity_map import IdentityMap
+from src.logic.users.user import User
+from src.logic.users.user_views import UserViews
+
+
+class UserContext:
+    """ The session of one user: its object graph and per-user state.
+
+    Attributes:
+        _user (User): The user, root of the object graph of the context.
+    """
+    def __init__(self, user: User) -> None:
+        """ Wrap a user already built.
+
+        Args:
+            user (User): The user of the context.
+        """
+        self._user = user
+
+    @classmethod
+    def open(cls, db_user: UserORM, session: Session,
+             session_factory: sessionmaker = None, lazy: bool = None) -> 'UserContext':
+        """ Hydrate a user in a new context.
+
+        Args:
+            db_user (UserORM): The row of the user.
+            session (Session): Session used to load the graph of the user.
+            session_factory (sessionmaker, optional): Factory of the sessions of the
+                context's unit of work. Defaults to the one of `Database`.
+            lazy (bool, optional): Load the tasks of each project on first use. Defaults
+                to the LAZY_HYDRATION environment variable.
+
+        Returns:
+            UserContext: The context of the user.
+        """
+        unit_of_work = UnitOfWork(session_factory=session_factory)
+        return cls(hydrate_user(db_user, session, unit_of_work, lazy))
+
+    @property
+    def user(self) -> User:
+        """User: The user of the context."""
+        return self._user
+
+    @property
+    def id_user(self) -> int:
+        """int: Database id of the user."""
+        return self._user.id_user
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """UnitOfWork: Unit of work shared by the items of the user."""
+        return self._user.unit_of_work
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """IdentityMap: The items of the user, by database id."""
+        return self._user.identity_map
+
+    @property
+    def undo_manager(self) -> UndoManager:
+        """UndoManager: The undo history of the user's items."""
+        return self._user.undo_manager
+
+    @property
+    def events(self) -> EventBus:
+        """EventBus: The change events of the user's items."""
+        return self._user.events
+
+    @property
+    def history(self) -> TaskHistory:
+        """TaskHistory: The history of the user's completed tasks."""
+        return self._user.history
+
+    @property
+    def views(self) -> UserViews:
+        """UserViews: The indexes, caches and snapshots of the user's items."""
+        return self._user.views
+
+    def close(self) -> None:
+        """ End the session of the user.
+
+        The delayed updates are written, the undo history is dropped and the session of
+        the current thread is given back to the pool.
+        """
+        self.unit_of_work.disable_write_behind()
+        self.undo_manager.clear()
+        self.unit_of_work.close()
+
+    def __enter__(self) -> 'UserContext':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class UserContexts:
+    """ Thread-safe registry of the contexts open in a process, by user id.
+
+    Attributes:
+        _session_factory (sessionmaker): Factory shared by the contexts, None for the
+            one of `Database`.
+        _lazy (bool): Hydration mode of the contexts, None for the environment default.
+        _contexts (Dict[int, UserContext]): The open contexts, by user id.
+        _lock (threading.Lock): Guards the contexts.
+    """
+    def __init__(self, session_factory: sessionmaker = None, lazy: bool = None) -> None:
+        """ Create an empty registry.
+
+        Args:
+            session_factory (sessionmaker, optional): Factory of the sessions of every
+                context. Defaults to the one of `Database`.
+            lazy (bool, optional): Load the tasks of each project on first use. Defaults
+                to the LAZY_HYDRATION environment variable.
+        """
+        self._session_factory = session_factory
+        self._lazy = lazy
+        self._contexts: Dict[int, UserContext] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session_factory(self) -> sessionmaker:
+        """sessionmaker: The factory shared by the contexts."""
+        return self._session_factory or Database().session_factory
+
+    def open(self, id_user: int) -> Optional[UserContext]:
+        """ Return the context of a user, hydrating it if it is not open yet.
+
+        Args:
+            id_user (int): Database id of the user.
+
+        Returns:
+            UserContext: The context of the user, None if there is no such user.
+        """
+        context = self.get(id_user)
+        if context is not None:
+            return context
+
+        factory = self.session_factory
+        with factory() as session:
+            db_user = session.get(UserORM, id_user)
+            if db_user is None:
+                return None
+            context = UserContext.open(db_user, session, factory, self._lazy)
+
+        with self._lock:
+            existing = self._contexts.setdefault(id_user, context)
+        if existing is not context:
+            context.close()
+        return existing
+
+    def get(self, id_user: int) -> Optional[UserContext]:
+        """ Return the context of a user if it is open.
+
+        Args:
+            id_user (int): Database id of the user.
+
+        Returns:
+            UserContext: The context, None if the user has none open.
+        """
+        with self._lock:
+            return self._contexts.get(id_user)
+
+    def close(self, id_user: int) -> None:
+        """ Close and forget the context of a user, if it is open.
+
+        Args:
+            id_user (int): Database id of the user.
+        """
+        with self._lock:
+            context = self._contexts.pop(id_user, None)
+        if context is not None:
+            context.close()
+
+    def close_all(self) -> None:
+        """ Close every open context.
+        """
+        with self._lock:
+            contexts, self._contexts = list(self._contexts.values()), {}
+        for context in contexts:
+            context.close()
+
+    def __contains__(self, id_user: int) -> bool:
+        with self._lock:
+            return id_user in self._contexts
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._contexts)
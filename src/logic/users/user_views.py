@@ -0,0 +1,103 @@
+"""
+Module Name: User Views
+
+Description:
+This module contains the UserViews class, the registry of the views derived from the
+items of a user: the indexes, caches and snapshots that answer the filters, the search,
+the dashboard and the notifications, and follow the change events of the user's items.
+
+A view is built the first time it is read and kept for the life of the user, so a
+session that never searches, for instance, never pays for the search index. Each kind
+of view is registered once, under the name it is read by, with the function building
+it from the user; a new kind of view needs a `register` call, not a new property of
+User.
+
+Classes:
+- UserViews: The views of one user, built on first use.
+
+Example:
+    UserViews.register('search_index', SearchIndex)
+    results = user.views.search_index.search('relatorio')
+"""
+
+from typing import Any, Callable, Dict
+from src.logic.filter.date_index import DateIndexes
+from src.logic.filter.label_index import LabelIndex
+from src.logic.filter.search_index import SearchIndex
+from src.logic.filter.task_snapshot import TaskSnapshot
+from src.logic.users.result_cache import ResultCache
+
+
+class UserViews:
+    """ The views of one user, built on first use and read as attributes.
+
+    Attributes:
+        _factories (Dict[str, Callable[[Any], Any]]): Builds each kind of view from a
+            user, by name.
+        _user (User): The user the views are derived from.
+        _views (Dict[str, Any]): The views built so far, by name.
+    """
+    _factories: Dict[str, Callable[[Any], Any]] = {}
+    __slots__ = ('_user', '_views')
+
+    def __init__(self, user: Any) -> None:
+        """ Create the registry of a user, with no view built yet.
+
+        Args:
+            user (User): The user the views are derived from.
+        """
+        self._user = user
+        self._views: Dict[str, Any] = {}
+
+    @classmethod
+    def register(cls, name: str, factory: Callable[[Any], Any]) -> None:
+        """ Register a kind of view.
+
+        Args:
+            name (str): The name the view is read by.
+            factory (Callable[[Any], Any]): Builds the view from a user.
+        """
+        cls._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """ Return a view, building it if it is read for the first time.
+
+        Args:
+            name (str): The name of the view.
+
+        Raises:
+            AttributeError: If no view is registered under the name.
+
+        Returns:
+            Any: The view of the user.
+        """
+        view = self._views.get(name)
+        if view is None:
+            factory = self._factories.get(name)
+            if factory is None:
+                raise AttributeError(f'No view is registered as {name!r}')
+            view = self._views[name] = factory(self._user)
+        return view
+
+    def built(self, name: str) -> bool:
+        """ Check if a view was already built.
+
+        Args:
+            name (str): The name of the view.
+
+        Returns:
+            bool: True once the view was read.
+        """
+        return name in self._views
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self.get(name)
+
+
+UserViews.register('date_indexes', DateIndexes)
+UserViews.register('search_index', SearchIndex)
+UserViews.register('label_index', LabelIndex)
+UserViews.register('result_cache', lambda user: ResultCache(user.events))
+UserViews.register('task_snapshot', TaskSnapshot)
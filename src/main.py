@@ -6,7 +6,9 @@ This script initializes the graphical user interface (GUI) for the project manag
 
 - Imports the 'tkinter' library as 'tk'.
 - Imports the 'Authentication' class from 'src.gui.authentication'.
+- Creates or upgrades the schema when running on a local SQLite database.
 - Initiates the main Tkinter application window with a title and specific dimensions (1600x900).
+- Attaches the database executor to the window, so that queries run off the Tk thread.
 - Creates an instance of the 'Authentication' class, passing the root window.
 - Enters the main event loop to start the GUI execution.
 
@@ -15,10 +17,18 @@ the project management system.
 """
 
 import tkinter as tk
+from src.db.database import Database
+from src.db.executor import DbExecutor
 from src.gui.authentication import Authentication
+
+database = Database()
+if database.is_sqlite:
+    database.create_schema()
+
 root = tk.Tk()
 root.title("Gerenciador de Projetos")
 root.geometry("1600x900")
+DbExecutor.instance().attach(root)
 
 auth = Authentication(root)
 
@@ -0,0 +1,136 @@
+"""
+This module contains unit tests for the batched hydration of a user graph, implemented
+in `src.logic.authentication.hydration`.
+
+The tests build a small account in an in-memory SQLite database and check that the whole
+graph (labels, projects, tasks and subtasks) is rebuilt with a constant number of queries.
+
+Classes:
+- TestHydration: Contains test cases for fetch_user_graph, hydrate_user and the lazy mode.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.logic.orms.orm import Base, UserORM, LabelORM, ProjectORM, TaskORM, SubtaskORM
+from src.logic.authentication.hydration import fetch_user_graph, hydrate_user, prefetch_tasks
+from src.db.unit_of_work import UnitOfWork
+
+
+class TestHydration(unittest.TestCase):
+    """
+    Test cases for the batched hydration of a user.
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+
+        self.db_user = UserORM(name='Hydrated User', email='user@example.com', password='pwd')
+        self.session.add(self.db_user)
+        self.session.commit()
+
+        db_label = LabelORM(id_user=self.db_user.id_user, name='Trabalho', color='azul')
+        self.session.add(db_label)
+        self.session.commit()
+
+        for project_index in range(3):
+            db_project = ProjectORM(id_user=self.db_user.id_user, name=f'Project {project_index}',
+                                    id_label=db_label.id_label if project_index == 0 else None,
+                                    status=False, creation_date=date(2023, 1, 1))
+            self.session.add(db_project)
+            self.session.commit()
+            for task_index in range(4):
+                db_task = TaskORM(id_project=db_project.id_project, status=False,
+                                  name=f'Task {project_index}.{task_index}',
+                                  creation_date=date(2023, 1, 2))
+                self.session.add(db_task)
+                self.session.commit()
+                self.session.add(SubtaskORM(id_task=db_task.id_task, status=False,
+                                            name=f'Subtask {project_index}.{task_index}'))
+        self.session.commit()
+        self.session.refresh(self.db_user)
+
+        self.statements.clear()
+
+    def tearDown(self):
+        self.session.close()
+
+    # pylint: disable=unused-argument,too-many-arguments
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        """ Records every statement sent to the database. """
+        self.statements.append(statement)
+
+    def test_fetch_user_graph_uses_four_queries(self):
+        """ The whole graph is fetched with one query per level. """
+        graph = fetch_user_graph(self.session, self.db_user.id_user)
+
+        self.assertEqual(len(self.statements), 4)
+        self.assertEqual(len(graph.labels), 1)
+        self.assertEqual(len(graph.projects), 3)
+        self.assertEqual(sum(len(tasks) for tasks in graph.tasks_by_project.values()), 12)
+        self.assertEqual(sum(len(subs) for subs in graph.subtasks_by_task.values()), 12)
+
+    def test_hydrate_user_builds_the_graph(self):
+        """ Every item is rebuilt and linked to its parent. """
+        user = hydrate_user(self.db_user, self.session)
+
+        self.assertEqual(len(self.statements), 4)
+        self.assertEqual(user.name, 'Hydrated User')
+        self.assertEqual([project.name for project in user.projects],
+                         ['Project 2', 'Project 1', 'Project 0'])
+        self.assertEqual(user.projects[2].label, user.labels[0])
+        self.assertIsNone(user.projects[0].label)
+        for project in user.projects:
+            self.assertEqual(len(project.tasks), 4)
+            for task in project.tasks:
+                self.assertEqual(len(task.subtasks), 1)
+                self.assertIs(task.project, project)
+
+    def test_hydrated_items_are_in_the_identity_map(self):
+        """ Every hydrated item can be found by its id. """
+        user = hydrate_user(self.db_user, self.session)
+
+        self.assertEqual(len(user.identity_map), 28)
+        for project in user.projects:
+            self.assertIs(user.identity_map.get_project(project.id_project), project)
+            for task in project.tasks:
+                self.assertIs(user.identity_map.get_task(task.id_task), task)
+        self.assertIs(user.identity_map.get_label(user.labels[0].id_label), user.labels[0])
+
+    def test_lazy_hydration_loads_each_project_on_first_use(self):
+        """ In lazy mode, the tasks of a project are read with one query when first used. """
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+
+        self.assertEqual(len(self.statements), 2)
+        self.assertTrue(all(project.deferred_tasks is not None for project in user.projects))
+
+        project = user.projects[2]
+        self.assertEqual([task.name for task in project.tasks],
+                         ['Task 0.3', 'Task 0.2', 'Task 0.1', 'Task 0.0'])
+        self.assertEqual([len(task.subtasks) for task in project.tasks], [1, 1, 1, 1])
+        self.assertEqual(len(self.statements), 3)
+        self.assertIsNone(project.deferred_tasks)
+        self.assertIsNotNone(user.projects[0].deferred_tasks)
+
+    def test_prefetch_loads_several_projects_with_one_query(self):
+        """ prefetch_tasks reads the tasks of all the deferred projects at once. """
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+        self.statements.clear()
+
+        prefetch_tasks(user.projects[:2])
+        self.assertEqual(len(self.statements), 1)
+        prefetch_tasks(user.projects[:2])
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(sum(len(project.tasks) for project in user.projects[:2]), 8)
+        self.assertEqual(len(self.statements), 1)
+        self.assertIsNotNone(user.projects[2].deferred_tasks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Module providing unit tests for the SqlDashboardData class.
+
+    The tests build an account in an in-memory SQLite database, with tasks ending,
+created and concluded around today, and check that SqlDashboardData returns exactly
+what the in-memory DashboardData computes for the same user.
+
+Test Cases:
+    - test_same_data_as_dashboard_data: Every getter matches DashboardData.
+    - test_same_data_for_a_project: The same after selecting a project.
+    - test_counters_use_one_query: The counters are read with a single query.
+    - test_create_dashboard_data: The provider depends on the size of the account.
+"""
+
+import unittest
+from datetime import date, timedelta
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.dashboard.dashboard_data import DashboardData
+from src.logic.dashboard.sql_dashboard_data import SqlDashboardData, create_dashboard_data
+from src.logic.orms.orm import Base, UserORM, ProjectORM, TaskORM
+
+GETTERS = ['get_number_of_tasks', 'get_number_of_done_tasks', 'get_number_of_on_time_tasks',
+           'get_number_of_for_today_tasks', 'get_number_of_late_tasks',
+           'get_timespan_of_tasks', 'get_next_deadlines', 'get_created_tasks',
+           'get_finished_by_weekday']
+
+
+class TestSqlDashboardData(unittest.TestCase):
+    """ Test the SQL dashboard data provider
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self) -> None:
+        """ Set up the test
+        """
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        today = date.today()
+        with self.engine.begin() as connection:
+            connection.execute(insert(UserORM), [{'id_user': 1, 'name': 'Dash',
+                                                  'email': 'dash@example.com',
+                                                  'password': 'pwd'},
+                                                 {'id_user': 2, 'name': 'Other',
+                                                  'email': 'other@example.com',
+                                                  'password': 'pwd'}])
+            connection.execute(insert(ProjectORM), [
+                {'id_project': index + 1, 'id_user': 1 if index < 3 else 2,
+                 'name': f'Project {index}', 'status': False,
+                 'creation_date': today - timedelta(days=60)}
+                for index in range(4)])
+            rows = []
+            for index in range(120):
+                done = index % 3 == 0
+                rows.append({
+                    'id_project': index % 4 + 1, 'name': f'Task {index}', 'status': done,
+                    'creation_date': today - timedelta(days=index % 45),
+                    'end_date': None if index % 11 == 0
+                                else today + timedelta(days=index % 50 - 20),
+                    'conclusion_date': today - timedelta(days=index % 9) if done else None})
+            connection.execute(insert(TaskORM), rows)
+
+        self.unit_of_work = UnitOfWork(session_factory=sessionmaker(bind=self.engine))
+        with self.unit_of_work.begin() as session:
+            self.user = hydrate_user(session.get(UserORM, 1), session, self.unit_of_work)
+
+    def tearDown(self) -> None:
+        """ Tear down the test
+        """
+        self.unit_of_work.close()
+
+    def assert_same_data(self, expected: DashboardData, actual: SqlDashboardData) -> None:
+        """ Check that both providers return the same data
+        """
+        for getter in GETTERS:
+            with self.subTest(getter=getter):
+                self.assertEqual(getattr(actual, getter)(), getattr(expected, getter)())
+
+    def test_same_data_as_dashboard_data(self) -> None:
+        """ Every getter matches DashboardData
+        """
+        self.assert_same_data(DashboardData(self.user), SqlDashboardData(self.user))
+
+    def test_same_data_for_a_project(self) -> None:
+        """ The same after selecting a project
+        """
+        expected = DashboardData(self.user)
+        actual = SqlDashboardData(self.user)
+        expected.update_data('Project 1')
+        actual.update_data('Project 1')
+
+        self.assertEqual(actual.projects, expected.projects)
+        self.assert_same_data(expected, actual)
+
+    def test_counters_use_one_query(self) -> None:
+        """ The counters are read with a single query
+        """
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+        dashboard_data = SqlDashboardData(self.user)
+        for getter in GETTERS[:7]:
+            getattr(dashboard_data, getter)()
+
+        self.assertEqual(len(statements), 1)
+
+    def test_create_dashboard_data(self) -> None:
+        """ The provider depends on the size of the account
+        """
+        self.assertIs(type(create_dashboard_data(self.user)), DashboardData)
+        self.assertIsInstance(create_dashboard_data(self.user, threshold=10), SqlDashboardData)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+This module contains unit tests for the DbExecutor class, implemented in
+`src.db.executor`.
+
+Classes:
+- FakeRoot: Stands for the Tk root, recording the polls scheduled with `after`.
+- TestDbExecutor: Contains test cases for the background and inline modes.
+- TestSubmitWrites: Contains test cases for the items changed on the calling thread
+  and written on the workers.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.db.executor import DbExecutor
+from src.db.unit_of_work import UnitOfWork
+from src.logic.items.item_factory import ItemFactory
+from src.logic.orms.orm import Base, UserORM
+from src.logic.users.user import User
+
+
+class FakeRoot:
+    """ Stands for the Tk root, recording the polls scheduled with `after`. """
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        """ Records a scheduled callback instead of running a main loop. """
+        self.scheduled.append((delay, callback))
+
+
+class TestDbExecutor(unittest.TestCase):
+    """
+    Test cases for the DbExecutor class.
+    """
+    def setUp(self):
+        self.executor = DbExecutor(max_workers=2)
+        self.busy = []
+        self.executor.add_busy_listener(self.busy.append)
+
+    def tearDown(self):
+        self.executor.detach()
+
+    def test_inline_without_root(self):
+        """ Without a root the operation and its callbacks run at once. """
+        results = []
+        future = self.executor.submit(lambda a, b: a + b, 1, b=2).then(results.append)
+
+        self.assertTrue(future.done())
+        self.assertEqual(results, [3])
+        self.assertEqual(self.busy, [True, False])
+
+    def test_callbacks_run_on_the_polling_thread(self):
+        """ Workers run the operation; callbacks wait for the Tk thread to poll. """
+        self.executor.attach(FakeRoot())
+        threads = []
+        results = []
+        future = self.executor.submit(lambda: threads.append(threading.current_thread()) or 42)
+        future.then(lambda value: results.append((value, threading.current_thread())))
+        future.result(timeout=5)
+
+        self.assertEqual(results, [])
+        self.assertTrue(self.executor.busy)
+        self.executor.process_callbacks()
+        self.assertEqual(results, [(42, threading.current_thread())])
+        self.assertNotEqual(threads[0], threading.current_thread())
+        self.assertFalse(self.executor.busy)
+        self.assertEqual(self.busy, [True, False])
+
+    def test_errors_go_to_on_error(self):
+        """ An exception raised by the operation is handed to the error callback. """
+        errors = []
+        self.executor.submit(lambda: 1 / 0).then(errors.append, errors.append)
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+        handled = []
+        self.executor.error_handler = handled.append
+        self.executor.submit(lambda: 1 / 0)
+        self.assertIsInstance(handled[0], ZeroDivisionError)
+
+    def test_then_after_completion(self):
+        """ Callbacks registered after delivery still run on the polling thread. """
+        self.executor.attach(FakeRoot())
+        future = self.executor.submit(lambda: 'done')
+        future.result(timeout=5)
+        self.executor.process_callbacks()
+
+        results = []
+        future.then(results.append)
+        self.assertEqual(results, [])
+        self.executor.process_callbacks()
+        self.assertEqual(results, ['done'])
+
+
+class TestSubmitWrites(unittest.TestCase):
+    """
+    Test cases for DbExecutor.submit_writes, on a temporary SQLite file shared by the
+    sessions of the threads.
+    """
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.engine = create_engine(f'sqlite:///{self.path}')
+        Base.metadata.create_all(self.engine)
+        factory = sessionmaker(bind=self.engine)
+        with factory() as session:
+            db_user = UserORM(name='Test User', email='test@example.com', password='teste')
+            session.add(db_user)
+            session.commit()
+            id_user = db_user.id_user
+        self.unit_of_work = UnitOfWork(session_factory=factory)
+        self.user = User('Test User', id_user=id_user, unit_of_work=self.unit_of_work)
+        self.executor = DbExecutor(max_workers=2)
+        self.executor.attach(FakeRoot())
+
+        self.write_threads = set()
+        self.event_threads = set()
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda *args: self.write_threads.add(threading.current_thread()))
+        self.user.events.subscribe(
+            lambda _: self.event_threads.add(threading.current_thread()))
+
+    def tearDown(self):
+        self.executor.detach()
+        self.unit_of_work.close()
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def test_items_change_on_the_calling_thread(self):
+        """ The items change at once; only their rows are written by the workers, in
+        the order they were collected. """
+        results = []
+        project = self.executor.submit_writes(
+            self.unit_of_work, ItemFactory.create_item, 'project', user=self.user,
+            name='Projeto').result(timeout=5)
+        self.assertIn(project, self.user.projects)
+        self.assertIsNone(project.id_project)
+        self.assertEqual(self.event_threads, set())
+
+        future = self.executor.submit_writes(
+            project.unit_of_work, ItemFactory.create_item, 'task', project=project,
+            name='Tarefa').then(results.append)
+        task = future.result(timeout=5)
+        self.executor.submit_writes(task.unit_of_work, task.conclusion).result(timeout=5)
+        self.assertTrue(task.status)
+        self.assertEqual(results, [])
+
+        self.executor.process_callbacks()
+        self.assertEqual(results, [task])
+        self.assertIsNotNone(project.id_project)
+        self.assertIs(self.user.identity_map.get('task', task.id_task), task)
+        self.assertEqual(self.event_threads, {threading.current_thread()})
+        self.assertNotIn(threading.current_thread(), self.write_threads)
+
+    def test_errors_of_the_operation(self):
+        """ An operation raising on the calling thread reports through on_error. """
+        errors = []
+        self.executor.submit_writes(self.unit_of_work, ItemFactory.create_item, 'project',
+                                    user=self.user, name='').then(None, errors.append)
+        self.executor.detach()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(self.user.projects, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
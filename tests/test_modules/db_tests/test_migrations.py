@@ -0,0 +1,79 @@
+"""
+This module contains unit tests for the MigrationRunner class, implemented in
+`src.db.migrations`, and for the query plan checks of `src.db.query_plan`.
+
+Classes:
+- TestMigrations: Contains test cases for creating and upgrading a schema and for the
+  plans of the hot queries.
+"""
+
+import unittest
+from sqlalchemy import create_engine, inspect, text
+from src.db.migrations import MigrationRunner
+from src.db.query_plan import check_hot_queries, used_indexes, hot_queries
+from src.logic.orms.orm import Base
+
+
+class TestMigrations(unittest.TestCase):
+    """
+    Test cases for the migrations and the query plans.
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        self.runner = MigrationRunner(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def indexes(self, table):
+        """ Returns the names of the indexes of a table. """
+        return {index['name'] for index in inspect(self.engine).get_indexes(table)}
+
+    def test_create_schema(self):
+        """ An empty database gets every table, index and version. """
+        self.assertEqual(self.runner.current_version(), 0)
+        self.assertEqual(self.runner.upgrade(), [1, 2])
+
+        self.assertEqual(self.runner.current_version(), 2)
+        self.assertEqual(self.indexes('Task'),
+                         {'ix_Task_id_project', 'ix_Task_end_date', 'ix_Task_notification_date'})
+        self.assertEqual(self.runner.upgrade(), [])
+
+    def test_upgrade_existing_schema(self):
+        """ Tables created before the migrations keep their rows and get the indexes. """
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    connection.execute(text(f'DROP INDEX {index.name}'))
+            connection.execute(text("INSERT INTO User (name, email, password) "
+                                    "VALUES ('Pinho', 'pinho@example.com', '12345')"))
+        self.assertEqual(self.indexes('User'), set())
+
+        self.assertEqual(self.runner.upgrade(target=1), [1])
+        self.assertEqual(self.indexes('User'), set())
+        self.assertEqual(self.runner.upgrade(), [2])
+
+        self.assertEqual(self.indexes('User'), {'ix_User_name'})
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text('SELECT COUNT(*) FROM User')).scalar(), 1)
+
+    def test_hot_queries_use_indexes(self):
+        """ EXPLAIN shows every hot query searching through its index. """
+        self.runner.upgrade()
+        with self.engine.connect() as connection:
+            self.assertEqual(check_hot_queries(connection), {})
+
+    def test_query_plan_without_indexes(self):
+        """ Without the indexes the check reports the missing ones. """
+        self.runner.upgrade(target=1)
+        with self.engine.begin() as connection:
+            connection.execute(text('DROP INDEX ix_Task_end_date'))
+            statement, _ = hot_queries()['tasks ending in a period']
+            self.assertNotIn('ix_Task_end_date', used_indexes(connection, statement))
+            self.assertEqual(check_hot_queries(connection),
+                             {'tasks ending in a period': {'ix_Task_end_date'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
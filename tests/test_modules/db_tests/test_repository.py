@@ -0,0 +1,83 @@
+"""
+This module contains unit tests for the Repository class, implemented in
+`src.db.repository`.
+
+Classes:
+- TestRepository: Contains test cases for the primary-key UPDATE path.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.db.repository import Repository
+from src.logic.orms.orm import Base, UserORM, ProjectORM, TaskORM
+
+
+class TestRepository(unittest.TestCase):
+    """
+    Test cases for the Repository class.
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        db_user = UserORM(name='Test User', email='test@example.com', password='teste')
+        self.session.add(db_user)
+        self.session.flush()
+        db_project = ProjectORM(id_user=db_user.id_user, name='Project', status=False,
+                                creation_date=date(2023, 1, 1))
+        self.session.add(db_project)
+        self.session.flush()
+        self.tasks = [TaskORM(id_project=db_project.id_project, name=f'Task {index}',
+                              status=False, creation_date=date(2023, 1, 1))
+                      for index in range(3)]
+        self.session.add_all(self.tasks)
+        self.session.commit()
+        self.ids = [task.id_task for task in self.tasks]
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+        self.repository = Repository(self.session)
+
+    def tearDown(self):
+        self.session.close()
+
+    # pylint: disable=unused-argument,too-many-arguments
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        """ Records every statement sent to the database. """
+        self.statements.append(statement)
+
+    def test_update_by_id_is_a_single_update(self):
+        """ No SELECT precedes the UPDATE and loaded rows are kept in sync. """
+        matched = self.repository.update_by_id(TaskORM, self.ids[0], name='Renamed', status=True)
+
+        self.assertEqual(matched, 1)
+        self.assertEqual(len(self.statements), 1)
+        self.assertTrue(self.statements[0].startswith('UPDATE'))
+        self.session.commit()
+        self.assertEqual(self.session.get(TaskORM, self.ids[0]).name, 'Renamed')
+
+    def test_update_by_id_of_missing_row(self):
+        """ A missing row matches nothing. """
+        self.assertEqual(self.repository.update_by_id(TaskORM, 999, status=True), 0)
+
+    def test_update_many_uses_one_statement_per_column_set(self):
+        """ Rows changing the same columns share one executemany. """
+        count = self.repository.update_many(TaskORM, [(self.ids[0], {'status': True}),
+                                                      (self.ids[1], {'status': True}),
+                                                      (self.ids[2], {'name': 'Renamed'})])
+        self.session.commit()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(self.statements), 2)
+        self.statements.clear()
+        rows = {task.id_task: task for task in self.session.query(TaskORM).all()}
+        self.assertTrue(rows[self.ids[0]].status)
+        self.assertTrue(rows[self.ids[1]].status)
+        self.assertEqual(rows[self.ids[2]].name, 'Renamed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+This module contains unit tests for the UnitOfWork class, implemented in
+`src.db.unit_of_work`.
+
+The tests use a temporary SQLite file (so that uncommitted rows are not visible to
+other connections) and check that the items of a user share a
+single session, that nested scopes commit (or roll back) as one transaction, and that
+deferred writes reach the rows inserted by earlier deferred blocks.
+
+Classes:
+- TestUnitOfWork: Contains test cases for the UnitOfWork class.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.db.unit_of_work import UnitOfWork
+from src.logic.orms.orm import Base, UserORM, ProjectORM, TaskORM
+from src.logic.users.user import User
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+
+
+class TestUnitOfWork(unittest.TestCase):
+    """
+    Test cases for the UnitOfWork class.
+    """
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.engine = create_engine(f'sqlite:///{self.path}')
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.unit_of_work = UnitOfWork(session_factory=self.session_factory)
+
+        with self.session_factory() as session:
+            db_user = UserORM(name='Test User', email='test@example.com', password='teste')
+            session.add(db_user)
+            session.commit()
+            id_user = db_user.id_user
+
+        self.user = User('Test User', id_user=id_user, unit_of_work=self.unit_of_work)
+
+    def tearDown(self):
+        self.unit_of_work.close()
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def count_rows(self, orm: type) -> int:
+        """ Counts the rows of a table with a fresh session. """
+        with self.session_factory() as session:
+            return session.query(orm).count()
+
+    def test_items_share_the_unit_of_work(self):
+        """ Items reuse the unit of work of their parent. """
+        project = Project(user=self.user, name='Project')
+        task = Task(project=project, name='Task')
+
+        self.assertIs(project.unit_of_work, self.unit_of_work)
+        self.assertIs(task.unit_of_work, self.unit_of_work)
+        self.assertIsNotNone(task.id_task)
+        self.assertEqual(self.count_rows(TaskORM), 1)
+
+    def test_nested_scopes_commit_once(self):
+        """ Only the outermost scope commits. """
+        with self.unit_of_work.begin():
+            project = Project(user=self.user, name='Project')
+            Task(project=project, name='Task')
+            self.assertTrue(self.unit_of_work.in_transaction)
+            self.assertEqual(self.count_rows(ProjectORM), 0)
+
+        self.assertFalse(self.unit_of_work.in_transaction)
+        self.assertEqual(self.count_rows(ProjectORM), 1)
+        self.assertEqual(self.count_rows(TaskORM), 1)
+
+    def test_outer_scope_rolls_back(self):
+        """ An error in the outermost scope discards every nested write. """
+        with self.assertRaises(RuntimeError):
+            with self.unit_of_work.begin():
+                Project(user=self.user, name='Project')
+                raise RuntimeError('falha')
+
+        self.assertEqual(self.count_rows(ProjectORM), 0)
+
+    def test_resolve_reuses_parent_wrapping_the_session(self):
+        """ An explicit session already wrapped by the parent keeps the parent's unit of work. """
+        session = self.session_factory()
+        parent = UnitOfWork(session=session)
+
+        self.assertIs(UnitOfWork.resolve(session=session, parent=parent), parent)
+        self.assertIsNot(UnitOfWork.resolve(session=self.session_factory(), parent=parent), parent)
+        self.assertIs(UnitOfWork.resolve(parent=parent), parent)
+        session.close()
+
+    def test_deferred_writes_on_a_pending_insert(self):
+        """ Writes collected while an earlier deferred insert is pending reach its row. """
+        with self.unit_of_work.deferred() as first:
+            project = Project(user=self.user, name='P1')
+        with self.unit_of_work.deferred() as second:
+            project.conclusion()
+            task = Task(project=project, name='Tarefa')
+            task.update(name='Tarefa', description='Nova')
+        self.assertIsNone(project.id_project)
+
+        first.apply()
+        second.apply()
+        self.assertIsNone(project.id_project)
+        first.written()
+        second.written()
+
+        with self.session_factory() as session:
+            row = session.get(ProjectORM, project.id_project)
+            self.assertEqual((row.name, row.status, row.conclusion_date),
+                             ('P1', True, date.today()))
+            row = session.get(TaskORM, task.id_task)
+            self.assertEqual((row.id_project, row.description),
+                             (project.id_project, 'Nova'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+This module contains unit tests for the write-behind queue, implemented in
+`src.db.write_behind`, and its use by the items through their unit of work.
+
+Classes:
+- TestWriteBehind: Contains test cases for the WriteBehindQueue class.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.db.unit_of_work import UnitOfWork
+from src.logic.orms.orm import Base, UserORM, TaskORM
+from src.logic.users.user import User
+from src.logic.items.project import Project
+from src.logic.items.task import Task
+
+
+class TestWriteBehind(unittest.TestCase):
+    """
+    Test cases for the WriteBehindQueue class.
+    """
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.engine = create_engine(f'sqlite:///{self.path}')
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.unit_of_work = UnitOfWork(session_factory=self.session_factory)
+
+        with self.session_factory() as session:
+            db_user = UserORM(name='Test User', email='test@example.com', password='teste')
+            session.add(db_user)
+            session.commit()
+            id_user = db_user.id_user
+
+        self.user = User('Test User', id_user=id_user, unit_of_work=self.unit_of_work)
+        self.project = Project(user=self.user, name='Project')
+        self.task = Task(project=self.project, name='Task')
+
+    def tearDown(self):
+        self.unit_of_work.disable_write_behind()
+        self.unit_of_work.close()
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def stored_task(self) -> TaskORM:
+        """ Reads the task row with a fresh session. """
+        with self.session_factory() as session:
+            return session.get(TaskORM, self.task.id_task)
+
+    def test_updates_are_coalesced_until_flush(self):
+        """ Repeated changes to a row become a single pending update. """
+        queue = self.unit_of_work.enable_write_behind(interval=None)
+
+        self.task.conclusion()
+        self.task.unconclusion()
+        self.task.update(name='Renamed')
+        self.task.conclusion()
+
+        self.assertEqual(len(queue), 1)
+        self.assertFalse(self.stored_task().status)
+        self.assertEqual(queue.metrics.enqueued, 7)
+        self.assertEqual(queue.metrics.coalesced, 4)
+
+        self.assertEqual(self.unit_of_work.flush(), 1)
+        stored = self.stored_task()
+        self.assertTrue(stored.status)
+        self.assertEqual(stored.name, 'Renamed')
+        self.assertEqual(list(queue.metrics.batch_sizes), [1])
+        self.assertEqual(len(queue.metrics.latencies), 1)
+
+    def test_delete_discards_pending_updates(self):
+        """ Deleting an item drops its queued updates. """
+        queue = self.unit_of_work.enable_write_behind(interval=None)
+        self.task.conclusion()
+        self.task.delete()
+
+        self.assertEqual(len(queue), 0)
+        self.assertIsNone(self.stored_task())
+
+    def test_timer_flushes_in_background(self):
+        """ The pending updates are written after the configured interval. """
+        queue = self.unit_of_work.enable_write_behind(interval=0.05)
+        self.task.conclusion()
+
+        deadline = time.monotonic() + 5
+        while not queue.metrics.flushes and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(len(queue), 0)
+        self.assertTrue(self.stored_task().status)
+
+    def test_disable_flushes_pending_updates(self):
+        """ Turning write-behind off writes what is queued. """
+        self.unit_of_work.enable_write_behind(interval=None)
+        self.task.update(name='Renamed')
+        self.unit_of_work.disable_write_behind()
+
+        self.assertIsNone(self.unit_of_work.write_behind)
+        self.assertEqual(self.stored_task().name, 'Renamed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+This module contains unit tests for the change events published by the items of a user,
+implemented in `src.logic.events.event_bus`.
+
+The tests build a user in an in-memory SQLite database, subscribe to its bus and check
+the events published by the creation, update, conclusion, move and deletion of items.
+
+Classes:
+- TestEventBus: Contains test cases for the EventBus class and the item events.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task, Subtask, Label
+from src.logic.orms.orm import Base, UserORM
+from src.logic.events.event_bus import EventBus, ChangeEvent, Created, Updated, Moved, Deleted
+
+
+class TestEventBus(unittest.TestCase):
+    """
+    Test cases for the EventBus class and the events of the items.
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        db_test_user = UserORM(name='Events User', email='events@example.com', password='teste')
+        self.session.add(db_test_user)
+        self.session.commit()
+
+        self.user = User(name=db_test_user.name, id_user=db_test_user.id_user, session=self.session)
+        self.events = []
+        self.user.events.subscribe(self.events.append)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_item_lifecycle(self):
+        project = Project(user=self.user, name='Project', creation_date=date.today())
+        task = Task(project=project, name='Task')
+        subtask = Subtask(task=task, name='Subtask')
+        self.assertEqual([type(event) for event in self.events], [Created, Created, Created])
+        self.assertEqual([event.item for event in self.events], [project, task, subtask])
+
+        self.events.clear()
+        task.update(name='Task', description='Descrição')
+        task.conclusion()
+        self.assertEqual([type(event) for event in self.events], [Updated, Updated])
+        self.assertEqual(self.events[0].fields, ('description',))
+        self.assertEqual(self.events[1].fields, ('status', 'conclusion_date'))
+        self.assertEqual(self.user.history.tasks_completed(), [task])
+
+        self.events.clear()
+        task.delete()
+        self.assertEqual([(type(event), event.item) for event in self.events],
+                         [(Deleted, subtask), (Deleted, task)])
+        self.assertEqual(self.user.history.tasks_completed(), [])
+
+    def test_unchanged_update_publishes_nothing(self):
+        task = Task(project=Project(user=self.user, name='Project'), name='Task')
+        self.events.clear()
+
+        task.update(name='Task')
+        self.assertEqual(self.events, [])
+
+    def test_label_change_is_a_move(self):
+        work = Label(user=self.user, name='Trabalho', color='azul')
+        project = Project(user=self.user, name='Project')
+        self.events.clear()
+
+        project.update(name='Project', label=work)
+        event, = self.events
+        self.assertIsInstance(event, Moved)
+        self.assertIsInstance(event, Updated)
+        self.assertEqual((event.source, event.target), (None, work))
+
+        self.events.clear()
+        project.restore_from_memento()
+        event, = self.events
+        self.assertIsInstance(event, Moved)
+        self.assertEqual((event.source, event.target), (work, None))
+
+    def test_subscription_by_type_and_schedule(self):
+        bus = EventBus()
+        created, scheduled = [], []
+        bus.subscribe(created.append, Created)
+        bus.subscribe(self.fail_handler)
+        bus.subscribe(created.append, Deleted, schedule=scheduled.append)
+
+        bus.publish(Created(None))
+        bus.publish(Updated(None, ('name',)))
+        bus.publish(Deleted(None))
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(scheduled), 1)
+        scheduled[0]()
+        self.assertIsInstance(created[1], Deleted)
+
+        bus.unsubscribe(created.append)
+        bus.unsubscribe(self.fail_handler)
+        self.assertEqual(len(bus), 0)
+
+    @staticmethod
+    def fail_handler(event: ChangeEvent) -> None:
+        """ A handler whose errors must not reach the publisher. """
+        raise RuntimeError(f'{type(event).__name__} rejected')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Module providing unit and property tests for the sorted date indexes of
+`src.logic.filter.date_index`.
+
+The property test builds random projects and tasks in an in-memory SQLite database,
+applies random creations, updates, conclusions and deletions, and checks after each
+step that the range filters, answered from the indexes, return the same items as the
+former linear filters, in the same order.
+
+Test Cases:
+    - test_equal_dates: Test adding, moving and removing items with the same date.
+    - test_indexed_filters_match_linear_filters: Test the indexed filters against the
+linear implementation over random edits.
+    - test_tasks_of_deferred_projects: Test that the tasks of a deferred project are
+indexed once it is loaded.
+    - test_projects_of_another_user: Test that the projects of another user are scanned,
+not indexed.
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user, prefetch_tasks
+from src.logic.filter.date_index import DateIndex
+from src.logic.filter.filter import Filter
+from src.logic.orms.orm import Base, UserORM
+
+FIRST_DAY = date(2023, 1, 1)
+
+
+def linear_filter(items: list, field: str, lower: date, upper: date) -> list:
+    """ The former linear filters: scan every item """
+    return [item for item in items if isinstance(getattr(item, field), date)
+            and lower <= getattr(item, field) <= upper]
+
+
+class TestDateIndex(unittest.TestCase):
+    """ Test the DateIndex and DateIndexes classes
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.db_user = UserORM(name='Index User', email='index@example.com', password='pwd')
+        self.session.add(self.db_user)
+        self.session.commit()
+        self.user = User(name=self.db_user.name, id_user=self.db_user.id_user,
+                         session=self.session)
+        self.random = random.Random(2024)
+
+    def tearDown(self):
+        self.session.close()
+
+    def random_date(self) -> date:
+        """ A date of the first months of 2023, or None """
+        if self.random.random() < 0.2:
+            return None
+        return FIRST_DAY + timedelta(days=self.random.randrange(90))
+
+    def new_task(self, project: Project) -> Task:
+        """ Create a task with random dates """
+        return Task(project=project, name=f'Tarefa {self.random.random()}',
+                    end_date=self.random_date(), notification_date=self.random_date())
+
+    def test_equal_dates(self) -> None:
+        """ Test items sharing a date
+        """
+        index = DateIndex('end_date')
+        items = [SimpleNamespace(end_date=FIRST_DAY) for _ in range(3)]
+        for item in items + items:
+            index.add(item)
+        index.add(SimpleNamespace(end_date=None))
+        self.assertEqual(len(index), 3)
+
+        index.discard(items[1])
+        items[0].end_date = FIRST_DAY + timedelta(days=1)
+        index.update(items[0])
+        self.assertEqual(index.range(FIRST_DAY, FIRST_DAY), [items[2]])
+        self.assertEqual(index.range(date(1, 1, 1), date(9999, 12, 31)), [items[2], items[0]])
+        self.assertNotIn(items[1], index)
+
+    def test_indexed_filters_match_linear_filters(self) -> None:
+        """ Test the indexed filters against the linear ones after random edits
+        """
+        for number in range(6):
+            project = Project(user=self.user, name=f'Projeto {number}',
+                              creation_date=FIRST_DAY + timedelta(days=number),
+                              end_date=self.random_date())
+            for _ in range(8):
+                self.new_task(project)
+        filter_ = Filter(self.user)
+
+        for step in range(40):
+            projects = list(self.user.projects)
+            tasks = [task for project in projects for task in project.tasks]
+            action = self.random.choice(['create', 'update', 'conclude', 'delete', 'project'])
+            if action == 'create' or not tasks:
+                self.new_task(self.random.choice(projects))
+            elif action == 'update':
+                task = self.random.choice(tasks)
+                task.update(name=task.name, end_date=self.random_date())
+            elif action == 'conclude':
+                task = self.random.choice(tasks)
+                if task.status:
+                    task.unconclusion()
+                else:
+                    task.conclusion()
+            elif action == 'delete':
+                self.random.choice(tasks).delete()
+            elif len(projects) > 3:
+                self.random.choice(projects).delete()
+
+            projects = list(self.user.projects)
+            some = projects[::2]
+            tasks = [task for project in some for task in project.tasks]
+            bounds = sorted([self.random_date() or FIRST_DAY, self.random_date() or FIRST_DAY])
+            if step % 3 == 0:
+                bounds[1] = date.today()
+            with self.subTest(step=step, action=action):
+                for method, field in [('filter_tasks_by_creation_date', 'creation_date'),
+                                      ('filter_tasks_by_end_date', 'end_date'),
+                                      ('filter_tasks_by_conclusion_date', 'conclusion_date')]:
+                    indexed = getattr(filter_, method)(some, *bounds)
+                    self.assertEqual(indexed, linear_filter(tasks, field, *bounds))
+                for method, field in [('filter_projects_by_creation_date', 'creation_date'),
+                                      ('filter_projects_by_end_date', 'end_date')]:
+                    indexed = getattr(filter_, method)(*bounds)
+                    self.assertEqual(indexed, linear_filter(projects, field, *bounds))
+                self.assertEqual(
+                    self.user.views.date_indexes.tasks('notification_date', *bounds),
+                    linear_filter([task for project in projects for task in project.tasks],
+                                  'notification_date', *bounds))
+
+    def test_tasks_of_deferred_projects(self) -> None:
+        """ Test that a deferred project is indexed once loaded
+        """
+        project = Project(user=self.user, name='Projeto', creation_date=FIRST_DAY)
+        Task(project=project, name='Tarefa', end_date=FIRST_DAY)
+        self.session.refresh(self.db_user)
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+
+        self.assertEqual(user.views.date_indexes.tasks('end_date', FIRST_DAY, FIRST_DAY), [])
+        prefetch_tasks(user.projects)
+        tasks = user.views.date_indexes.tasks('end_date', FIRST_DAY, FIRST_DAY)
+        self.assertEqual([task.name for task in tasks], ['Tarefa'])
+
+        tasks[0].update(name=tasks[0].name, end_date=FIRST_DAY + timedelta(days=1))
+        self.assertEqual(user.views.date_indexes.tasks('end_date', FIRST_DAY, FIRST_DAY), [])
+
+    def test_projects_of_another_user(self) -> None:
+        """ Test that a project of another user is scanned and left out of the indexes
+        """
+        own = Project(user=self.user, name='Projeto', creation_date=FIRST_DAY)
+        first = Task(project=own, name='Primeira', end_date=FIRST_DAY)
+        db_other = UserORM(name='Other User', email='other@example.com', password='pwd')
+        self.session.add(db_other)
+        self.session.commit()
+        other = User(name=db_other.name, id_user=db_other.id_user, session=self.session)
+        foreign = Project(user=other, name='Projeto', creation_date=FIRST_DAY)
+        Task(project=foreign, name='Alheia', end_date=FIRST_DAY)
+        second = Task(project=own, name='Segunda', end_date=FIRST_DAY)
+
+        indexes = self.user.views.date_indexes
+        tasks = indexes.tasks('end_date', FIRST_DAY, FIRST_DAY, [foreign, own])
+        self.assertEqual([task.name for task in tasks], ['Alheia', 'Segunda', 'Primeira'])
+        self.assertEqual(indexes.tasks('end_date', FIRST_DAY, FIRST_DAY), [second, first])
+        self.assertEqual(indexes.projects('creation_date', FIRST_DAY, FIRST_DAY,
+                                          [own, foreign]), [own, foreign])
+        self.assertEqual(len(indexes._tasks['end_date']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Module providing unit tests for the label index of `src.logic.filter.label_index`.
+
+The tests build labelled projects with tasks in an in-memory SQLite database and read
+them through user.views.label_index.
+
+Test Cases:
+    - test_projects_by_label: Test the union of the projects of several labels, the
+projects moved to another label, and labels sharing a name.
+    - test_counts_follow_changes: Test the counts of projects and tasks of a label
+after creations, deletions and a renamed or deleted label, whose projects are left
+without a label.
+    - test_deferred_projects_are_counted: Test that the tasks of deferred projects are
+counted with one query, without loading them.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task, Label
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.filter.filter import Filter
+from src.logic.orms.orm import Base, UserORM
+
+
+class TestLabelIndex(unittest.TestCase):
+    """ Test the LabelIndex class
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.db_user = UserORM(name='Label User', email='label@example.com', password='pwd')
+        self.session.add(self.db_user)
+        self.session.commit()
+        self.user = User(name=self.db_user.name, id_user=self.db_user.id_user,
+                         session=self.session)
+
+        self.work = Label(user=self.user, name='Trabalho', color='azul')
+        self.home = Label(user=self.user, name='Casa', color='verde')
+        self.report = Project(user=self.user, name='Relatório', label=self.work,
+                              creation_date=date.today())
+        self.site = Project(user=self.user, name='Site', label=self.work,
+                            creation_date=date.today())
+        self.garden = Project(user=self.user, name='Jardim', label=self.home,
+                              creation_date=date.today())
+        self.free = Project(user=self.user, name='Livre', creation_date=date.today())
+        for number in range(3):
+            Task(project=self.report, name=f'Tarefa {number}')
+        Task(project=self.garden, name='Regar')
+
+    def tearDown(self):
+        self.session.close()
+
+    def names(self, *labels) -> list:
+        """ The names of the projects of the labels """
+        return [project.name for project in self.user.views.label_index.projects(*labels)]
+
+    def test_projects_by_label(self) -> None:
+        """ Test the projects of one or several labels
+        """
+        index = self.user.views.label_index
+        self.assertEqual(self.names(self.work), ['Site', 'Relatório'])
+        self.assertEqual(self.names(self.work, self.home), ['Site', 'Relatório', 'Jardim'])
+        self.assertEqual(self.names(None), ['Livre'])
+
+        self.site.update(name='Site', label=self.home)
+        self.assertEqual(self.names(self.work), ['Relatório'])
+        self.assertEqual(self.names(self.home), ['Site', 'Jardim'])
+        self.site.restore_from_memento()
+        self.assertEqual(index.project_count(self.home), 1)
+        self.assertEqual([project.name for project in
+                          Filter(self.user).filter_projects_by_label_name('Trabalho')],
+                         ['Site', 'Relatório'])
+
+        other = Label(user=self.user, name='Trabalho', color='rosa')
+        Project(user=self.user, name='Blog', label=other, creation_date=date.today())
+        self.report.update(name='Relatório', label=self.home)
+        self.report.update(name='Relatório', label=self.work)
+        self.assertEqual(self.names(self.work), ['Relatório', 'Site'])
+        self.assertEqual([project.name for project in
+                          Filter(self.user).filter_projects_by_label_name('Trabalho')],
+                         ['Blog', 'Site', 'Relatório'])
+
+    def test_counts_follow_changes(self) -> None:
+        """ Test the counts of projects and tasks of a label
+        """
+        index = self.user.views.label_index
+        self.assertEqual((index.project_count(self.work), index.task_count(self.work)), (2, 3))
+        self.assertEqual((index.project_count(self.home), index.task_count(self.home)), (1, 1))
+
+        Task(project=self.site, name='Publicar')
+        self.report.tasks[0].delete()
+        self.assertEqual(index.task_count(self.work), 3)
+
+        self.report.update(name='Relatório', label=self.home)
+        self.assertEqual((index.project_count(self.work), index.task_count(self.work)), (1, 1))
+        self.assertEqual((index.project_count(self.home), index.task_count(self.home)), (2, 3))
+
+        self.work.update(name='Emprego')
+        self.assertEqual(self.names(self.work), ['Site'])
+        self.garden.delete()
+        self.assertEqual((index.project_count(self.home), index.task_count(self.home)), (1, 2))
+        self.home.delete()
+        self.assertEqual((index.project_count(self.home), index.task_count(self.home)), (0, 0))
+        self.assertEqual(self.names(None), ['Relatório', 'Livre'])
+        self.assertEqual(index.task_count(None), 2)
+        Task(project=self.report, name='Revisar')
+        self.assertEqual(index.task_count(None), 3)
+
+    def test_deferred_projects_are_counted(self) -> None:
+        """ Test the counts of the deferred projects
+        """
+        self.session.refresh(self.db_user)
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+        work = user.label_names.get('Trabalho')
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+
+        self.assertEqual(user.views.label_index.task_count(work), 3)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(all(project.deferred_tasks is not None for project in user.projects))
+
+        report = user.project_names.get('Relatório')
+        Task(project=report, name='Nova')
+        self.assertEqual(user.views.label_index.task_count(work), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Module providing unit tests for the composable Query of `src.logic.filter.query`.
+
+The tests build an account in an in-memory SQLite database: two projects, one of them
+labelled, with tasks of different dates, statuses and priorities.
+
+Test Cases:
+    - test_combined_criteria_on_tasks: Test several criteria checked in one pass.
+    - test_criteria_on_projects: Test the criteria on projects and the filter wrappers.
+    - test_status_and_priority_on_the_snapshot: Test the status and priority checked
+on the task snapshot against a scan of the tasks, in the same order.
+    - test_deferred_projects_are_pushed_down: Test that only the deferred projects with
+a matching task are loaded.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src import Task
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.execeptions.exceptions_items import ItemDontHaveThisAttribute
+from src.logic.filter.filter import Filter
+from src.logic.filter.query import Query
+from src.logic.orms.orm import Base, UserORM, LabelORM, ProjectORM, TaskORM
+
+
+class TestQuery(unittest.TestCase):
+    """ Test the Query class
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.statements = []
+
+        self.db_user = UserORM(name='Query User', email='query@example.com', password='pwd')
+        self.session.add(self.db_user)
+        self.session.commit()
+        db_label = LabelORM(id_user=self.db_user.id_user, name='Trabalho', color='azul')
+        self.session.add(db_label)
+        self.session.commit()
+
+        for index, id_label in enumerate([db_label.id_label, None]):
+            db_project = ProjectORM(id_user=self.db_user.id_user, name=f'Projeto {index}',
+                                    id_label=id_label, status=bool(index),
+                                    creation_date=date(2023, 1, 1 + index))
+            self.session.add(db_project)
+            self.session.commit()
+            for day in range(1, 5):
+                self.session.add(TaskORM(id_project=db_project.id_project,
+                                         name=f'Tarefa {index}.{day}', status=day % 2 == 0,
+                                         priority='Alta' if day < 3 else 'Baixa',
+                                         creation_date=date(2023, 2, day),
+                                         end_date=date(2023, 3, day)))
+        self.session.commit()
+        self.session.refresh(self.db_user)
+
+    def tearDown(self):
+        self.session.close()
+
+    def hydrate(self, lazy: bool) -> callable:
+        """ Build the user from the database """
+        return hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=lazy)
+
+    # pylint: disable=unused-argument,too-many-arguments
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        """ Records every statement sent to the database. """
+        self.statements.append(statement)
+
+    def test_combined_criteria_on_tasks(self) -> None:
+        """ Test several criteria on tasks at once
+        """
+        user = self.hydrate(lazy=False)
+        query = Query.tasks().with_status(False).ending_between(upper=date(2023, 3, 2))
+        self.assertEqual(sorted(task.name for task in query.run(user)),
+                         ['Tarefa 0.1', 'Tarefa 1.1'])
+        labelled = query.with_label('Trabalho').with_priority('Alta').name_contains('0.')
+        self.assertEqual([task.name for task in labelled.run(user)], ['Tarefa 0.1'])
+        self.assertEqual(len(query.criteria), 2)
+
+        filter_ = Filter(user)
+        self.assertEqual(len(filter_.filter_tasks_by_status(user.projects, True)), 4)
+        self.assertEqual(len(filter_.filter_tasks_by_creation_date(
+            user.projects, date(2023, 2, 2), date(2023, 2, 3))), 4)
+
+    def test_criteria_on_projects(self) -> None:
+        """ Test the criteria on projects
+        """
+        user = self.hydrate(lazy=False)
+        filter_ = Filter(user)
+        self.assertEqual([project.name for project in filter_.filter_projects_by_label_name(
+            'Trabalho')], ['Projeto 0'])
+        self.assertEqual([project.name for project in filter_.filter_projects_by_status(True)],
+                         ['Projeto 1'])
+        self.assertEqual(filter_.filter_projects_by_conclusion_date(), [])
+        self.assertEqual(len(Query.projects().created_between(date(2023, 1, 1)).run(user)), 2)
+        with self.assertRaises(ItemDontHaveThisAttribute):
+            Query.projects().with_priority('Alta')
+
+    def test_status_and_priority_on_the_snapshot(self) -> None:
+        """ Test the status and priority read from the task snapshot
+        """
+        user = self.hydrate(lazy=False)
+        projects = list(user.projects)[::-1]
+        Task(project=projects[0], name='Tarefa 0.5', status=True, priority='Média')
+
+        def scan(status, priority=None):
+            return [task for project in projects for task in project.tasks
+                    if task.status == status and priority in (None, task.priority)]
+
+        for status in (True, False):
+            query = Query.tasks().with_status(status)
+            self.assertEqual(query.run(user, projects), scan(status))
+            self.assertEqual(query.with_priority('Baixa').run(user, projects),
+                             scan(status, 'Baixa'))
+        self.assertTrue(user.views.built('task_snapshot'))
+        self.assertEqual([task.name for task in Query.tasks().with_status(True)
+                          .with_priority('Media').run(user)], [])
+        self.assertEqual([task.name for task in Query.tasks().with_status(True)
+                          .with_priority('Média').name_contains('0.').run(user)],
+                         ['Tarefa 0.5'])
+
+    def test_deferred_projects_are_pushed_down(self) -> None:
+        """ Test that only the deferred projects with a matching task are loaded
+        """
+        user = self.hydrate(lazy=True)
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+
+        tasks = Query.tasks().with_label('Trabalho').with_status(True).run(user)
+        self.assertEqual(sorted(task.name for task in tasks), ['Tarefa 0.2', 'Tarefa 0.4'])
+        self.assertEqual(len(self.statements), 2)
+        loaded = [project.name for project in user.projects if project.deferred_tasks is None]
+        self.assertEqual(loaded, ['Projeto 0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Module providing unit tests for the trigram search of `src.logic.filter.search_index`.
+
+The tests build a few projects, tasks and subtasks in an in-memory SQLite database and
+search them through user.views.search_index.
+
+Test Cases:
+    - test_substring_search_ignores_case_and_accents: Test the substring search and
+its ranking across projects, tasks and subtasks.
+    - test_fuzzy_search: Test that names with a typo are found after exact matches.
+    - test_fuzzy_search_keeps_the_most_similar: Test that the bounded fuzzy pass
+returns the most similar items.
+    - test_index_follows_changes: Test that created, renamed and deleted items are
+found or forgotten.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task, Subtask
+from src.logic.filter.search_index import SIMILARITY_THRESHOLD, normalize, project_of, trigrams
+from src.logic.orms.orm import Base, UserORM
+
+
+class TestSearchIndex(unittest.TestCase):
+    """ Test the SearchIndex class
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        db_user = UserORM(name='Search User', email='search@example.com', password='pwd')
+        self.session.add(db_user)
+        self.session.commit()
+        self.user = User(name=db_user.name, id_user=db_user.id_user, session=self.session)
+
+        self.report = Project(user=self.user, name='Relatório Anual', creation_date=date.today(),
+                              description='Contas da empresa')
+        self.site = Project(user=self.user, name='Site', creation_date=date.today())
+        self.draft = Task(project=self.site, name='Escrever o relatório',
+                          description='Rascunho')
+        self.review = Subtask(task=self.draft, name='Revisar relatorio final')
+        self.other = Task(project=self.site, name='Publicar', description='Ver o RELATÓRIO')
+
+    def tearDown(self):
+        self.session.close()
+
+    def names(self, text: str, **kwargs) -> list:
+        """ The names of the items found, in order """
+        return [result.item.name for result in self.user.views.search_index.search(text, **kwargs)]
+
+    def test_substring_search_ignores_case_and_accents(self) -> None:
+        """ Test the substring search and its ranking
+        """
+        self.assertEqual(normalize('RelaTÓrio Ação'), 'relatorio acao')
+        self.assertEqual(self.names('relatorio', fuzzy=False),
+                         ['Relatório Anual', 'Escrever o relatório',
+                          'Revisar relatorio final', 'Publicar'])
+        self.assertEqual(self.names('Contas'), ['Relatório Anual'])
+        self.assertEqual(self.names('si', fuzzy=False), ['Site'])
+        self.assertEqual(self.names('inexistente'), [])
+        self.assertEqual(self.names('   '), [])
+        self.assertIs(project_of(self.review), self.site)
+
+    def test_fuzzy_search(self) -> None:
+        """ Test the fuzzy search
+        """
+        self.assertEqual(self.names('relatroio', fuzzy=False), [])
+        found = self.names('relatroio anual')
+        self.assertEqual(found[0], 'Relatório Anual')
+        self.assertEqual(self.names('relatorio anual', limit=1), ['Relatório Anual'])
+
+    def test_fuzzy_search_keeps_the_most_similar(self) -> None:
+        """ Test that the fuzzy pass stops without losing the most similar items
+        """
+        for number in range(40):
+            Task(project=self.site, name=f'Tarefa {number * 7}')
+        grams = trigrams('tarefa 17x')
+        similarities = sorted(
+            (len(grams & trigrams(normalize(task.name))) / len(grams)
+             for task in self.site.tasks), reverse=True)
+        similarities = [value for value in similarities if value >= SIMILARITY_THRESHOLD]
+
+        results = self.user.views.search_index.search('Tarefa 17x', limit=5)
+        self.assertEqual([result.score for result in results], similarities[:5])
+
+    def test_index_follows_changes(self) -> None:
+        """ Test that the index follows the changes of the items
+        """
+        self.assertEqual(self.names('rascunho'), ['Escrever o relatório'])
+        self.draft.update(name='Escrever o relatório', description='Versão final')
+        self.assertEqual(self.names('rascunho', fuzzy=False), [])
+        self.assertEqual(self.names('versao', fuzzy=False), ['Escrever o relatório'])
+
+        Task(project=self.report, name='Orçamento')
+        self.assertEqual(self.names('orcamento'), ['Orçamento'])
+
+        self.site.delete()
+        self.assertEqual(self.names('relatorio', fuzzy=False), ['Relatório Anual'])
+        self.assertEqual(len(self.user.views.search_index), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Module providing unit and property tests for the columnar task snapshot of
+`src.logic.filter.task_snapshot`.
+
+The tests build projects and tasks in an in-memory SQLite database and check the
+vectorized predicates and group-bys of user.views.task_snapshot against loops over the tasks.
+
+Test Cases:
+    - test_predicates_and_group_bys: Test the masks and counts against Python loops.
+    - test_snapshot_follows_random_changes: Test the columns against the tasks after
+random creations, updates, conclusions and deletions, then enough deletions for the
+dead rows to be compacted.
+    - test_notifications: Test the notifications selected through the snapshot.
+"""
+
+import random
+import unittest
+from collections import Counter
+from datetime import date, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task
+from src.logic.notifications.notification import Notification
+from src.logic.orms.orm import Base, UserORM
+
+TODAY = date.today()
+
+
+class TestTaskSnapshot(unittest.TestCase):
+    """ Test the TaskSnapshot class
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        db_user = UserORM(name='Snapshot User', email='snapshot@example.com', password='pwd')
+        self.session.add(db_user)
+        self.session.commit()
+        self.user = User(name=db_user.name, id_user=db_user.id_user, session=self.session)
+        self.random = random.Random(2025)
+        self.projects = [Project(user=self.user, name=f'Projeto {number}',
+                                 creation_date=TODAY) for number in range(3)]
+        for _ in range(30):
+            self.new_task(self.random.choice(self.projects))
+
+    def tearDown(self):
+        self.session.close()
+
+    def random_date(self) -> date:
+        """ A date around today, or None """
+        if self.random.random() < 0.2:
+            return None
+        return TODAY + timedelta(days=self.random.randrange(-20, 20))
+
+    def new_task(self, project: Project) -> Task:
+        """ Create a task with random dates and priority """
+        return Task(project=project, name=f'Tarefa {self.random.random()}',
+                    priority=self.random.choice(['Alta', 'Media', 'Baixa', None]),
+                    end_date=self.random_date(), notification_date=self.random_date())
+
+    def all_tasks(self) -> list:
+        """ The tasks of every project """
+        return [task for project in self.user.projects for task in project.tasks]
+
+    def assert_columns(self) -> None:
+        """ Check every column of the live rows against the tasks """
+        snapshot = self.user.views.task_snapshot
+        alive = snapshot.alive()
+        tasks = snapshot.tasks(alive)
+        self.assertCountEqual(tasks, self.all_tasks())
+        self.assertEqual(len(snapshot), len(tasks))
+        self.assertEqual(snapshot.column('ids')[alive].tolist(),
+                         [task.id_task for task in tasks])
+        self.assertEqual(snapshot.column('status')[alive].tolist(),
+                         [task.status for task in tasks])
+        self.assertEqual([snapshot.projects[index] for index in
+                          snapshot.column('projects')[alive]], [task.project for task in tasks])
+        for field in ['end_date', 'conclusion_date', 'notification_date']:
+            days = [None if day != day else day.astype(object)
+                    for day in snapshot.column(field)[alive]]
+            self.assertEqual(days, [getattr(task, field) for task in tasks])
+
+    def test_predicates_and_group_bys(self) -> None:
+        """ Test the masks and counts
+        """
+        snapshot = self.user.views.task_snapshot
+        tasks = self.all_tasks()
+        upper = TODAY + timedelta(days=5)
+
+        mask = snapshot.between('end_date', TODAY, upper) & snapshot.where(priority='Alta')
+        self.assertCountEqual(snapshot.tasks(mask),
+                              [task for task in tasks if task.priority == 'Alta'
+                               and task.end_date and TODAY <= task.end_date <= upper])
+        mask = snapshot.in_projects(self.projects[:1])
+        self.assertEqual(snapshot.count(mask), len(self.projects[0].tasks))
+
+        dated = snapshot.between('end_date')
+        weekdays = Counter(task.end_date.weekday() for task in tasks if task.end_date)
+        self.assertEqual(snapshot.count_by_weekday('end_date', dated).tolist(),
+                         [weekdays[day] for day in range(7)])
+        lower = TODAY - timedelta(days=10)
+        days = Counter(task.end_date for task in tasks
+                       if task.end_date and lower <= task.end_date <= TODAY)
+        self.assertEqual(snapshot.count_by_day('end_date', lower, TODAY, snapshot.alive())
+                         .tolist(), [days[lower + timedelta(days=day)] for day in range(11)])
+        weeks = Counter(min(3, max(0, ((task.end_date - TODAY).days - 1) // 7))
+                        for task in tasks if task.end_date)
+        self.assertEqual(snapshot.count_by_bucket(snapshot.days_between(TODAY, 'end_date'),
+                                                  (7, 14, 21), dated).tolist(),
+                         [weeks[bucket] for bucket in range(4)])
+
+    def test_snapshot_follows_random_changes(self) -> None:
+        """ Test the columns after random edits
+        """
+        self.assert_columns()
+        for step in range(60):
+            tasks = self.all_tasks()
+            action = self.random.choice(['create', 'update', 'conclude', 'delete'])
+            if step >= 35:
+                action = 'delete'
+            if action == 'create' or not tasks:
+                self.new_task(self.random.choice(self.projects))
+            elif action == 'update':
+                task = self.random.choice(tasks)
+                task.update(name=task.name, end_date=self.random_date(),
+                            priority=self.random.choice(['Alta', 'Baixa']))
+            elif action == 'conclude':
+                task = self.random.choice(tasks)
+                if task.status:
+                    task.unconclusion()
+                else:
+                    task.conclusion()
+            else:
+                self.random.choice(tasks).delete()
+            with self.subTest(step=step, action=action):
+                self.assert_columns()
+
+    def test_notifications(self) -> None:
+        """ Test the notifications selected through the snapshot
+        """
+        tomorrow = TODAY + timedelta(days=1)
+        urgent = Task(project=self.projects[0], name='Urgente', priority='Alta',
+                      end_date=tomorrow)
+        notification = Notification(self.user)
+        notification.check_due_date()
+        notification.check_notification_date()
+
+        tasks = [task for task in self.all_tasks() if not task.status]
+        self.assertIn(urgent, notification.urgent_tasks)
+        self.assertTrue(all(task.priority == 'Alta' and task.end_date == tomorrow
+                            for task in notification.urgent_tasks))
+        self.assertEqual(notification.due_date_tasks,
+                         {task for task in tasks if task.end_date and task.end_date <= TODAY})
+        self.assertTrue(all(task.notification_date == TODAY
+                            for task in notification.notification_date_tasks))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,7 +63,7 @@ class TestHistorySingleton(unittest.TestCase):
         self.assertIs(self.history_manager, HistorySingleton())
 
     def test_add_and_retrieve_completed_tasks(self):
-        test_user = User("username")
+        test_user = self.test_user
         project1 = Project(test_user, "test_project", "test_label", datetime.now(), "test_description")
         task1 = Task(project1, "Task 1", "high", datetime.now(), datetime.now(), "description1", status=True)
         task2 = Task(project1, "Task 2", "high", datetime.now(), datetime.now(), "description2", status=False)
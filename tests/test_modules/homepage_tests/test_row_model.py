@@ -0,0 +1,100 @@
+"""
+Unit tests for the RowModel class, the flat list of rows behind the virtual project list
+of the home page.
+
+Classes:
+- TestRowModel: Tests for RowModel on the projects of a user in an in-memory database.
+
+Methods:
+- setUp and tearDown: Setup and cleanup methods for each test case.
+- test_rows_of_projects_and_open_tasks (TestRowModel): Tests the rows built by index.
+- test_toggle_collapses_and_expands (TestRowModel): Tests collapsing and expanding a project.
+- test_deferred_project_is_loaded_on_expand (TestRowModel): Tests the lazy expansion.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task
+from src.gui.row_model import RowModel
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.orms.orm import Base, UserORM
+
+class TestRowModel(unittest.TestCase):
+    """
+    Tests for the RowModel class.
+    """
+    def setUp(self):
+        """ Set up a user with two projects of two tasks each. """
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.db_user = UserORM(name='Rows User', email='rows@example.com', password='teste')
+        self.session.add(self.db_user)
+        self.session.commit()
+
+        self.user = User(name=self.db_user.name, id_user=self.db_user.id_user,
+                         session=self.session)
+        self.first = Project(user=self.user, name='Projeto 1', creation_date=date.today())
+        self.second = Project(user=self.user, name='Projeto 2', creation_date=date.today())
+        self.tasks = [Task(project=project, name=f'Tarefa {index}')
+                      for index, project in enumerate([self.first, self.first,
+                                                       self.second, self.second])]
+        self.model = RowModel([self.first, self.second])
+
+    def tearDown(self):
+        """ Clean up after tests. """
+        self.session.close()
+
+    def test_rows_of_projects_and_open_tasks(self):
+        """ Test that projects are followed by their open tasks, with their tags. """
+        self.tasks[1].conclusion()
+        self.second.conclusion()
+        self.model.refresh()
+
+        self.assertEqual(len(self.model), 5)
+        self.assertEqual([row.text for row in self.model.window(0, 10)],
+                         ['Projeto 1', 'Tarefa 0', 'Projeto 2 - Concluído',
+                          'Tarefa 3', 'Tarefa 2'])
+        self.assertEqual(self.model.row(0).tags, ('projectname',))
+        self.assertEqual(self.model.row(2).tags, ('projectname', 'concluded'))
+        self.assertIs(self.model.row(4).project, self.second)
+        self.assertIs(self.model.row(4).task, self.tasks[2])
+        self.assertEqual([row.text for row in self.model.window(3, 10)], ['Tarefa 3', 'Tarefa 2'])
+        self.assertEqual(self.model.index_of(self.second), 2)
+        with self.assertRaises(IndexError):
+            self.model.row(5)
+
+    def test_toggle_collapses_and_expands(self):
+        """ Test that toggling a project row hides and shows its tasks. """
+        self.assertFalse(self.model.toggle(1))
+        self.assertTrue(self.model.toggle(0))
+        self.assertEqual([row.text for row in self.model.window(0, 10)],
+                         ['Projeto 1', 'Projeto 2', 'Tarefa 3', 'Tarefa 2'])
+        self.assertFalse(self.model.row(0).expanded)
+
+        self.model.set_projects([self.second, self.first])
+        self.assertEqual(len(self.model), 4)
+        self.assertTrue(self.model.toggle(3))
+        self.assertEqual(len(self.model), 6)
+        self.assertEqual(self.model.row(5).text, 'Tarefa 0')
+
+    def test_deferred_project_is_loaded_on_expand(self):
+        """ Test that a deferred project is collapsed until it is expanded. """
+        self.session.refresh(self.db_user)
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+        model = RowModel(user.projects)
+        self.assertEqual(len(model), 2)
+        self.assertTrue(all(project.deferred_tasks is not None for project in user.projects))
+
+        self.assertTrue(model.toggle(1))
+        self.assertIsNone(model.row(1).project.deferred_tasks)
+        self.assertIsNotNone(model.row(0).project.deferred_tasks)
+        self.assertEqual(len(model), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Unit tests for the TreeSync class, which keeps the rows of the home page's project tree
+in line with the projects by applying only the differences.
+
+Classes:
+- TestTreeSync: Tests for TreeSync on a ttk.Treeview.
+
+Methods:
+- setUp and tearDown: Setup and cleanup methods for each test case.
+- test_first_sync_inserts_rows (TestTreeSync): Tests that the rows are inserted in order.
+- test_unchanged_rows_are_not_touched (TestTreeSync): Tests that a sync without changes writes nothing.
+- test_differences_are_applied (TestTreeSync): Tests deletions, moves and updates.
+"""
+
+import unittest
+from unittest.mock import patch
+import tkinter as tk
+from tkinter import ttk
+from src.gui.tree_sync import TreeRow, TreeSync
+
+class TestTreeSync(unittest.TestCase):
+    """
+    Tests for the TreeSync class.
+    """
+    def setUp(self):
+        """ Set up a tree with two projects and their tasks. """
+        self.root = tk.Tk()
+        self.tree = ttk.Treeview(self.root, show='tree')
+        self.sync = TreeSync(self.tree)
+        self.sync.sync('', [TreeRow('project-1', 'Projeto 1', ('projectname',), True),
+                            TreeRow('project-2', 'Projeto 2', ('projectname',), True)])
+        self.sync.sync('project-1', [TreeRow('task-1', 'Tarefa 1'), TreeRow('task-2', 'Tarefa 2')])
+        self.sync.sync('project-2', [TreeRow('task-3', 'Tarefa 3')])
+
+    def tearDown(self):
+        """ Clean up after tests. """
+        self.root.destroy()
+
+    def test_first_sync_inserts_rows(self):
+        """ Test that the rows are inserted in order, with their text and tags. """
+        self.assertEqual(self.tree.get_children(), ('project-1', 'project-2'))
+        self.assertEqual(self.tree.get_children('project-1'), ('task-1', 'task-2'))
+        self.assertEqual(self.tree.item('project-1', 'text'), 'Projeto 1')
+        self.assertEqual(self.tree.item('project-1', 'tags'), ['projectname'])
+
+    def test_unchanged_rows_are_not_touched(self):
+        """ Test that syncing the same rows again makes no call to the tree. """
+        with patch.object(self.tree, 'insert') as insert, \
+                patch.object(self.tree, 'delete') as delete, \
+                patch.object(self.tree, 'move') as move, \
+                patch.object(self.tree, 'item') as item:
+            self.sync.sync('', [TreeRow('project-1', 'Projeto 1', ('projectname',)),
+                                TreeRow('project-2', 'Projeto 2', ('projectname',))])
+            self.sync.sync('project-1', [TreeRow('task-1', 'Tarefa 1'),
+                                         TreeRow('task-2', 'Tarefa 2')])
+        for method in (insert, delete, move, item):
+            method.assert_not_called()
+
+    def test_differences_are_applied(self):
+        """ Test that deleted, moved and changed rows are applied to the tree. """
+        self.tree.item('project-1', open=False)
+        self.sync.sync('', [TreeRow('project-2', 'Projeto 2 - Concluído',
+                                    ('projectname', 'concluded')),
+                            TreeRow('project-1', 'Projeto 1', ('projectname',), True),
+                            TreeRow('project-3', 'Projeto 3', ('projectname',), True)])
+        self.sync.sync('project-1', [TreeRow('task-2', 'Tarefa 2')])
+
+        self.assertEqual(self.tree.get_children(), ('project-2', 'project-1', 'project-3'))
+        self.assertEqual(self.tree.get_children('project-1'), ('task-2',))
+        self.assertFalse(self.tree.exists('task-1'))
+        self.assertEqual(self.tree.item('project-2', 'text'), 'Projeto 2 - Concluído')
+        self.assertFalse(self.tree.item('project-1', 'open'))
+
+        self.sync.sync('', [TreeRow('project-3', 'Projeto 3', ('projectname',), True)])
+        self.assertFalse(self.tree.exists('task-3'))
+        self.assertNotIn('task-3', self.sync)
+        self.assertEqual(self.sync.children(), ['project-3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from types import SimpleNamespace
+from src.logic.items.item_collection import ItemCollection
+
+class TestItemCollection(unittest.TestCase):
+    def setUp(self):
+        self.first = SimpleNamespace(name='A')
+        self.second = SimpleNamespace(name='B')
+        self.third = SimpleNamespace(name='C')
+        self.collection = ItemCollection([self.first, self.second, self.third])
+
+    def test_newest_first(self):
+        self.assertEqual(list(self.collection), [self.third, self.second, self.first])
+        self.assertEqual(self.collection, [self.third, self.second, self.first])
+        self.assertIs(self.collection[0], self.third)
+        self.assertIs(self.collection[-1], self.first)
+        self.assertEqual(self.collection[:], [self.third, self.second, self.first])
+        self.assertEqual(list(reversed(self.collection)), [self.first, self.second, self.third])
+
+    def test_add_and_remove(self):
+        self.collection.remove(self.second)
+        self.assertNotIn(self.second, self.collection)
+        self.assertEqual(len(self.collection), 2)
+        self.assertIs(self.collection[1], self.first)
+
+        self.collection.add(self.second)
+        self.assertIs(self.collection[0], self.second)
+        with self.assertRaises(ValueError):
+            self.collection.remove(SimpleNamespace(name='A'))
+
+    def test_names_follow_changes(self):
+        self.assertIs(self.collection.names.get('B'), self.second)
+        self.collection.remove(self.second)
+        self.assertNotIn('B', self.collection.names)
+        fourth = SimpleNamespace(name='A')
+        self.collection.add(fourth)
+        self.assertIs(self.collection.names.get('A'), fourth)
+
+    def test_empty(self):
+        empty = ItemCollection()
+        self.assertEqual(empty, [])
+        self.assertEqual(len(empty), 0)
+        self.assertNotIn(self.first, empty)
+        self.assertEqual(ItemCollection(), [])
+
+    def test_single_item(self):
+        single = ItemCollection([self.first])
+        single.add(self.first)
+        self.assertEqual(single, [self.first])
+        self.assertIs(single[0], self.first)
+        with self.assertRaises(ValueError):
+            single.remove(self.second)
+        single.add(self.second)
+        self.assertEqual(single, [self.second, self.first])
+
+        single = ItemCollection([self.first])
+        single.remove(self.first)
+        self.assertEqual(len(single), 0)
+        with self.assertRaises(ValueError):
+            single.remove(self.first)
+
+
+if __name__ == "__main__":
+    unittest.main()
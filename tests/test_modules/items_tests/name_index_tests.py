@@ -0,0 +1,69 @@
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task, ItemFactory, ItemNameAlreadyExists
+from src.logic.items.name_index import NameIndex
+from src.logic.filter.filter import Filter
+from src.logic.orms.orm import Base, UserORM
+
+class TestNameIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(cls.engine)
+        cls.session = sessionmaker(bind=cls.engine)()
+
+        db_test_user = UserORM(name='Index User', email='index@example.com', password='teste')
+        cls.session.add(db_test_user)
+        cls.session.commit()
+
+        cls.test_user = User(name=db_test_user.name, id_user=db_test_user.id_user, session=cls.session)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
+    def test_duplicated_names(self):
+        first = SimpleNamespace(name='A')
+        second = SimpleNamespace(name='A')
+        index = NameIndex([first, second])
+
+        self.assertIs(index.get('A'), second)
+        index.remove(second)
+        self.assertIs(index.get('A'), first)
+        index.remove(first)
+        self.assertNotIn('A', index)
+        self.assertEqual(len(index), 0)
+
+    def test_renames_update_the_index(self):
+        project = ItemFactory.create_item('project', user=self.test_user, name='Indexed Project')
+        task = ItemFactory.create_item('task', project=project, name='Indexed Task')
+
+        self.assertIs(Filter(self.test_user).filter_project_by_name('Indexed Project'), project)
+        project.update(name='Renamed Project')
+        task.update(name='Renamed Task')
+        self.assertNotIn('Indexed Project', self.test_user.project_names)
+        self.assertIs(self.test_user.project_names.get('Renamed Project'), project)
+        self.assertIs(project.task_names.get('Renamed Task'), task)
+
+        task.restore_from_memento()
+        self.assertIs(project.task_names.get('Indexed Task'), task)
+        self.assertNotIn('Renamed Task', project.task_names)
+
+        task.delete()
+        self.assertNotIn('Indexed Task', project.task_names)
+
+    def test_factory_rejects_taken_names(self):
+        project = Project(user=self.test_user, name='Taken', creation_date=date.today())
+        Task(project=project, name='Taken Task')
+
+        with self.assertRaises(ItemNameAlreadyExists):
+            ItemFactory.create_item('project', user=self.test_user, name='Taken')
+        with self.assertRaises(ItemNameAlreadyExists):
+            ItemFactory.create_item('task', project=project, name='Taken Task')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -170,6 +170,17 @@ class TestTask(unittest.TestCase):
         restored_task = self.session.query(TaskORM).filter(TaskORM.id_task == self.test_task.id_task).first()
         self.assertEqual(restored_task.name, "Updated Name")
 
+    def test_compact_layout(self):
+        self.assertFalse(hasattr(self.test_task, '__dict__'))
+        self.assertFalse(hasattr(self.test_subtask, '__dict__'))
+        self.assertIsNone(self.test_task._memento_stack)
+        self.assertFalse(self.test_task.has_memento())
+
+        self.test_task.conclusion()
+        self.assertEqual(len(self.test_task._memento_stack), 1)
+        self.test_task.restore_from_memento()
+        self.assertFalse(self.test_task.has_memento())
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task
+from src.logic.orms.orm import Base, UserORM, TaskORM
+
+class TestUndoManager(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        db_test_user = UserORM(name='Undo User', email='undo@example.com', password='teste')
+        self.session.add(db_test_user)
+        self.session.commit()
+
+        self.user = User(name=db_test_user.name, id_user=db_test_user.id_user, session=self.session)
+        self.project = Project(user=self.user, name='Undo Project', creation_date=date.today())
+        self.first = Task(project=self.project, name='First')
+        self.second = Task(project=self.project, name='Second')
+        self.undo_manager = self.user.undo_manager
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_only_changed_fields_are_saved(self):
+        self.first.conclusion()
+        self.assertEqual(set(self.first._memento_stack[0].get_state()), {'status', 'conclusion_date'})
+
+        self.first.update(name='First', description='Nova descrição')
+        self.assertEqual(self.first._memento_stack[1].get_state(), {'description': None})
+
+        self.second.update(name='Second')
+        self.assertFalse(self.second.has_memento())
+        self.assertEqual(len(self.undo_manager), 2)
+
+    def test_history_is_bounded(self):
+        self.undo_manager.depth = 2
+        for index in range(3):
+            self.first.update(name=f'First {index}')
+
+        self.assertEqual(len(self.undo_manager), 2)
+        self.assertEqual(len(self.first._memento_stack), 2)
+        self.assertTrue(self.undo_manager.undo())
+        self.assertTrue(self.undo_manager.undo())
+        self.assertEqual(self.first.name, 'First 0')
+        self.assertFalse(self.undo_manager.undo())
+        self.assertIsNone(self.first._memento_stack)
+
+    def test_group_is_undone_in_one_transaction(self):
+        with self.undo_manager.group():
+            self.first.conclusion()
+            self.second.update(name='Renamed')
+        self.assertEqual(len(self.undo_manager), 1)
+
+        commits = []
+        event.listen(self.session, 'after_commit', commits.append)
+        self.assertTrue(self.undo_manager.undo())
+
+        self.assertEqual(len(commits), 1)
+        self.assertFalse(self.first.status)
+        self.assertEqual(self.second.name, 'Second')
+        self.assertIs(self.project.task_names.get('Second'), self.second)
+        stored = self.session.query(TaskORM).filter(TaskORM.id_task == self.second.id_task).first()
+        self.assertEqual(stored.name, 'Second')
+
+    def test_item_restore_is_skipped_by_the_manager(self):
+        self.first.update(name='First 1')
+        self.second.update(name='Second 1')
+        self.second.restore_from_memento()
+
+        self.assertTrue(self.undo_manager.undo())
+        self.assertEqual(self.first.name, 'First')
+        self.assertEqual(self.second.name, 'Second')
+        self.assertFalse(self.undo_manager.can_undo())
+
+    def test_undo_the_last_step_of_an_item(self):
+        with self.undo_manager.group():
+            self.first.conclusion()
+            self.second.conclusion()
+        self.project.update(name='Undo Project 1')
+
+        self.assertTrue(self.undo_manager.undo(self.second))
+        self.assertFalse(self.first.status)
+        self.assertFalse(self.second.status)
+        self.assertEqual(self.project.name, 'Undo Project 1')
+        self.assertFalse(self.undo_manager.undo(self.second))
+
+        with self.undo_manager.group():
+            self.first.conclusion()
+            self.second.conclusion()
+        self.first.update(name='First 1')
+        self.assertFalse(self.undo_manager.undo(self.second))
+        self.assertTrue(self.second.status)
+        self.assertTrue(self.undo_manager.undo(self.first))
+        self.assertTrue(self.undo_manager.undo(self.second))
+        self.assertEqual(self.first.name, 'First')
+        self.assertFalse(self.first.status)
+        self.assertEqual(len(self.undo_manager), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,15 @@
+import os
+import tempfile
 import unittest
 import json
 from unittest.mock import patch, Mock, mock_open
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.db.repository import Repository
+from src.db.unit_of_work import UnitOfWork
+from src.logic.orms.orm import Base, UserORM, ProjectORM, TaskORM, SubtaskORM
 from src.logic.load import Load
+from datetime import date
 from src.logic.users.user import User
 from src.logic.items.project import Project
 from src.logic.execeptions.exceptions_items import ItemNameBlank,\
@@ -42,7 +50,7 @@ class TestLoad(unittest.TestCase):
         self.valid_file_path = 'tests/test_modules/load_tests/valid.json'
         self.invalid_file_path = 'tests/test_modules/load_tests/invalid.txt'
         self.nonexistent_file_path = 'nonexistent.json'
-        self.user = User('Usuário Exemplo') 
+        self.user = User('Usuário Exemplo', id_user=1)
         self.valid_data = [
             {
                 "project": "Projeto 1",
@@ -140,3 +148,138 @@ class TestLoad(unittest.TestCase):
             Load.check_project_name_blank(data_with_blank_name)
 
 
+class TestBulkImport(unittest.TestCase):
+    """
+    Test suite for the bulk import of Load.json_reader, on a temporary SQLite database.
+    """
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        handle, self.file_path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.unit_of_work = UnitOfWork(session_factory=self.session_factory)
+
+        with self.session_factory() as session:
+            db_user = UserORM(name='Test User', email='test@example.com', password='teste')
+            session.add(db_user)
+            session.commit()
+            id_user = db_user.id_user
+
+        self.user = User('Test User', id_user=id_user, unit_of_work=self.unit_of_work)
+        self.data = [{"project": f"Projeto {project}",
+                      "end_date": "2023-01-01",
+                      "description": "Descrição",
+                      "tasks": [{"task": f"Tarefa {task}",
+                                 "priority": "Urgente",
+                                 "end_date": "10/01/2023",
+                                 "notification_date": None,
+                                 "description": None,
+                                 "subtasks": [{"subtask": "Subtarefa 1"},
+                                              {"subtask": "Subtarefa 2"}]}
+                                for task in range(3)]}
+                     for project in range(2)]
+        self.statements = []
+
+    def tearDown(self):
+        self.unit_of_work.close()
+        self.engine.dispose()
+        os.remove(self.db_path)
+        os.remove(self.file_path)
+
+    # pylint: disable=unused-argument,too-many-arguments
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        """ Records every statement sent to the database. """
+        self.statements.append(statement)
+
+    def write_file(self):
+        """ Writes self.data to the JSON file to import. """
+        with open(self.file_path, 'w', encoding='utf8') as json_file:
+            json.dump(self.data, json_file)
+
+    def count_rows(self, orm):
+        """ Counts the rows of a table with a fresh session. """
+        with self.session_factory() as session:
+            return session.query(orm).count()
+
+    def test_bulk_import_inserts_one_batch_per_level(self):
+        """ Projects, tasks and subtasks are inserted with three statements. """
+        self.write_file()
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+        Load.json_reader(self.user, self.file_path)
+        event.remove(self.engine, 'before_cursor_execute', self.count_statement)
+
+        self.assertEqual(len([st for st in self.statements if st.startswith('INSERT')]), 3)
+        self.assertEqual(self.count_rows(ProjectORM), 2)
+        self.assertEqual(self.count_rows(TaskORM), 6)
+        self.assertEqual(self.count_rows(SubtaskORM), 12)
+
+    def test_bulk_import_wires_objects_to_returned_ids(self):
+        """ The in-memory items carry the ids of their rows. """
+        self.write_file()
+        Load.json_reader(self.user, self.file_path)
+
+        self.assertEqual([project.name for project in self.user.projects],
+                         ['Projeto 1', 'Projeto 0'])
+        with self.session_factory() as session:
+            for project in self.user.projects:
+                self.assertEqual(session.get(ProjectORM, project.id_project).name, project.name)
+                for task in project.tasks:
+                    db_task = session.get(TaskORM, task.id_task)
+                    self.assertEqual(db_task.id_project, project.id_project)
+                    self.assertEqual(db_task.name, task.name)
+                    for subtask in task.subtasks:
+                        db_subtask = session.get(SubtaskORM, subtask.id_subtask)
+                        self.assertEqual(db_subtask.id_task, task.id_task)
+                        self.assertEqual(db_subtask.name, subtask.name)
+
+    def test_invalid_document_writes_nothing(self):
+        """ A repeated subtask name is rejected before any insert. """
+        self.data[1]['tasks'][2]['subtasks'][1]['subtask'] = 'Subtarefa 1'
+        self.write_file()
+
+        with self.assertRaises(ItemNameAlreadyExists):
+            Load.json_reader(self.user, self.file_path)
+        self.assertEqual(self.count_rows(ProjectORM), 0)
+        self.assertEqual(self.user.projects, [])
+
+    def test_failed_insert_rolls_back(self):
+        """ An error while inserting leaves the database and the user untouched. """
+        self.write_file()
+        insert_many = Repository.insert_many
+
+        def failing_insert_many(repository, model, rows, key):
+            if model is SubtaskORM:
+                raise RuntimeError('falha')
+            return insert_many(repository, model, rows, key)
+
+        with patch.object(Repository, 'insert_many', failing_insert_many):
+            with self.assertRaises(RuntimeError):
+                Load.json_reader(self.user, self.file_path)
+        self.assertEqual(self.count_rows(ProjectORM), 0)
+        self.assertEqual(self.count_rows(TaskORM), 0)
+        self.assertEqual(self.user.projects, [])
+
+    def test_insert_many_without_returning(self):
+        """ Dialects without RETURNING read the ids back with a SELECT of the keys. """
+        with self.session_factory() as session:
+            dialect = session.get_bind().dialect
+            with patch.object(dialect, 'insert_executemany_returning', False):
+                ids = Repository(session).insert_many(ProjectORM, [
+                    {'id_user': self.user.id_user, 'name': name, 'status': False,
+                     'creation_date': date(2023, 1, 1)} for name in ('B', 'A')],
+                    key=('id_user', 'name'))
+            session.commit()
+            self.assertEqual([session.get(ProjectORM, id_project).name for id_project in ids],
+                             ['B', 'A'])
+
+    def test_item_by_item_import(self):
+        """ The former, item by item, import path is still available. """
+        self.write_file()
+        Load.json_reader(self.user, self.file_path, bulk=False)
+
+        self.assertEqual(self.count_rows(SubtaskORM), 12)
+        self.assertEqual(len(self.user.projects), 2)
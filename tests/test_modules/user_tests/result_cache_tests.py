@@ -0,0 +1,129 @@
+"""
+Module providing unit tests for the result cache of `src.logic.users.result_cache`.
+
+Test Cases:
+    - test_lru_and_counters: Test the LRU eviction, the size bound, the counters and
+the version bumped by the change events.
+    - test_filter_results_follow_changes: Test that the filters are read from the cache
+until an item changes.
+    - test_loading_deferred_tasks_bumps_the_version: Test that a result computed before
+the tasks of a deferred project were loaded is computed again.
+    - test_dashboard_is_drawn_again_without_queries: Test that drawing the dashboard
+again with unchanged data queries nothing, and that a change is seen.
+"""
+
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src import User, Project, Task
+from src.db.unit_of_work import UnitOfWork
+from src.logic.authentication.hydration import hydrate_user
+from src.logic.dashboard.sql_dashboard_data import SqlDashboardData
+from src.logic.events.event_bus import EventBus, Updated
+from src.logic.filter.filter import Filter
+from src.logic.orms.orm import Base, UserORM
+from src.logic.users.result_cache import ResultCache
+
+GETTERS = ['get_number_of_tasks', 'get_number_of_done_tasks', 'get_number_of_late_tasks',
+           'get_next_deadlines', 'get_finished_by_weekday']
+
+
+class TestResultCache(unittest.TestCase):
+    """ Test the ResultCache class
+
+    Args:
+        unittest (unittest.TestCase): TestCase
+    """
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.db_user = UserORM(name='Cache User', email='cache@example.com', password='pwd')
+        self.session.add(self.db_user)
+        self.session.commit()
+        self.user = User(name=self.db_user.name, id_user=self.db_user.id_user,
+                         session=self.session)
+        self.project = Project(user=self.user, name='Projeto', creation_date=date.today())
+        self.task = Task(project=self.project, name='Tarefa', end_date=date(2023, 1, 1))
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_lru_and_counters(self) -> None:
+        """ Test the eviction, the counters and the version
+        """
+        events = EventBus()
+        cache = ResultCache(events, size=2)
+        computed = []
+
+        def compute(key):
+            return lambda: computed.append(key) or key
+
+        for key in ['a', 'b', 'a', 'c', 'a', 'b']:
+            cache.get(key, compute(key))
+        self.assertEqual(computed, ['a', 'b', 'c', 'b'])
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 4, 2))
+
+        events.publish(Updated(self.task, ('name',)))
+        self.assertEqual(cache.version, 1)
+        cache.get('a', compute('a'))
+        self.assertEqual(computed[-1], 'a')
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_filter_results_follow_changes(self) -> None:
+        """ Test the filters through the cache
+        """
+        filter_ = Filter(self.user)
+        cache = self.user.views.result_cache
+        pending = filter_.filter_tasks_by_status(self.user.projects, False)
+        pending.clear()
+        self.assertEqual(filter_.filter_tasks_by_status(self.user.projects, False), [self.task])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        self.task.conclusion()
+        self.assertEqual(filter_.filter_tasks_by_status(self.user.projects, False), [])
+        other = Project(user=self.user, name='Outro', creation_date=date.today())
+        self.assertEqual(filter_.filter_projects_by_status(False), [other, self.project])
+        self.assertEqual(cache.misses, 3)
+
+    def test_loading_deferred_tasks_bumps_the_version(self) -> None:
+        """ Test that loading deferred tasks is seen by the cache
+        """
+        self.session.refresh(self.db_user)
+        user = hydrate_user(self.db_user, self.session, UnitOfWork(session=self.session),
+                            lazy=True)
+        cache = user.views.result_cache
+
+        def loaded_tasks():
+            return [task.name for project in user.projects
+                    if project.deferred_tasks is None for task in project.tasks]
+
+        self.assertEqual(cache.get('loaded', loaded_tasks), [])
+        self.assertEqual(len(user.project_names.get('Projeto').tasks), 1)
+        self.assertEqual(cache.get('loaded', loaded_tasks), ['Tarefa'])
+        self.assertEqual(cache.get('loaded', loaded_tasks), ['Tarefa'])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_dashboard_is_drawn_again_without_queries(self) -> None:
+        """ Test the dashboard through the cache
+        """
+        dashboard = SqlDashboardData(self.user)
+        first = [getattr(dashboard, getter)() for getter in GETTERS]
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+
+        dashboard.update_data('Projeto')
+        dashboard.update_data('Todos')
+        self.assertEqual([getattr(dashboard, getter)() for getter in GETTERS], first)
+        self.assertEqual(statements, [])
+
+        self.task.conclusion()
+        self.assertEqual(dashboard.get_number_of_done_tasks(), 1)
+        self.assertEqual(dashboard.get_number_of_late_tasks(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
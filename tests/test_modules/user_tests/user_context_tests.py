@@ -0,0 +1,116 @@
+"""
+This module contains unit tests for the UserContext and UserContexts classes, implemented
+in `src.logic.users.user_context`.
+
+The tests open several users in one process, on one engine backed by a temporary SQLite
+file, and check that their object graphs and per-user state stay isolated.
+
+Classes:
+- TestUserContext: Contains test cases for the contexts of several users.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.logic.orms.orm import Base, UserORM, ProjectORM, TaskORM
+from src.logic.users.user_context import UserContexts
+
+
+class TestUserContext(unittest.TestCase):
+    """
+    Test cases for the contexts of several users served by one process.
+    """
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.engine = create_engine(f'sqlite:///{self.path}')
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+        self.id_users = []
+        with self.session_factory() as session:
+            for index in range(2):
+                db_user = UserORM(name=f'User {index}', email=f'user{index}@example.com',
+                                  password='teste')
+                session.add(db_user)
+                session.flush()
+                db_project = ProjectORM(id_user=db_user.id_user, name='Projeto', status=False,
+                                        creation_date=date(2023, 1, 1))
+                session.add(db_project)
+                session.flush()
+                session.add(TaskORM(id_project=db_project.id_project, name='Tarefa',
+                                    status=False, creation_date=date(2023, 1, 2)))
+                self.id_users.append(db_user.id_user)
+            session.commit()
+
+        self.contexts = UserContexts(session_factory=self.session_factory, lazy=False)
+
+    def tearDown(self):
+        self.contexts.close_all()
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def open_concurrently(self):
+        """ Opens the context of every user, each one from its own thread. """
+        contexts = {}
+
+        def open_context(id_user):
+            contexts[id_user] = self.contexts.open(id_user)
+
+        threads = [threading.Thread(target=open_context, args=(id_user,))
+                   for id_user in self.id_users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [contexts[id_user] for id_user in self.id_users]
+
+    def test_contexts_are_isolated(self):
+        first, second = self.open_concurrently()
+
+        self.assertIsNot(first.user, second.user)
+        self.assertIsNot(first.identity_map, second.identity_map)
+        self.assertIsNot(first.undo_manager, second.undo_manager)
+        self.assertIsNot(first.history, second.history)
+        self.assertIsNot(first.unit_of_work, second.unit_of_work)
+
+        first_project = first.user.project_names.get('Projeto')
+        second_project = second.user.project_names.get('Projeto')
+        self.assertIsNot(first_project, second_project)
+        self.assertIsNone(second.identity_map.get_project(first_project.id_project))
+
+        first_project.tasks[0].conclusion()
+        self.assertEqual(len(first.undo_manager), 1)
+        self.assertEqual(len(second.undo_manager), 0)
+        self.assertFalse(second_project.tasks[0].status)
+
+        first.history.add_completed_task(first.user.projects)
+        second.history.add_completed_task(second.user.projects)
+        self.assertEqual(first.history.tasks_completed(), [first_project.tasks[0]])
+        self.assertEqual(second.history.tasks_completed(), [])
+
+    def test_contexts_share_the_engine(self):
+        first, second = self.open_concurrently()
+
+        self.assertIs(first.unit_of_work.session.get_bind(), self.engine)
+        self.assertIs(second.unit_of_work.session.get_bind(), self.engine)
+
+    def test_registry(self):
+        context = self.contexts.open(self.id_users[0])
+
+        self.assertIs(self.contexts.open(self.id_users[0]), context)
+        self.assertIn(self.id_users[0], self.contexts)
+        self.assertIsNone(self.contexts.open(999))
+        self.assertEqual(len(self.contexts), 1)
+
+        self.contexts.close(self.id_users[0])
+        self.assertIsNone(self.contexts.get(self.id_users[0]))
+        self.assertIsNot(self.contexts.open(self.id_users[0]), context)
+
+
+if __name__ == "__main__":
+    unittest.main()
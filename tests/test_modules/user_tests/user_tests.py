@@ -32,6 +32,22 @@ class UserTask(unittest.TestCase):
     def tearDown(self):
         self.session.close()
 
+    def test_identity_map(self):
+        project = Project(user=self.test_user, name="Mapped Project", session=self.session)
+        task = Task(project=project, name="Mapped Task")
+        subtask = Subtask(task=task, name="Mapped Subtask")
+        identity_map = self.test_user.identity_map
+
+        self.assertIs(identity_map.get_project(project.id_project), project)
+        self.assertIs(identity_map.get_task(task.id_task), task)
+        self.assertIs(identity_map.get_subtask(subtask.id_subtask), subtask)
+
+        task.delete()
+        self.assertIsNone(identity_map.get_task(task.id_task))
+        self.assertIsNone(identity_map.get_subtask(subtask.id_subtask))
+        project.delete()
+        self.assertIsNone(identity_map.get_project(project.id_project))
+
     def test_initialization(self):
         self.assertEqual(self.test_user.name, "Test User")
         self.assertEqual(self.test_user.labels, [])
@@ -86,14 +102,30 @@ class UserTask(unittest.TestCase):
         self.test_user.remove_project(mock_project1)
         self.test_user.remove_project(mock_project2)
 
-    def test_singleton_instance(self):
-        User._instance = None
+    def test_users_are_independent(self):
         user1 = User(name = "Primeiro Usuário", id_user=2, session=self.session)
         user2 = User(name = "Segundo Usuário", id_user=3, session=self.session)
 
-        self.assertIs(user1, user2)
-        self.assertEqual(user1.name, user2.name)
+        self.assertIsNot(user1, user2)
+        self.assertEqual(user1.name, "Primeiro Usuário")
+        self.assertEqual(user2.name, "Segundo Usuário")
+        self.assertIsNot(user1.identity_map, user2.identity_map)
+        self.assertIsNot(user1.history, user2.history)
+        Project(user = user1, name = "Projeto", session=self.session)
+        self.assertEqual(user2.projects, [])
+
+    def test_views_are_built_on_first_use(self):
+        user1 = User(name = "Primeiro Usuário", id_user=2, session=self.session)
+        user2 = User(name = "Segundo Usuário", id_user=3, session=self.session)
 
+        self.assertFalse(user1.views.built('search_index'))
+        index = user1.views.search_index
+        self.assertIs(user1.views.get('search_index'), index)
+        self.assertTrue(user1.views.built('search_index'))
+        self.assertFalse(user2.views.built('search_index'))
+        self.assertIsNot(user2.views.result_cache, user1.views.result_cache)
+        with self.assertRaises(AttributeError):
+            user1.views.unknown_view
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file